@@ -0,0 +1,212 @@
+"""
+Load Test for the Solver Service.
+
+Plays many games at once against the solver service, each over its own connection, and reports the throughput
+and the latency of each operation. By default the service is started in this process on a free port; pass
+--port to test a service started separately with `python -m service`.
+
+Run from the repository root, e.g. `python devel/load_test.py --games 4000 --concurrency 2000`.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+)
+
+from common import get_lexicon, score_guess  # noqa: E402
+from service import HOST, SessionStore, SolverService  # noqa: E402
+from service.session_store import MEMORY_CAP  # noqa: E402
+import numpy as np  # noqa: E402
+
+# file: devel/load_test.py
+
+
+def raise_file_limit() -> None:
+    """Raise the limit of open files to its maximum, as every connection needs one, or two in process."""
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+async def play_games(
+    host: str,
+    port: int,
+    secrets: list[str],
+    bot: str | None,
+    latencies: dict[str, list[float]],
+    turns: list[int],
+) -> None:
+    """
+    Play games over one connection, one after the other, until there are no secrets left.
+
+    Parameters
+    ----------
+    host : str
+        The address of the service.
+    port : int
+        The port of the service.
+    secrets : list[str]
+        The secrets of the games left to play, shared by the connections.
+    bot : str | None
+        The class name of the bot to play, or None for the service's default.
+    latencies : dict[str, list[float]]
+        The latencies of the requests, in seconds, to append to by operation.
+    turns : list[int]
+        The number of turns of each game, to append to, negative for a game lost.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def request(**fields) -> dict:
+        start = time.perf_counter()
+        writer.write(json.dumps(fields).encode() + b"\n")
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.setdefault(fields["op"], []).append(time.perf_counter() - start)
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        return response
+
+    try:
+        while secrets:
+            secret = secrets.pop()
+            fields = {} if bot is None else {"bot": bot}
+            session = (await request(op="start", **fields))["session"]
+            over, turn, guess = False, 0, ""
+            while not over:
+                guess = (await request(op="suggest", session=session))["guess"]
+                result = "".join(str(d) for d in score_guess(guess, secret))
+                over = (
+                    await request(
+                        op="result", session=session, guess=guess, result=result
+                    )
+                )["over"]
+                turn += 1
+            turns.append(turn if guess == secret else -turn)
+            await request(op="end", session=session)
+    finally:
+        writer.close()
+
+
+async def load_test(args: argparse.Namespace) -> None:
+    """
+    Run the load test and print its report.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The command-line arguments.
+    """
+    service, server = None, None
+    port = args.port
+    if port is None:
+        store = SessionStore(args.store, args.memory)
+        service = SolverService(args.workers, store=store)
+        server = await service.start_server(HOST, 0)
+        port = server.sockets[0].getsockname()[1]
+    words = get_lexicon().words
+    secrets = random.Random(args.seed).choices(words, k=args.games)
+    latencies: dict[str, list[float]] = {}
+    turns: list[int] = []
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                play_games(args.host, port, secrets, args.bot, latencies, turns)
+                for _ in range(min(args.concurrency, args.games))
+            )
+        )
+        stats = None if service is None else service.store.get_stats()
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+        if service is not None:
+            service.close()
+    elapsed = time.perf_counter() - start
+    print_report(min(args.concurrency, args.games), elapsed, latencies, turns, stats)
+
+
+def print_report(
+    connections: int,
+    elapsed: float,
+    latencies: dict[str, list[float]],
+    turns: list[int],
+    stats: dict | None,
+) -> None:
+    """
+    Print the report of a load test.
+
+    Parameters
+    ----------
+    connections : int
+        The number of connections the games were played over.
+    elapsed : float
+        The duration of the test in seconds.
+    latencies : dict[str, list[float]]
+        The latency of each request in seconds, by operation.
+    turns : list[int]
+        The number of turns of each game, negated for games lost.
+    stats : dict | None
+        The statistics of the store of a service started by the test, or None.
+    """
+    requests = sum(len(times) for times in latencies.values())
+    wins = [turn for turn in turns if turn > 0]
+    print(f"{len(turns)} games over {connections} connections in {elapsed:.2f}s")
+    print(
+        f"{len(wins)} wins, {np.mean(wins) if wins else 0:.3f} guesses per win, "
+        f"{requests / elapsed:.0f} requests/s"
+    )
+    if stats is not None:
+        print(
+            f"Store: {stats['evicted']} evicted, {stats['written']} written, "
+            f"{stats['resumed']} resumed, {stats['hits']} hits"
+        )
+    for op, times in latencies.items():
+        ms = np.array(times) * 1000
+        print(
+            f"\t{op:<8} {len(ms):>7} requests, p50 {np.percentile(ms, 50):.1f}ms, "
+            f"p95 {np.percentile(ms, 95):.1f}ms, p99 {np.percentile(ms, 99):.1f}ms, max {ms.max():.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the solver service")
+    parser.add_argument("--host", default=HOST, help="address of the service")
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=None,
+        help="port of the service, else one is started",
+    )
+    parser.add_argument("--games", type=int, default=2000, help="games to play")
+    parser.add_argument(
+        "--concurrency", type=int, default=2000, help="games played at once"
+    )
+    parser.add_argument("--bot", default=None, help="class name of the bot to play")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="threads of a service started here"
+    )
+    parser.add_argument(
+        "--store", default=":memory:", help="SQLite file of a service started here"
+    )
+    parser.add_argument(
+        "--memory",
+        type=int,
+        default=MEMORY_CAP,
+        help="bytes of sessions a service started here keeps in memory",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the secrets")
+    args = parser.parse_args()
+    raise_file_limit()
+    asyncio.run(load_test(args))
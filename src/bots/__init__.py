@@ -5,10 +5,16 @@ This module initializes the Wordle bot functionality.
 
 It imports the BotBehaviors class, which provides methods for generating guesses,
 and the BayesianBot class, which implements the bot's behavior in the game.
-It also includes the ExampleBot class for demonstration purposes.
+It also includes the EntropyBot class, which maximizes the information of each guess,
+the TreeBot class, which plays from a precomputed decision tree,
+the CompiledBot class, which replays the decision tree compiled from another bot,
+and the ExampleBot class for demonstration purposes.
 """
 
 from .bayesian_bot import BayesianBot
 from .bot_behaviors import BotBehaviors
+from .compiled_bot import CompiledBot
+from .entropy_bot import EntropyBot
 from .example_bot import ExampleBot
+from .tree_bot import TreeBot
 from .util import Filter
@@ -31,8 +31,13 @@ class BayesianBot(BotBehaviors):
         The word set of the 20 most common letters in English, as disjoint and legal Wordle words.
     GREEDY_MAX_TURNS : int
         The maximum number of turns the Greedy strategy will pbe played for, set to the size of the unique_words_set.
+    opening_book_turns : int
+        The bot has no opening book: its early guesses are the fixed words of unique_words_set, which take
+        microseconds, and the filtering of each turn happens in accept_result, which a book cannot skip.
     """
 
+    opening_book_turns: int = 0
+
     def __init__(self):
         """Initialize the BayesianBot instance with a predefined frequency list of letters."""
         # Initialize the parent class
@@ -76,17 +81,18 @@ class BayesianBot(BotBehaviors):
         str
             The first word from the candidate list with optimum frequency.
         """
+        # Narrow the candidates as bitsets, so each letter costs a single AND
+        possible: int = self.filter.to_bitset(self.possible_words)
+        selected: int = self.filter.to_bitset(candidates)
         for letter in frequency_list:
-            if self.filter.is_letter_possible(self.possible_words, letter):
-                filtered: list[str] = self.filter.filter_containing_letter(
-                    candidates, letter
-                )
-                if len(filtered) == 0:
-                    return candidates[0]
-                candidates = self.filter.filter_containing_letter(candidates, letter)
-        return candidates[
-            0
-        ]  # MyPy complains if this isn't here, even if it will never be executed
+            if self.filter.is_letter_possible(possible, letter):
+                filtered: int = self.filter.filter_containing_letter(selected, letter)
+                if filtered == 0:
+                    break
+                selected = filtered
+        # Return the first remaining candidate in the order of the candidate list
+        ids = self.lexicon.ids
+        return next(word for word in candidates if selected >> ids[word] & 1)
 
     def get_number_of_guesses(self) -> int:
         """
@@ -115,8 +121,8 @@ class BayesianBot(BotBehaviors):
         """
         Generate the next guess for the Wordle game based on previous guesses and results.
 
-        This method filters the list of possible words based on the last guess and its result,
-        and then selects the next guess based on letter frequency and uniqueness.
+        The list of possible words has already been narrowed by every result as it was accepted,
+        so this method selects the next guess based on letter frequency and uniqueness.
         Uniqueness is prioritized to avoid repeated letters in the guess.
 
         Parameters
@@ -128,9 +134,6 @@ class BayesianBot(BotBehaviors):
         str
             The next guess word for the bot, selected from the filtered list of possible words.
         """
-        self.possible_words = self.filter.filter_compatible_with_past_guesses(
-            self.possible_words, self.guesses
-        )
         num_possible: int = len(self.possible_words)
         if num_possible == 1:
             return self.possible_words[0]
@@ -7,8 +7,10 @@ It includes methods for generating guesses, accepting results, and managing the
 """
 
 from .util import Filter, GUESSES, RESULTS
-from common import RESULT, MSG
+from .opening_book import OpeningBook, get_opening_book_path
+from common import ALL_CORRECT, RESULT, MSG, Lexicon, Pattern
 import logging
+import numpy as np
 
 # file: bots/bot_behaviors.py
 
@@ -26,12 +28,27 @@ class BotBehaviors:
         A logger instance for logging bot events and errors.
     filter : Filter
         An instance of Filter to manage the word list and filtering.
+    lexicon : Lexicon
+        The shared word list and its lookup tables.
     guesses : dict
         A dictionary to store the bot's guesses and results.
     possible_words : list[str]
-        A list of possible words that the bot can guess from.
+        A list of possible words that the bot can guess from. It is narrowed by each result as it is
+        accepted, so it is always compatible with every past guess and result.
+    opening_book : OpeningBook | None
+        The cached guesses of the first turns, loaded or built on first use.
+    opening_book_turns : int
+        The number of turns after the first covered by the opening book, 0 to disable it.
+        The book assumes the bot's next guess only depends on its past guesses and their results,
+        so it is disabled by default, and deterministic bots opt in.
+    exact_filtering : bool
+        Whether the possible words are narrowed to exactly the words that give each result,
+        rather than with the lenient filter (see `Filter`).
     """
 
+    opening_book_turns: int = 0
+    exact_filtering: bool = False
+
     def __init__(self) -> None:
         """
         Initialize the BotBehaviors instance with default values.
@@ -39,8 +56,10 @@ class BotBehaviors:
         Sets up the logger, initializes the filter, and resets the guesses.
         """
         self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
-        self.filter = Filter()
+        self.filter = Filter(self.exact_filtering)
+        self.lexicon: Lexicon = self.filter.lexicon
         self.guesses: dict = {}
+        self.opening_book: OpeningBook | None = None
         self.reset()
 
     def reset(self) -> None:
@@ -79,23 +98,65 @@ class BotBehaviors:
         """
         ...
 
-    def generate_guess(self) -> str:
+    def generate_next_guess_by(self, deadline: float) -> str:
+        """
+        Code to generate the next guess by a deadline.
+
+        By default the deadline is ignored, which suits bots whose guesses are cheap. Bots that score many
+        guesses can override this method to score the most promising first, and return the best guess found
+        so far when the deadline passes.
+
+        Parameters
+        ----------
+        deadline : float
+            The `time.monotonic()` value by which the guess is needed.
+
+        Returns
+        -------
+        str
+            The next guess word for the bot.
+        """
+        return self.generate_next_guess()
+
+    def generate_guess(self, deadline: float | None = None) -> str:
         """
         Generate a guess for the bot based on the current state of guesses.
 
         If there are no previous guesses, it generates the first guess.
-        Otherwise, it generates the next guess based on the previous guesses and results.
+        Otherwise, it looks the next guess up in the opening book, or generates it based on
+        the previous guesses and results, by the deadline if there is one. With a deadline, the book
+        is only used if it is already loaded, as building it takes far longer than any deadline;
+        call prepare first to load it.
+
+        Parameters
+        ----------
+        deadline : float | None, optional
+            The `time.monotonic()` value by which the guess is needed, defaults to no deadline.
+            Past it, bots that support deadlines return the best guess found so far.
 
         Returns
         -------
         str
             The generated guess word for the bot.
+
+        Raises
+        ------
+        ValueError
+            If no word is left that gives every result so far, as happens when results contradict each other.
         """
         guess = ""
         if len(self.guesses[GUESSES]) == 0:
             guess = self.generate_first_guess()
         else:
-            guess = self.generate_next_guess()
+            if not self.possible_words:
+                raise ValueError(
+                    "No word gives every result so far, check the results entered"
+                )
+            guess = self.get_book_guess(build=deadline is None) or (
+                self.generate_next_guess()
+                if deadline is None
+                else self.generate_next_guess_by(deadline)
+            )
         self.guesses[GUESSES].append(guess)
         return guess
 
@@ -104,13 +165,14 @@ class BotBehaviors:
         Accept the result of a guess and updates the bot's state accordingly.
 
         This method processes the result of a guess, updates the guesses and results,
-        and logs the received result. If the result indicates a win or loss, it resets the bot's state.
+        and logs the received result. The newest guess and its result are applied to the possible words,
+        so each result is only filtered once. If the result indicates a win or loss, it resets the bot's state.
 
         Parameters
         ----------
         result : dict
             A dictionary containing the result of the guess, with keys RESULT and MSG.
-            RESULT is expected to be a list of numbers if the game is still ongoing, or None in a win/loss indication.
+            RESULT is expected to be a Pattern (or the equivalent list of numbers), or None if the guess was rejected.
             MSG can contain additional messages or information about the result.
 
         Returns
@@ -119,7 +181,194 @@ class BotBehaviors:
         """
         if result[RESULT] is None:
             return
+        if not isinstance(result[RESULT], Pattern):
+            result = {RESULT: Pattern.from_result(result), MSG: result[MSG]}
         self.guesses[RESULTS].append(result)
         if result[MSG] is not None:
             self.reset()
+        elif len(self.guesses[GUESSES]) > 0:
+            self.apply_result(self.guesses[GUESSES][-1], result)
         self.logger.info(f"Received: {result}")
+
+    def apply_result(self, guess: str, result: dict) -> None:
+        """
+        Narrow the possible words to those compatible with a guess and its result.
+
+        Subclasses keeping additional state derived from the results can override this method,
+        calling the parent method to keep the possible words up to date.
+
+        Parameters
+        ----------
+        guess : str
+            The guessed word.
+        result : dict
+            A dictionary containing the Pattern of the guess under the key RESULT.
+        """
+        self.possible_words = self.filter.filter_compatible_with_guess(
+            self.possible_words, guess, result
+        )
+
+    def save_state(self) -> dict:
+        """
+        Take a snapshot of the bot's state, to be restored with restore_state.
+
+        Returns
+        -------
+        dict
+            The past guesses and results, and the possible words.
+        """
+        return {
+            GUESSES: list(self.guesses[GUESSES]),
+            RESULTS: list(self.guesses[RESULTS]),
+            "possible_words": self.possible_words,
+        }
+
+    def restore_state(self, state: dict) -> None:
+        """
+        Restore a snapshot of the bot's state taken with save_state.
+
+        Parameters
+        ----------
+        state : dict
+            The snapshot to restore.
+        """
+        self.guesses = {GUESSES: list(state[GUESSES]), RESULTS: list(state[RESULTS])}
+        self.possible_words = state["possible_words"]
+
+    def get_config(self) -> dict:
+        """
+        Get the settings that determine the bot's guesses, which key its opening book.
+
+        By default, these are the instance attributes holding numbers, strings, or lists of them,
+        other than the possible words.
+
+        Returns
+        -------
+        dict
+            The settings, by attribute name.
+        """
+        simple = (str, int, float, bool)
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if name != "possible_words"
+            and (
+                isinstance(value, simple)
+                or (
+                    isinstance(value, (list, tuple))
+                    and all(isinstance(v, simple) for v in value)
+                )
+            )
+        }
+
+    def get_opening_book(self) -> OpeningBook:
+        """
+        Get the opening book, loading it from disk, or building and saving it if necessary.
+
+        Returns
+        -------
+        OpeningBook
+            The opening book.
+        """
+        if self.opening_book is None:
+            config = {
+                **self.get_config(),
+                "opening_book_turns": self.opening_book_turns,
+                "exact_filtering": self.exact_filtering,
+            }
+            path = get_opening_book_path(type(self), config, self.lexicon)
+            self.opening_book = OpeningBook.load(path)
+            if self.opening_book is None:
+                self.opening_book = self.build_opening_book(path)
+                self.opening_book.save()
+        return self.opening_book
+
+    def prepare(self) -> None:
+        """
+        Load or build everything the bot caches on disk, such as its opening book.
+
+        Call this before playing copies of the bot in other threads or processes,
+        so that they load the caches rather than each building them.
+        """
+        if self.opening_book_turns > 0:
+            self.get_opening_book()
+
+    def get_book_guess(self, build: bool = True) -> str | None:
+        """
+        Look the next guess up in the opening book.
+
+        Parameters
+        ----------
+        build : bool, optional
+            Whether to load or build the book if it is not loaded yet, defaults to True.
+
+        Returns
+        -------
+        str | None
+            The next guess, or None if the opening book is disabled, not loaded when it may not be built,
+            or does not cover the game so far.
+        """
+        guesses = self.guesses[GUESSES]
+        results = self.guesses.get(RESULTS, [])
+        # The book only covers games where every guess has its result
+        if (
+            len(results) != len(guesses)
+            or not 0 < len(guesses) <= self.opening_book_turns
+            or (not build and self.opening_book is None)
+        ):
+            return None
+        return self.get_opening_book().get(guesses, results)
+
+    def build_opening_book(self, path: str) -> OpeningBook:
+        """
+        Build the opening book by playing out every result the first turns can have.
+
+        The bot's state is saved and restored around the build, so it can be built in the middle of a game.
+
+        Parameters
+        ----------
+        path : str
+            The location to save the book to.
+
+        Returns
+        -------
+        OpeningBook
+            The opening book, before it is saved.
+        """
+        self.logger.info(f"Building opening book {path}")
+        state = self.save_state()
+        self.reset()
+        entries: dict[str, str] = {}
+        self.guesses[GUESSES].append(self.generate_first_guess())
+        self.explore_opening(np.arange(len(self.lexicon)), entries)
+        self.restore_state(state)
+        return OpeningBook(path, self.opening_book_turns, entries)
+
+    def explore_opening(self, secret_ids: np.ndarray, entries: dict[str, str]) -> None:
+        """
+        Record the next guess for every result of the last guess, and explore further turns.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ids of the secrets consistent with the game so far.
+        entries : dict[str, str]
+            The book entries to add to.
+        """
+        guess = self.guesses[GUESSES][-1]
+        if not self.lexicon.is_valid_word(guess):
+            return
+        state = self.save_state()
+        for pattern, bucket in self.filter.partition(secret_ids, guess).items():
+            if pattern == ALL_CORRECT:
+                continue
+            self.restore_state(state)
+            self.accept_result({RESULT: pattern, MSG: None})
+            next_guess = self.generate_next_guess()
+            entries[
+                OpeningBook.get_key(self.guesses[GUESSES], self.guesses[RESULTS])
+            ] = next_guess
+            if len(self.guesses[GUESSES]) < self.opening_book_turns:
+                self.guesses[GUESSES].append(next_guess)
+                self.explore_opening(bucket, entries)
+        self.restore_state(state)
@@ -0,0 +1,193 @@
+"""
+Wordle Bot that replays another bot compiled into a strategy file.
+
+This module defines the compile_bot function, which plays a deterministic bot against every secret at once
+and records its guesses as a decision tree, and the CompiledBot class, which replays the tree.
+
+A deterministic bot's next guess only depends on its past guesses and their results, so its whole game tree
+can be computed once: the secrets are split by the feedback of each guess, and the bot's state is saved and
+restored to continue each group of secrets separately. The tree is saved in the same format as the strategies
+of the decision tree solver, so every guess of the compiled bot is a lookup, however costly the original bot.
+"""
+
+from common import ALL_CORRECT, RESULT, MSG
+from solver import Strategy, get_strategy_path
+from solver.strategy import Node
+from .bayesian_bot import BayesianBot
+from .bot_behaviors import BotBehaviors
+from .opening_book import get_code_hash, get_config_hash
+from .tree_bot import TreeBot
+from .util import GUESSES
+import numpy as np
+import os
+
+# file: bots/compiled_bot.py
+
+MAX_TURNS = 6
+
+
+def compile_bot(
+    bot: BotBehaviors, secret_ids: np.ndarray | None = None, turns: int = MAX_TURNS
+) -> Strategy:
+    """
+    Compile a deterministic bot into a strategy, by playing it against every secret at once.
+
+    The bot is asked for one guess per distinct game so far, for the given number of turns. Past the last turn,
+    the games the bot has not won are completed by guessing the first secret left, which is how a TreeBot plays
+    once it leaves its tree, so that every node keeps all the secrets consistent with its guesses.
+
+    Parameters
+    ----------
+    bot : BotBehaviors
+        The bot to compile. Its guesses must only depend on its past guesses and their results.
+    secret_ids : np.ndarray | None, optional
+        The ids of the secrets to compile the bot for, defaults to the whole word list.
+    turns : int, optional
+        The number of turns to record the bot's guesses for, defaults to the length of a game.
+
+    Returns
+    -------
+    Strategy
+        The bot's strategy.
+
+    Raises
+    ------
+    ValueError
+        If the bot guesses a word that is not in the word list.
+    """
+    if secret_ids is None:
+        secret_ids = np.arange(len(bot.lexicon))
+    bot.reset()
+    bot.guesses[GUESSES].append(bot.generate_first_guess())
+    root = compile_node(bot, secret_ids, turns)
+    bot.reset()
+    return Strategy.from_tree(root, bot.lexicon)
+
+
+def compile_node(bot: BotBehaviors, secret_ids: np.ndarray, turns: int) -> Node:
+    """
+    Compile the bot's last guess, and its guesses for each result of the last guess.
+
+    Parameters
+    ----------
+    bot : BotBehaviors
+        The bot, in the state shared by the secrets.
+    secret_ids : np.ndarray
+        The ids of the secrets consistent with the game so far.
+    turns : int
+        The number of turns to record the bot's guesses for.
+
+    Returns
+    -------
+    Node
+        The decision tree from the last guess.
+
+    Raises
+    ------
+    ValueError
+        If the bot guesses a word that is not in the word list.
+    """
+    guess = bot.guesses[GUESSES][-1]
+    guess_id = bot.lexicon.get_id(guess)
+    if guess_id is None:
+        raise ValueError(f"{bot.__class__.__name__} guessed {guess}, not a valid word")
+    if len(bot.guesses[GUESSES]) >= turns:
+        return complete_node(bot, guess_id, secret_ids)
+    buckets = bot.filter.partition(secret_ids, guess)
+    state = bot.save_state()
+    children: dict[int, Node] = {}
+    for pattern, bucket in buckets.items():
+        if pattern == ALL_CORRECT:
+            continue
+        bot.restore_state(state)
+        bot.accept_result({RESULT: pattern, MSG: None})
+        bot.guesses[GUESSES].append(bot.generate_next_guess())
+        children[int(pattern)] = compile_node(bot, bucket, turns)
+    bot.restore_state(state)
+    return (guess_id, ALL_CORRECT in buckets, children)
+
+
+def complete_node(bot: BotBehaviors, guess_id: int, secret_ids: np.ndarray) -> Node:
+    """
+    Complete the decision tree from a guess by guessing the first secret left after each result.
+
+    Parameters
+    ----------
+    bot : BotBehaviors
+        The bot, for its word list.
+    guess_id : int
+        The id of the guessed word.
+    secret_ids : np.ndarray
+        The ids of the secrets consistent with the game so far.
+
+    Returns
+    -------
+    Node
+        The decision tree from the guess.
+    """
+    buckets = bot.filter.partition(secret_ids, bot.lexicon.words[guess_id])
+    children: dict[int, Node] = {}
+    for pattern, bucket in buckets.items():
+        if pattern != ALL_CORRECT:
+            children[int(pattern)] = complete_node(bot, int(bucket.min()), bucket)
+    return (guess_id, ALL_CORRECT in buckets, children)
+
+
+def get_compiled_path(bot: BotBehaviors) -> str:
+    """
+    Get the location of the strategy compiled from a bot, keyed by its class, its code, its configuration and the word list.
+
+    Parameters
+    ----------
+    bot : BotBehaviors
+        The compiled bot.
+
+    Returns
+    -------
+    str
+        The location of the strategy file.
+    """
+    config_hash = get_config_hash(bot.get_config())
+    name = f"{bot.__class__.__name__}.{config_hash}.{get_code_hash(type(bot))}"
+    return get_strategy_path(name, bot.lexicon)
+
+
+class CompiledBot(TreeBot):
+    """
+    A class representing a Wordle bot that replays the strategy compiled from another bot.
+
+    It plays the same guesses as the compiled bot, looking each of them up in the strategy.
+
+    Attributes
+    ----------
+    bot : BotBehaviors
+        The compiled bot, only played when its strategy has to be compiled.
+    """
+
+    def __init__(self, bot: BotBehaviors | None = None, path: str | None = None):
+        """
+        Initialize the CompiledBot instance.
+
+        Parameters
+        ----------
+        bot : BotBehaviors | None, optional
+            The bot to replay, defaults to a BayesianBot.
+        path : str | None, optional
+            The location of the strategy file, defaults to one keyed by the bot's class and configuration.
+        """
+        self.bot: BotBehaviors = BayesianBot() if bot is None else bot
+        super().__init__(get_compiled_path(self.bot) if path is None else path)
+
+    def get_strategy(self) -> Strategy:
+        """
+        Get the strategy, compiling the bot and saving the strategy first if necessary.
+
+        Returns
+        -------
+        Strategy
+            The memory-mapped strategy.
+        """
+        if self.strategy is None and not os.path.exists(self.path):
+            self.logger.info(f"Compiling {self.bot.__class__.__name__} to {self.path}")
+            compile_bot(self.bot).save(self.path)
+        return super().get_strategy()
@@ -0,0 +1,212 @@
+"""
+Compiled Constraints for Filtering Word Lists.
+
+This module defines the Constraint class, which captures what a guess and its result say about the secret word
+as per-position sets of allowed letters and per-letter minimum and maximum counts.
+
+Constraints from several guesses combine into one, and whole sets of words are checked against it at once,
+with vectorized operations over their letter tables, or with a handful of AND and AND NOT operations over
+the bitsets of an inverted letter index.
+"""
+
+from common import (
+    CORRECT_LETTER,
+    INCORRECT_LETTER,
+    MISPLACED_LETTER,
+    Pattern,
+)
+from common.bitset_index import BitsetIndex
+from common.lexicon import MAX_LETTER_COUNT
+import numpy as np
+
+# file: bots/constraint.py
+
+ALL_LETTERS = (1 << 26) - 1
+
+
+class Constraint:
+    """
+    A set of conditions a word must meet to be compatible with one or more guesses.
+
+    Attributes
+    ----------
+    allowed : list[int]
+        For each position, a 26-bit mask of the letters allowed at that position.
+    min_counts : list[int]
+        For each letter, the minimum number of times it must occur in the word.
+    max_counts : list[int]
+        For each letter, the maximum number of times it may occur in the word.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a constraint that every word satisfies."""
+        self.allowed: list[int] = [ALL_LETTERS for _ in range(5)]
+        self.min_counts: list[int] = [0 for _ in range(26)]
+        self.max_counts: list[int] = [MAX_LETTER_COUNT for _ in range(26)]
+
+    @classmethod
+    def from_result(cls, guess: str, result: dict | Pattern) -> "Constraint":
+        """
+        Get the constraint implied by a guess and its result.
+
+        A correct letter fixes the letter at its position, and a misplaced letter excludes the letter
+        from its position and requires it elsewhere. An incorrect letter excludes the letter from the word,
+        unless it occurs more than once in the guess, in which case it is only excluded from its position.
+
+        Parameters
+        ----------
+        guess : str
+            The guessed word.
+        result : dict | Pattern
+            The Pattern of the guess, or a dictionary containing it under the key 'result'.
+
+        Returns
+        -------
+        Constraint
+            The constraint.
+        """
+        constraint = cls()
+        for i, (c, response) in enumerate(zip(guess, Pattern.from_result(result))):
+            letter = ord(c) - ord("A")
+            if response == CORRECT_LETTER:
+                constraint.allowed[i] = 1 << letter
+            elif response == MISPLACED_LETTER:
+                constraint.allowed[i] &= ~(1 << letter)
+                constraint.min_counts[letter] = max(constraint.min_counts[letter], 1)
+            elif response == INCORRECT_LETTER:
+                if guess.count(c) > 1:
+                    constraint.allowed[i] &= ~(1 << letter)
+                else:
+                    constraint.max_counts[letter] = 0
+        return constraint
+
+    def combine(self, other: "Constraint") -> "Constraint":
+        """
+        Combine two constraints into one that a word meets only if it meets both.
+
+        Parameters
+        ----------
+        other : Constraint
+            The constraint to combine with.
+
+        Returns
+        -------
+        Constraint
+            A new constraint.
+        """
+        constraint = Constraint()
+        constraint.allowed = [a & b for a, b in zip(self.allowed, other.allowed)]
+        constraint.min_counts = [
+            max(a, b) for a, b in zip(self.min_counts, other.min_counts)
+        ]
+        constraint.max_counts = [
+            min(a, b) for a, b in zip(self.max_counts, other.max_counts)
+        ]
+        return constraint
+
+    def get_mask(self, letters: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """
+        Check many words against the constraint at once.
+
+        Parameters
+        ----------
+        letters : np.ndarray
+            An `(M, 5)` array of letter indices, one row per word.
+        counts : np.ndarray
+            An `(M, 26)` array of letter counts, one row per word.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array that is True for the words that meet the constraint.
+        """
+        mask = np.ones(len(letters), dtype=bool)
+        for i, allowed in enumerate(self.allowed):
+            if allowed != ALL_LETTERS:
+                is_allowed = np.array(
+                    [(allowed >> letter) & 1 for letter in range(26)], bool
+                )
+                mask &= is_allowed[letters[:, i]]
+        for letter in range(26):
+            if self.min_counts[letter] > 0:
+                mask &= counts[:, letter] >= self.min_counts[letter]
+            if self.max_counts[letter] < MAX_LETTER_COUNT:
+                mask &= counts[:, letter] <= self.max_counts[letter]
+        return mask
+
+    def get_bitset(self, index: BitsetIndex, bitset: int) -> int:
+        """
+        Select the words of a bitset that meet the constraint, using an inverted letter index.
+
+        Parameters
+        ----------
+        index : BitsetIndex
+            The inverted letter index of the lexicon.
+        bitset : int
+            The set of candidate words.
+
+        Returns
+        -------
+        int
+            The set of candidate words that meet the constraint.
+        """
+        for i, allowed in enumerate(self.allowed):
+            if allowed != ALL_LETTERS:
+                bitset &= self.get_allowed_bitset(index, i, allowed)
+        return self.select_letter_counts(index, bitset)
+
+    def get_allowed_bitset(
+        self, index: BitsetIndex, position: int, allowed: int
+    ) -> int:
+        """
+        Get the words with one of the allowed letters at a position, with whichever of the union of
+        the allowed letters or the complement of the excluded ones takes fewer operations.
+
+        Parameters
+        ----------
+        index : BitsetIndex
+            The inverted letter index of the lexicon.
+        position : int
+            The position in the word.
+        allowed : int
+            The 26-bit mask of the letters allowed at the position.
+
+        Returns
+        -------
+        int
+            A bitset to AND the candidates with, which is negative when it is the complement of the excluded letters.
+        """
+        if allowed.bit_count() <= 13:
+            union = 0
+            for letter in range(26):
+                if allowed >> letter & 1:
+                    union |= index.at[position][letter]
+            return union
+        excluded = 0
+        for letter in range(26):
+            if not allowed >> letter & 1:
+                excluded |= index.at[position][letter]
+        return ~excluded
+
+    def select_letter_counts(self, index: BitsetIndex, bitset: int) -> int:
+        """
+        Select the words of a bitset whose letter counts meet the constraint.
+
+        Parameters
+        ----------
+        index : BitsetIndex
+            The inverted letter index of the lexicon.
+        bitset : int
+            The set of candidate words.
+
+        Returns
+        -------
+        int
+            The set of candidate words with the required letter counts.
+        """
+        for letter in range(26):
+            if self.min_counts[letter] > 0:
+                bitset &= index.at_least[self.min_counts[letter] - 1][letter]
+            if self.max_counts[letter] < MAX_LETTER_COUNT:
+                bitset &= ~index.at_least[self.max_counts[letter]][letter]
+        return bitset
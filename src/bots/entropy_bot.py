@@ -0,0 +1,239 @@
+"""
+Wordle Bot that maximizes the expected information of each guess.
+
+This module defines the EntropyBot class, which implements the behavior of a Wordle bot.
+
+It inherits from BotBehaviors and picks, from the whole word list, the guess whose feedback splits the
+remaining possible words most evenly, measured by the entropy of its feedback pattern histogram.
+The histograms of every guess are counted at once from the precomputed feedback matrix,
+split across threads on hosts with several cores.
+
+Given a deadline, the bot instead scores the guesses in blocks, from the most promising by a cheap letter
+frequency ranking, and picks the best guess scored when the deadline passes.
+"""
+
+from common import PATTERN_COUNT, PatternKernel, get_pattern_matrix
+from common.parallel import get_thread_count, map_blocks
+from .bot_behaviors import BotBehaviors
+import numpy as np
+import time
+
+# file: bots/entropy_bot.py
+
+ENTROPY_TOLERANCE = 1e-9
+# The elements of work of each thread's share of a block of guesses scored by a deadline, a few milliseconds each
+DEADLINE_BLOCK_ELEMENTS = 1 << 15
+DEADLINE_MIN_BLOCK = 16
+
+
+def get_entropies(histograms: np.ndarray) -> np.ndarray:
+    """
+    Compute the entropy of the feedback of each guess, in bits.
+
+    Parameters
+    ----------
+    histograms : np.ndarray
+        A `(G, PATTERN_COUNT)` array of the number of possible words in each feedback bucket of each guess.
+
+    Returns
+    -------
+    np.ndarray
+        A `(G,)` array of the expected information of each guess.
+    """
+    total = histograms[0].sum()
+    log_counts = np.log2(
+        histograms, out=np.zeros(histograms.shape), where=histograms > 0
+    )
+    return np.log2(total) - (histograms * log_counts).sum(axis=1) / total
+
+
+def get_letter_scores(presence: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Rank every word as a guess by the letter frequencies of the possible words, as a cheap stand-in for entropy.
+
+    Each letter is weighted by how evenly it splits the possible words, which is the number of possible words
+    containing it, or not containing it if fewer, so letters in every possible word or in none count for nothing.
+
+    Parameters
+    ----------
+    presence : np.ndarray
+        A `(N, 26)` boolean array of whether each word contains each letter.
+    candidates : np.ndarray
+        The ids of the possible words.
+
+    Returns
+    -------
+    np.ndarray
+        A `(N,)` array of the score of each word, the higher the more promising.
+    """
+    frequency = presence[candidates].sum(axis=0)
+    weights = np.minimum(frequency, len(candidates) - frequency)
+    return presence @ weights
+
+
+class EntropyBot(BotBehaviors):
+    """
+    A class representing a Wordle bot that guesses the word giving the most information about the secret.
+
+    Attributes
+    ----------
+    first_guess : str
+        The opening guess, which is the guess with the most information over the whole word list.
+    pattern_matrix : PatternKernel
+        The shared feedback matrix, used to count the feedback of every guess.
+    letter_presence : np.ndarray
+        A `(N, 26)` boolean array of whether each word contains each letter, to rank guesses by.
+    opening_book_turns : int
+        The bot is deterministic, so it caches its costly second guess in an opening book.
+    """
+
+    opening_book_turns: int = 1
+
+    def __init__(self):
+        """Initialize the EntropyBot instance with the shared feedback matrix."""
+        super().__init__()
+        # The opening is the same every game, so it is precomputed with get_entropies over the word list
+        self.first_guess: str = "TARES"
+        self.pattern_matrix: PatternKernel = get_pattern_matrix()
+        self.letter_presence: np.ndarray = self.lexicon.counts > 0
+
+    def generate_first_guess(self) -> str:
+        """
+        Generate the first guess for the Wordle game.
+
+        Returns
+        -------
+        str
+            The first guess word for the bot, which is precomputed.
+        """
+        return self.first_guess
+
+    def get_entropies(
+        self,
+        candidates: np.ndarray,
+        guess_ids: np.ndarray | None = None,
+        min_elements: int | None = None,
+    ) -> np.ndarray:
+        """
+        Compute the entropy of the feedback of many guesses, over blocks of guesses in parallel.
+
+        Parameters
+        ----------
+        candidates : np.ndarray
+            The ids of the possible words.
+        guess_ids : np.ndarray | None, optional
+            The ids of the guesses, defaults to every word.
+        min_elements : int | None, optional
+            The elements of work below which the guesses are scored in a single thread,
+            defaults to that of map_blocks.
+
+        Returns
+        -------
+        np.ndarray
+            A `(G,)` array of the expected information of each guess.
+        """
+        return map_blocks(
+            lambda block: get_entropies(
+                self.pattern_matrix.get_histograms(candidates, block)
+            ),
+            np.arange(len(self.lexicon)) if guess_ids is None else guess_ids,
+            cost=len(candidates),
+            min_elements=min_elements,
+        )
+
+    def generate_next_guess(self) -> str:
+        """
+        Generate the guess with the most expected information about the remaining possible words.
+
+        Any word can be guessed, but among equally informative guesses, possible words are preferred,
+        as they may win the game outright.
+
+        Returns
+        -------
+        str
+            The next guess word for the bot.
+        """
+        if len(self.possible_words) <= 2:
+            return self.possible_words[0]
+        candidates = self.get_candidate_ids()
+        return self.pick_guess(self.get_entropies(candidates), candidates)
+
+    def generate_next_guess_by(self, deadline: float) -> str:
+        """
+        Generate the guess with the most expected information found by a deadline.
+
+        Guesses are scored in blocks, from the most promising by get_letter_scores, until the deadline passes.
+        Each block is split between the threads of map_blocks, each scoring a share of a few milliseconds.
+        If every guess is scored, the guess is the same as generate_next_guess's. If the deadline passes before
+        any is scored, the most promising guess is returned unscored.
+
+        Parameters
+        ----------
+        deadline : float
+            The `time.monotonic()` value by which the guess is needed.
+
+        Returns
+        -------
+        str
+            The next guess word for the bot.
+        """
+        if len(self.possible_words) <= 2:
+            return self.possible_words[0]
+        candidates = self.get_candidate_ids()
+        order = np.argsort(
+            -get_letter_scores(self.letter_presence, candidates), kind="stable"
+        )
+        entropies = np.full(len(self.lexicon), -np.inf)
+        # Each guess costs a lookup per possible word, and a histogram of every pattern
+        block_size = get_thread_count() * max(
+            DEADLINE_MIN_BLOCK,
+            DEADLINE_BLOCK_ELEMENTS // (len(candidates) + PATTERN_COUNT),
+        )
+        scored = 0
+        while scored < len(order) and time.monotonic() < deadline:
+            block = order[scored : scored + block_size]
+            entropies[block] = self.get_entropies(
+                candidates, block, min_elements=DEADLINE_BLOCK_ELEMENTS
+            )
+            scored += len(block)
+        if scored == 0:
+            return self.lexicon.words[order[0]]
+        return self.pick_guess(entropies, candidates)
+
+    def get_candidate_ids(self) -> np.ndarray:
+        """
+        Get the ids of the possible words.
+
+        Returns
+        -------
+        np.ndarray
+            The ids, in the order of the possible words.
+        """
+        ids = self.lexicon.ids
+        return np.fromiter(
+            (ids[word] for word in self.possible_words),
+            dtype=np.intp,
+            count=len(self.possible_words),
+        )
+
+    def pick_guess(self, entropies: np.ndarray, candidates: np.ndarray) -> str:
+        """
+        Pick the guess with the most information, preferring possible words, then the first in order.
+
+        Parameters
+        ----------
+        entropies : np.ndarray
+            A `(N,)` array of the expected information of each word as a guess, `-inf` for words not scored.
+        candidates : np.ndarray
+            The ids of the possible words.
+
+        Returns
+        -------
+        str
+            The guess.
+        """
+        best = entropies >= entropies.max() - ENTROPY_TOLERANCE
+        best_candidates = np.flatnonzero(best[candidates])
+        if len(best_candidates) > 0:
+            return self.lexicon.words[candidates[best_candidates[0]]]
+        return self.lexicon.words[np.flatnonzero(best)[0]]
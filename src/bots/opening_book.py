@@ -0,0 +1,208 @@
+"""
+Opening Books for Wordle Bots.
+
+This module provides the OpeningBook class, which caches the guesses a bot makes in the first turns of a game.
+
+A deterministic bot's next guess only depends on its past guesses and their results, and early in the game
+there are few enough distinct histories to precompute the guess for each of them. The book is saved as
+JSON in the user's cache directory, keyed by the bot's class, the code defining it, its configuration and the word list.
+"""
+
+from common import Lexicon, Pattern, get_cache_dir
+import hashlib
+import importlib
+import json
+import os
+import sys
+
+# file: bots/opening_book.py
+
+# Bumped when the format of the books, or how they are built, changes
+BOOK_VERSION = 1
+# The modules besides a bot's own classes that its guesses depend on, for filtering and scoring
+GUESS_MODULES = (
+    "bots.util",
+    "bots.constraint",
+    "common.bitset_index",
+    "common.lexicon",
+    "common.pattern",
+    "common.pattern_matrix",
+)
+
+
+def get_config_hash(config: dict) -> str:
+    """
+    Hash the settings of a bot, to key the files precomputed from its guesses.
+
+    Parameters
+    ----------
+    config : dict
+        The settings that determine the bot's guesses.
+
+    Returns
+    -------
+    str
+        The first 16 hexadecimal digits of the SHA-1 of the settings as JSON.
+    """
+    return hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def get_code_hash(bot_class: type) -> str:
+    """
+    Hash the code of a bot, to key the files precomputed from its guesses, so they are rebuilt when it changes.
+
+    The code is that of the source files of the bot's class and its base classes, and of GUESS_MODULES.
+    Classes without a source file, such as those defined interactively, are only keyed by their name.
+
+    Parameters
+    ----------
+    bot_class : type
+        The class of the bot.
+
+    Returns
+    -------
+    str
+        The first 16 hexadecimal digits of the SHA-1 of the code and `BOOK_VERSION`.
+    """
+    digest = hashlib.sha1(f"{BOOK_VERSION}".encode())
+    modules = [sys.modules.get(cls.__module__) for cls in bot_class.__mro__]
+    modules += [importlib.import_module(name) for name in GUESS_MODULES]
+    for cls in bot_class.__mro__:
+        digest.update(cls.__qualname__.encode())
+    paths: list[str] = []
+    for module in modules:
+        path = getattr(module, "__file__", None)
+        if path is not None and path not in paths:
+            paths.append(path)
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def get_opening_book_path(bot_class: type, config: dict, lexicon: Lexicon) -> str:
+    """
+    Get the location of the opening book of a bot.
+
+    Parameters
+    ----------
+    bot_class : type
+        The class of the bot.
+    config : dict
+        The settings that determine the bot's guesses.
+    lexicon : Lexicon
+        The word list.
+
+    Returns
+    -------
+    str
+        The location of the opening book.
+    """
+    name = f"{bot_class.__name__}.{get_config_hash(config)}.{get_code_hash(bot_class)}"
+    return os.path.join(get_cache_dir(), f"wordle_book.{name}.{lexicon.hash}.json")
+
+
+class OpeningBook:
+    """
+    The guesses of a bot for each history of guesses and results early in a game.
+
+    Attributes
+    ----------
+    path : str
+        The location of the book on disk.
+    turns : int
+        The number of turns after the first that the book covers.
+    entries : dict[str, str]
+        The next guess, keyed by the history of guesses and results (see `get_key`).
+    """
+
+    def __init__(self, path: str, turns: int, entries: dict[str, str]) -> None:
+        """
+        Initialize an opening book.
+
+        Parameters
+        ----------
+        path : str
+            The location of the book on disk.
+        turns : int
+            The number of turns after the first that the book covers.
+        entries : dict[str, str]
+            The next guess, keyed by the history of guesses and results.
+        """
+        self.path: str = path
+        self.turns: int = turns
+        self.entries: dict[str, str] = entries
+
+    @staticmethod
+    def get_key(guesses: list[str], results: list[dict]) -> str:
+        """
+        Get the key of a history of guesses and results.
+
+        Parameters
+        ----------
+        guesses : list[str]
+            The guessed words.
+        results : list[dict]
+            The results of the guesses, with their Patterns under the key 'result'.
+
+        Returns
+        -------
+        str
+            The key, such as `"CAGEY:12|BLIND:0"`.
+        """
+        return "|".join(
+            f"{guess}:{int(Pattern.from_result(result))}"
+            for guess, result in zip(guesses, results)
+        )
+
+    def get(self, guesses: list[str], results: list[dict]) -> str | None:
+        """
+        Look up the next guess for a history of guesses and results.
+
+        Parameters
+        ----------
+        guesses : list[str]
+            The guessed words.
+        results : list[dict]
+            The results of the guesses.
+
+        Returns
+        -------
+        str | None
+            The next guess, or None if the book does not cover the history.
+        """
+        if len(guesses) > self.turns:
+            return None
+        return self.entries.get(self.get_key(guesses, results))
+
+    def save(self) -> None:
+        """
+        Write the book to its path.
+
+        The book is written to a temporary file first and moved into place, so that
+        concurrent processes never observe a partially written book.
+        """
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"turns": self.turns, "entries": self.entries}, f)
+        os.replace(temp_path, self.path)
+
+    @classmethod
+    def load(cls, path: str) -> "OpeningBook | None":
+        """
+        Read a book from disk.
+
+        Parameters
+        ----------
+        path : str
+            The location of the book.
+
+        Returns
+        -------
+        OpeningBook | None
+            The book, or None if there is no book at the path.
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            data = json.load(f)
+        return cls(path, data["turns"], data["entries"])
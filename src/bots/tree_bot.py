@@ -0,0 +1,181 @@
+"""
+Wordle Bot that plays from a precomputed decision tree.
+
+This module defines the TreeBot class, which implements the behavior of a Wordle bot.
+
+It inherits from BotBehaviors and looks up each guess in a strategy file computed offline by the
+decision tree solver, following the edge for each feedback pattern it receives. The strategy is
+memory-mapped, so every guess is a lookup, and the file is solved and saved on first use. By default the tree
+minimizes the expected number of turns while keeping secrets within the 6 turns of a game wherever the search
+finds a way to.
+"""
+
+from common import RESULT
+from solver import Strategy, build_strategy, get_strategy_path
+from solver.decision_tree import EXPECTED, MAX_TURNS
+from solver.strategy import ROOT
+from .bot_behaviors import BotBehaviors
+import os
+
+# file: bots/tree_bot.py
+
+
+class TreeBot(BotBehaviors):
+    """
+    A class representing a Wordle bot that follows a precomputed decision tree.
+
+    Attributes
+    ----------
+    turns : int | None
+        The number of turns the strategy solves every secret in, or None for no limit.
+    objective : str
+        The objective of the strategy, EXPECTED or WORST_CASE.
+    path : str
+        The location of the strategy file.
+    strategy : Strategy | None
+        The memory-mapped strategy, loaded on first use.
+    node : int | None
+        The current node of the strategy, or None once the game has left the tree,
+        in which case the bot guesses from the possible words.
+    opening_book_turns : int
+        The bot has no opening book, as its strategy already covers every turn.
+    """
+
+    opening_book_turns: int = 0
+
+    def __init__(
+        self,
+        path: str | None = None,
+        turns: int | None = MAX_TURNS,
+        objective: str = EXPECTED,
+    ):
+        """
+        Initialize the TreeBot instance.
+
+        Parameters
+        ----------
+        path : str | None, optional
+            The location of the strategy file, defaults to the decision tree of the shared word list
+            solved with the given turns and objective.
+        turns : int | None, optional
+            The number of turns to solve every secret in, defaults to MAX_TURNS.
+        objective : str, optional
+            The objective to solve the strategy for, EXPECTED or WORST_CASE, defaults to EXPECTED.
+        """
+        self.node: int | None = ROOT
+        super().__init__()
+        self.turns = turns
+        self.objective = objective
+        self.path: str = (
+            get_strategy_path(f"tree.{objective}.{turns}") if path is None else path
+        )
+        self.strategy: Strategy | None = None
+
+    def reset(self) -> None:
+        """Reset the bot's guesses and results, and return to the root of the strategy."""
+        super().reset()
+        self.node = ROOT
+
+    def save_state(self) -> dict:
+        """
+        Take a snapshot of the bot's state, including its node of the strategy.
+
+        Returns
+        -------
+        dict
+            The past guesses and results, the possible words and the node.
+        """
+        state = super().save_state()
+        state["node"] = self.node
+        return state
+
+    def restore_state(self, state: dict) -> None:
+        """
+        Restore a snapshot of the bot's state taken with save_state.
+
+        Parameters
+        ----------
+        state : dict
+            The snapshot to restore.
+        """
+        super().restore_state(state)
+        self.node = state["node"]
+
+    def get_strategy(self) -> Strategy:
+        """
+        Get the strategy, solving the word list and saving the strategy first if necessary.
+
+        Returns
+        -------
+        Strategy
+            The memory-mapped strategy.
+        """
+        if self.strategy is None:
+            if not os.path.exists(self.path):
+                self.logger.info(f"Solving the decision tree to {self.path}")
+                build_strategy(
+                    self.path,
+                    workers=os.cpu_count() or 1,
+                    turns=self.turns,
+                    objective=self.objective,
+                )
+            self.strategy = Strategy.load(self.path, self.lexicon)
+        return self.strategy
+
+    def prepare(self) -> None:
+        """Load the strategy, solving it first if necessary, as well as the opening book if any."""
+        super().prepare()
+        self.get_strategy()
+
+    def generate_first_guess(self) -> str:
+        """
+        Generate the first guess for the Wordle game.
+
+        Returns
+        -------
+        str
+            The guess at the root of the strategy.
+        """
+        return self.lexicon.words[self.get_strategy().get_guess(ROOT)]
+
+    def generate_next_guess(self) -> str:
+        """
+        Generate the next guess for the Wordle game from the current node of the strategy.
+
+        Returns
+        -------
+        str
+            The guess at the current node, or the first possible word once the game has left the tree.
+        """
+        if self.node is None:
+            return self.possible_words[0]
+        return self.lexicon.words[self.get_strategy().get_guess(self.node)]
+
+    def apply_result(self, guess: str, result: dict) -> None:
+        """
+        Follow the strategy for a guess and its result, narrowing the possible words to the secrets left.
+
+        If the guess is not the strategy's guess, or no secret gives the result, the game leaves the tree
+        and the possible words are filtered as usual.
+
+        Parameters
+        ----------
+        guess : str
+            The guessed word.
+        result : dict
+            A dictionary containing the Pattern of the guess under the key RESULT.
+        """
+        strategy = self.get_strategy()
+        if self.node is not None and self.lexicon.ids.get(guess) == strategy.get_guess(
+            self.node
+        ):
+            self.node = strategy.get_child(self.node, int(result[RESULT]))
+        else:
+            self.node = None
+        if self.node is None:
+            super().apply_result(guess, result)
+        else:
+            words = self.lexicon.words
+            self.possible_words = [
+                words[i] for i in sorted(strategy.get_secrets(self.node).tolist())
+            ]
@@ -8,12 +8,17 @@ and generating boolean comprehensions for lists.
 """
 
 from common import (
-    get_word_list,
-    RESULT,
-    INCORRECT_LETTER,
-    MISPLACED_LETTER,
-    CORRECT_LETTER,
+    get_lexicon,
+    get_pattern_matrix,
+    Lexicon,
+    PATTERN_COUNT,
+    Pattern,
 )
+from common.lexicon import get_letter_counts, get_letter_index, words_to_letters
+from common.pattern_matrix import score_row
+from .constraint import Constraint
+from typing import TypeVar
+import numpy as np
 import logging
 
 # file: bots/util.py
@@ -21,6 +26,10 @@ import logging
 GUESSES = "words"
 RESULTS = "results"
 
+# Candidate words, as a list of words, an array of word ids or a bitset of word ids,
+# which the filtering methods return in the same form as they are given
+Words = TypeVar("Words", list[str], np.ndarray, int)
+
 
 class Filter:
     """
@@ -29,27 +38,45 @@ class Filter:
     It includes methods to check for unique letters, filter words based on letter presence,
     and filter words based on previous guesses and results.
 
+    Candidate words can be given as a list of words, as a NumPy array of word ids, or as an integer
+    bitset of word ids, and the filtering methods return candidates in the same form. Lists and arrays
+    are filtered with vectorized operations over the letter tables of the lexicon, and bitsets with
+    AND and AND NOT operations over its inverted letter index (see `common.bitset_index`).
+
+    By default, a guess and its result are filtered leniently: an incorrect letter that occurs more than once
+    in the guess is only excluded from its position, and letter counts are never capped. In exact mode, only
+    the words for which the guess would give exactly the result are kept.
+
     Attributes
     ----------
     logger : logging.Logger
         A logger instance for logging filtering events and errors.
+    lexicon : Lexicon
+        The shared word list and its lookup tables.
     word_list : list[str]
-        A list of valid words that can be used in the game.
+        A list of valid words that can be used in the game, shared with the lexicon.
     all_unique_words : list[str]
-        A list of words that contain all unique letters, derived from the word list.
+        A list of words that contain all unique letters, shared with the lexicon.
+    exact : bool
+        Whether guesses and results are filtered exactly rather than leniently.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, exact: bool = False) -> None:
         """
         Initialize the Filter instance with a word list and sets up logging.
 
-        Loads the word list from a file and filters it to find words with all unique letters.
+        Uses the shared word list and its precomputed list of words with all unique letters.
+
+        Parameters
+        ----------
+        exact : bool, optional
+            If True, guesses and results are filtered exactly. Defaults to False.
         """
         self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
-        self.word_list = get_word_list()
-        self.all_unique_words = [
-            word for word in self.word_list if self.has_all_unique_letters(word)
-        ]
+        self.exact: bool = exact
+        self.lexicon: Lexicon = get_lexicon()
+        self.word_list: list[str] = self.lexicon.word_list
+        self.all_unique_words: list[str] = self.lexicon.unique_words
 
     def has_all_unique_letters(self, word: str) -> bool:
         """
@@ -72,14 +99,16 @@ class Filter:
                 return False
         return True
 
-    def is_letter_possible(self, words: list[str], letter: str) -> bool:
+    def is_letter_possible(
+        self, words: list[str] | np.ndarray | int, letter: str
+    ) -> bool:
         """
         Check if a letter is present in any of the words in the list.
 
         Parameters
         ----------
-        words : list[str]
-            A list of words to check.
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to check.
         letter : str
             The letter to check for presence in the words.
 
@@ -88,7 +117,12 @@ class Filter:
         bool
             True if the letter is present in any of the words, False otherwise.
         """
-        return any(letter in word for word in words)
+        if isinstance(words, int):
+            return bool(
+                words & self.lexicon.bitsets.at_least[0][get_letter_index(letter)]
+            )
+        _, counts = self.get_letter_tables(words)
+        return bool(counts[:, get_letter_index(letter)].any())
 
     def is_valid_word(self, word: str) -> bool:
         """
@@ -104,54 +138,180 @@ class Filter:
         bool
             True if the word is in the word list, False otherwise.
         """
-        return word in self.word_list
+        return self.lexicon.is_valid_word(word)
+
+    def get_pattern(self, guess_id: int, secret_id: int) -> Pattern:
+        """
+        Look up the feedback code of a guess against a secret by word id.
+
+        Word ids are indices into the lexicon. The feedback matrix is loaded on first use.
+
+        Parameters
+        ----------
+        guess_id : int
+            The id of the guessed word.
+        secret_id : int
+            The id of the secret word.
+
+        Returns
+        -------
+        Pattern
+            The interned feedback pattern.
+        """
+        return get_pattern_matrix().get_pattern(guess_id, secret_id)
+
+    def get_letter_tables(
+        self, words: list[str] | np.ndarray | int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the letters and letter counts of a set of candidate words.
+
+        Parameters
+        ----------
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids.
 
-    def filter_containing_letter(self, words: list[str], letter: str) -> list[str]:
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            An `(M, 5)` array of letter indices and an `(M, 26)` array of letter counts, one row per candidate.
+        """
+        if isinstance(words, int):
+            words = self.lexicon.bitsets.to_ids(words)
+        if isinstance(words, np.ndarray):
+            return self.lexicon.letters[words], self.lexicon.counts[words]
+        if words is self.word_list:
+            return self.lexicon.letters, self.lexicon.counts
+        ids = self.lexicon.ids
+        try:
+            selected = np.fromiter(
+                (ids[word] for word in words), dtype=np.intp, count=len(words)
+            )
+        except KeyError:
+            # Some words are not in the word list, so build their tables directly
+            letters = words_to_letters(words)
+            return letters, get_letter_counts(letters)
+        return self.lexicon.letters[selected], self.lexicon.counts[selected]
+
+    def select(self, words: Words, mask: np.ndarray) -> Words:
+        """
+        Select the candidate words for which a mask is set.
+
+        Parameters
+        ----------
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids.
+        mask : np.ndarray
+            A boolean array with one entry per candidate.
+
+        Returns
+        -------
+        list[str] | np.ndarray | int
+            The selected candidates, in the same form as the given candidates.
+        """
+        if isinstance(words, np.ndarray):
+            return words[mask]
+        if isinstance(words, int):
+            return self.lexicon.bitsets.from_ids(
+                self.lexicon.bitsets.to_ids(words)[mask]
+            )
+        return [words[i] for i in np.flatnonzero(mask).tolist()]
+
+    def count_words(self, words: list[str] | np.ndarray | int) -> int:
+        """
+        Count a set of candidate words.
+
+        Parameters
+        ----------
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids.
+
+        Returns
+        -------
+        int
+            The number of candidate words.
+        """
+        if isinstance(words, int):
+            return words.bit_count()
+        return len(words)
+
+    def to_bitset(self, words: list[str] | np.ndarray | int) -> int:
+        """
+        Convert a set of candidate words to a bitset of word ids.
+
+        Parameters
+        ----------
+        words : list[str] | np.ndarray | int
+            A list of words from the word list, an array of word ids, or a bitset of word ids.
+
+        Returns
+        -------
+        int
+            The bitset of the candidate word ids.
+        """
+        if isinstance(words, int):
+            return words
+        if words is self.word_list:
+            return self.lexicon.bitsets.all
+        if not isinstance(words, np.ndarray):
+            ids = self.lexicon.ids
+            words = np.fromiter(
+                (ids[word] for word in words), dtype=np.intp, count=len(words)
+            )
+        return self.lexicon.bitsets.from_ids(words)
+
+    def filter_containing_letter(self, words: Words, letter: str) -> Words:
         """
         Filter a list of words to include only those that contain a specific letter.
 
         Parameters
         ----------
-        words : list[str]
-            A list of words to filter.
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to filter.
         letter : str
             The letter to check for in the words.
 
         Returns
         -------
-        list[str]
-            A list of words that contain the specified letter.
+        list[str] | np.ndarray | int
+            The words that contain the specified letter, in the same form as the given words.
         """
-        return [word for word in words if letter in word]
+        if isinstance(words, int):
+            return words & self.lexicon.bitsets.at_least[0][get_letter_index(letter)]
+        _, counts = self.get_letter_tables(words)
+        return self.select(words, counts[:, get_letter_index(letter)] > 0)
 
-    def filter_not_containing_letter(self, words: list[str], letter: str) -> list[str]:
+    def filter_not_containing_letter(self, words: Words, letter: str) -> Words:
         """
         Filter a list of words to exclude those that contain a specific letter.
 
         Parameters
         ----------
-        words : list[str]
-            A list of words to filter.
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to filter.
         letter : str
             The letter to check for in the words.
 
         Returns
         -------
-        list[str]
-            A list of words that do not contain the specified letter.
+        list[str] | np.ndarray | int
+            The words that do not contain the specified letter, in the same form as the given words.
         """
-        return [word for word in words if letter not in word]
+        if isinstance(words, int):
+            return words & ~self.lexicon.bitsets.at_least[0][get_letter_index(letter)]
+        _, counts = self.get_letter_tables(words)
+        return self.select(words, counts[:, get_letter_index(letter)] == 0)
 
     def filter_containing_letter_at(
-        self, words: list[str], letter: str, index: int
-    ) -> list[str]:
+        self, words: Words, letter: str, index: int
+    ) -> Words:
         """
         Filter a list of words to include only those that contain a specific letter at a specific index.
 
         Parameters
         ----------
-        words : list[str]
-            A list of words to filter.
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to filter.
         letter : str
             The letter to check for in the words.
         index : int
@@ -159,21 +319,24 @@ class Filter:
 
         Returns
         -------
-        list[str]
-            A list of words that contain the specified letter at the specified index.
+        list[str] | np.ndarray | int
+            The words that contain the specified letter at the specified index, in the same form as the given words.
         """
-        return [word for word in words if word[index] == letter]
+        if isinstance(words, int):
+            return words & self.lexicon.bitsets.at[index][get_letter_index(letter)]
+        letters, _ = self.get_letter_tables(words)
+        return self.select(words, letters[:, index] == get_letter_index(letter))
 
     def filter_not_containing_letter_at(
-        self, words: list[str], letter: str, index: int
-    ) -> list[str]:
+        self, words: Words, letter: str, index: int
+    ) -> Words:
         """
         Filter a list of words to exclude those that contain a specific letter at a specific index.
 
         Parameters
         ----------
-        words : list[str]
-            A list of words to filter.
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to filter.
         letter : str
             The letter to check for in the words.
         index : int
@@ -181,122 +344,311 @@ class Filter:
 
         Returns
         -------
-        list[str]
-            A list of words that do not contain the specified letter at the specified index.
+        list[str] | np.ndarray | int
+            The words that do not contain the specified letter at the specified index, in the same form as the given words.
         """
-        return [word for word in words if word[index] is not letter]
+        if isinstance(words, int):
+            return words & ~self.lexicon.bitsets.at[index][get_letter_index(letter)]
+        letters, _ = self.get_letter_tables(words)
+        return self.select(words, letters[:, index] != get_letter_index(letter))
 
     def filter_compatible_with_guess(
-        self, words: list[str], guess: str, result: dict
-    ) -> list[str]:
+        self, words: Words, guess: str, result: dict | Pattern
+    ) -> Words:
         """
         Filter a list of words based on a guess and the result of that guess.
 
-        The result is expected to be a dictionary with a key 'result' that contains a list of responses
-        corresponding to each letter in the guess. The responses can be:
+        The result is expected to be a Pattern, or a dictionary with a key 'result' that contains the
+        responses corresponding to each letter in the guess. The responses can be:
         - CORRECT_LETTER: The letter is in the correct position.
         - MISPLACED_LETTER: The letter is in the word but in the wrong position.
         - INCORRECT_LETTER: The letter is not in the word at all
 
+        In exact mode, the words are filtered with filter_matching_pattern instead.
+
         Parameters
         ----------
-        words : list[str]
-            A list of words to filter based on the guess and result.
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to filter based on the guess and result.
         guess : str
             The guessed word to compare against the words in the list.
-        result : dict
-            A dictionary containing the result of the guess, with a key 'result' that holds a
-            list of responses for each letter in the guess.
+        result : dict | Pattern
+            The Pattern of the guess, or a dictionary containing the result of the guess, with a key
+            'result' that holds the responses for each letter in the guess.
 
         Returns
         -------
-        list[str]
-            A list of words that are compatible with the guess and result.
-        """
-        index = 0
-        self.logger.debug(f"Currently {len(words)} words")
-        self.logger.debug(f"Filtering {guess} / {result[RESULT]}")
-        for letter, response in zip(guess, result[RESULT]):
-            if response is CORRECT_LETTER:
-                words = self.filter_containing_letter_at(words, letter, index)
-            elif response is INCORRECT_LETTER:
-                if guess.count(letter) > 1:
-                    words = self.filter_not_containing_letter_at(words, letter, index)
-                else:
-                    words = self.filter_not_containing_letter(words, letter)
-            elif response is MISPLACED_LETTER:
-                filtered_words = self.filter_not_containing_letter_at(
-                    words, letter, index
-                )
-                words = self.filter_containing_letter(filtered_words, letter)
-            index += 1
-        self.logger.debug(f"Filtered to {len(words)} words")
+        list[str] | np.ndarray | int
+            The words that are compatible with the guess and result, in the same form as the given words.
+        """
+        self.logger.debug(f"Currently {self.count_words(words)} words")
+        self.logger.debug(f"Filtering {guess} / {Pattern.from_result(result)}")
+        if self.exact:
+            words = self.filter_matching_pattern(words, guess, result)
+        else:
+            words = self.filter_matching_constraint(
+                words, Constraint.from_result(guess, result)
+            )
+        self.logger.debug(f"Filtered to {self.count_words(words)} words")
         return words
 
-    def filter_compatible_with_past_guesses(
-        self, words: list[str], guesses: dict
-    ) -> list[str]:
+    def filter_matching_pattern(
+        self, words: Words, guess: str, result: dict | Pattern
+    ) -> Words:
+        """
+        Filter a list of words to include only those for which a guess gives exactly a result.
+
+        Unlike the constraints of filter_compatible_with_guess, this caps the count of letters marked incorrect,
+        so it never keeps a word that could not have given the result.
+
+        Parameters
+        ----------
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to filter.
+        guess : str
+            The guessed word.
+        result : dict | Pattern
+            The Pattern of the guess, or a dictionary containing it under the key 'result'.
+
+        Returns
+        -------
+        list[str] | np.ndarray | int
+            The words that give the result, in the same form as the given words.
+        """
+        codes = self.score_words(words, guess)
+        return self.select(words, codes == int(Pattern.from_result(result)))
+
+    def score_words(
+        self, words: list[str] | np.ndarray | int, guess: str
+    ) -> np.ndarray:
+        """
+        Compute the feedback codes of a guess against a set of candidate words.
+
+        The codes are looked up in the feedback matrix when the guess and the words are in the word list,
+        and computed from the letter tables of the words otherwise.
+
+        Parameters
+        ----------
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids.
+        guess : str
+            The guessed word.
+
+        Returns
+        -------
+        np.ndarray
+            A `uint8` array of feedback codes, one per candidate, in order of the candidates.
+        """
+        guess_id = self.lexicon.get_id(guess)
+        if isinstance(words, int):
+            words = self.lexicon.bitsets.to_ids(words)
+        if guess_id is not None:
+            if words is self.word_list:
+                return get_pattern_matrix().get_row(guess_id)
+            if isinstance(words, np.ndarray):
+                return get_pattern_matrix().get_row(guess_id, words)
+        letters, counts = self.get_letter_tables(words)
+        return score_row(words_to_letters([guess])[0], letters, counts)
+
+    def partition(self, words: Words, guess: str) -> dict[Pattern, Words]:
+        """
+        Split a set of candidate words by the feedback a guess gives for each of them, in a single pass.
+
+        Parameters
+        ----------
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to split.
+        guess : str
+            The guessed word.
+
+        Returns
+        -------
+        dict[Pattern, list[str] | np.ndarray | int]
+            The candidates giving each feedback pattern, in the same form as the given words,
+            keyed by the patterns that occur in ascending order of code.
+        """
+        if isinstance(words, int):
+            bitsets = self.lexicon.bitsets
+            return {
+                pattern: bitsets.from_ids(bucket)
+                for pattern, bucket in self.partition(
+                    bitsets.to_ids(words), guess
+                ).items()
+            }
+        codes = self.score_words(words, guess)
+        order = np.argsort(codes, kind="stable")
+        present, starts = np.unique(codes[order], return_index=True)
+        bounds = np.append(starts, len(order)).tolist()
+        buckets: dict[Pattern, Words] = {}
+        for i, code in enumerate(present.tolist()):
+            selected = order[bounds[i] : bounds[i + 1]]
+            if isinstance(words, np.ndarray):
+                buckets[Pattern(code)] = words[selected]
+            else:
+                buckets[Pattern(code)] = [words[j] for j in selected.tolist()]
+        return buckets
+
+    def get_word_ids(self, words: list[str] | np.ndarray | int) -> np.ndarray | None:
+        """
+        Get the ids of a set of candidate words, if they are all in the word list.
+
+        Parameters
+        ----------
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids.
+
+        Returns
+        -------
+        np.ndarray | None
+            The ids of the candidates in order, or None if some word is not in the word list.
+        """
+        if isinstance(words, np.ndarray):
+            return words
+        if isinstance(words, int):
+            return self.lexicon.bitsets.to_ids(words)
+        if words is self.word_list:
+            return np.arange(len(self.lexicon))
+        ids = self.lexicon.ids
+        if not all(word in ids for word in words):
+            return None
+        return np.fromiter(
+            (ids[word] for word in words), dtype=np.intp, count=len(words)
+        )
+
+    def partition_counts(
+        self, words: list[str] | np.ndarray | int, guesses: list[str]
+    ) -> np.ndarray:
+        """
+        Count the candidate words giving each feedback pattern, for many guesses at once.
+
+        Parameters
+        ----------
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids.
+        guesses : list[str]
+            The guessed words.
+
+        Returns
+        -------
+        np.ndarray
+            A `(G, PATTERN_COUNT)` array where entry `[i, p]` is the number of candidates for which
+            guess `guesses[i]` gives feedback code `p`.
+        """
+        ids = self.lexicon.ids
+        if all(guess in ids for guess in guesses):
+            word_ids = self.get_word_ids(words)
+            if word_ids is not None:
+                return get_pattern_matrix().get_histograms(
+                    word_ids, np.array([ids[guess] for guess in guesses], dtype=np.intp)
+                )
+        return np.array(
+            [
+                np.bincount(self.score_words(words, guess), minlength=PATTERN_COUNT)
+                for guess in guesses
+            ],
+            dtype=np.int64,
+        ).reshape(len(guesses), PATTERN_COUNT)
+
+    def filter_matching_constraint(self, words: Words, constraint: Constraint) -> Words:
+        """
+        Filter a list of words to include only those that meet a compiled constraint.
+
+        Parameters
+        ----------
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to filter.
+        constraint : Constraint
+            The constraint the words must meet.
+
+        Returns
+        -------
+        list[str] | np.ndarray | int
+            The words that meet the constraint, in the same form as the given words.
+        """
+        if isinstance(words, int):
+            return constraint.get_bitset(self.lexicon.bitsets, words)
+        letters, counts = self.get_letter_tables(words)
+        return self.select(words, constraint.get_mask(letters, counts))
+
+    def filter_compatible_with_past_guesses(self, words: Words, guesses: dict) -> Words:
         """
         Filter a list of words based on multiple past guesses and their results.
 
-        This method iterates through all past guesses and their corresponding results,
-        filtering the list of words to retain only those that are compatible with all guesses.
+        This method combines the constraints of all past guesses and their corresponding results,
+        filtering the list of words in a single pass to retain only those that are compatible with all guesses.
 
         Parameters
         ----------
-        words : list[str]
-            A list of words to filter based on the past guesses and results.
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to filter based on the past guesses and results.
         guesses : dict
             A dictionary containing past guesses and their results, with keys 'words' and 'results'.
-            'words' is a list of guessed words, and 'results' is a list of dictionaries containing
-            the result for each guess.
+            'words' is a list of guessed words, and 'results' is a list of Patterns or dictionaries
+            containing the result for each guess.
 
         Returns
         -------
-        list[str]
-            A list of words that are compatible with all past guesses and results.
+        list[str] | np.ndarray | int
+            The words that are compatible with all past guesses and results, in the same form as the given words.
         """
+        constraint = Constraint()
         for guess, result in zip(guesses[GUESSES], guesses[RESULTS]):
-            words = self.filter_compatible_with_guess(words, guess, result)
-        return words
+            constraint = constraint.combine(Constraint.from_result(guess, result))
+        return self.filter_matching_constraint(words, constraint)
 
-    def filter_unique_letters(self, words: list[str]) -> list[str]:
+    def filter_unique_letters(self, words: Words) -> Words:
         """
         Filter a list of words to include only those that have all unique letters.
 
         Parameters
         ----------
-        words : list[str]
-            A list of words to filter.
+        words : list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to filter.
 
         Returns
         -------
-        list[str]
-            A list of words that contain all unique letters.
+        list[str] | np.ndarray | int
+            The words that contain all unique letters, in the same form as the given words.
         """
-        return [word for word in words if self.has_all_unique_letters(word)]
+        if isinstance(words, int):
+            return words & ~self.lexicon.bitsets.repeated
+        _, counts = self.get_letter_tables(words)
+        return self.select(words, counts.max(axis=1, initial=0) <= 1)
 
-    def get_letter_count(self, words: list[str]) -> dict[str, int]:
+    def get_letter_count(self, words: list[str] | np.ndarray | int) -> dict[str, int]:
         """
         Generate a dictionary of letters to integers that represents the count of each letter in the given word list.
 
+        Letters are keyed in the order they first appear in the word list, reading a bitset in order of word id.
+
         Parameters
         ----------
-        words: list[str]
-            A list of words to count.
+        words: list[str] | np.ndarray | int
+            A list of words, an array of word ids, or a bitset of word ids, to count.
 
         Returns
         -------
         dict[str, int]
             A dictionary keyed by letter to counts.
         """
-        dict = {}
-        for word in words:
-            for letter in word:
-                if letter not in dict:
-                    dict[letter] = 0
-                dict[letter] += 1
-        return dict
+        if isinstance(words, int):
+            bitsets = self.lexicon.bitsets
+            first_seen: dict[int, int] = {}
+            for letter in range(26):
+                occurrence = bitsets.get_first_occurrence(words, letter)
+                if occurrence is not None:
+                    first_seen[letter] = occurrence
+            return {
+                chr(ord("A") + letter): bitsets.count_letter(words, letter)
+                for letter in sorted(first_seen, key=first_seen.__getitem__)
+            }
+        letters, counts = self.get_letter_tables(words)
+        totals = counts.sum(axis=0, dtype=np.int64)
+        present, first_indices = np.unique(letters.ravel(), return_index=True)
+        return {
+            chr(ord("A") + letter): int(totals[letter])
+            for letter in present[np.argsort(first_indices)].tolist()
+        }
 
     def get_sorted_letters(self, totals_dict: dict[str, int]) -> str:
         """
@@ -3,14 +3,14 @@ CLI for Wordle Bot.
 
 This module provides a command-line interface for interacting with Wordle bots.
 It allows users to select a bot, play games, and input guesses and results interactively.
+While the user types, the bot's next suggestion is computed ahead of time by a Speculator.
 """
 
 from bots import BotBehaviors
-from common import prettify_guess
+from common import ALL_CORRECT, Lexicon, Pattern, prettify_guess
 from wordle import Wordle
 from bots.util import GUESSES, RESULTS
 from common.util import (
-    ALL_CORRECT,
     CORRECT_LETTER,
     INCORRECT_LETTER,
     MISPLACED_LETTER,
@@ -18,6 +18,7 @@ from common.util import (
     RESULT,
     get_all_subclasses,
 )
+from .speculation import Speculator
 from .util import get_bot_selection, get_choice_from_prompt
 
 
@@ -33,7 +34,9 @@ class Cli:
         """Initialize the CLI."""
         self.bots = get_all_subclasses(BotBehaviors)
         self.wordle = Wordle()
+        self.lexicon: Lexicon = self.wordle.lexicon
         self.quit = False
+        self.speculator: Speculator | None = None
 
     def game_in_progress(self) -> bool:
         """
@@ -63,6 +66,8 @@ class Cli:
             self.provide_guess()
             self.accept_guess()
             self.accept_result()
+        if self.speculator is not None:
+            self.speculator.cancel()
         print("Game over!")
 
     def play_automatically(self) -> None:
@@ -117,19 +122,41 @@ class Cli:
         self.init_bot()
         self.play()
 
+    def get_speculator(self) -> Speculator:
+        """Get the speculator of the current bot, replacing that of a previous bot."""
+        if self.speculator is None or self.speculator.bot is not self.bot:
+            if self.speculator is not None:
+                self.speculator.cancel()
+            self.speculator = Speculator(self.bot)
+        return self.speculator
+
     def provide_guess(self):
-        """Provide the bot's next guess to the user."""
-        old_list: list[str] = self.bot.possible_words
-        print(
-            f"Suggested next word: {self.bot.generate_guess()} (of {len(self.bot.possible_words)} words)"
-        )
-        # Reset bot's internal state
-        self.bot.guesses[GUESSES].pop()
-        self.bot.possible_words = old_list
+        """Provide the bot's next guess to the user, and start computing the suggestions after it."""
+        state = self.bot.save_state()
+        speculator = self.get_speculator()
+        suggestion = None
+        if len(self.bot.guesses[GUESSES]) > 0:
+            suggestion = speculator.get(
+                self.bot.guesses[GUESSES], self.bot.guesses[RESULTS]
+            )
+        if suggestion is None:
+            try:
+                suggestion = self.bot.generate_guess(), len(self.bot.possible_words)
+            except ValueError as e:
+                print(f"No suggestion: {e}")
+                return
+            finally:
+                # Reset bot's internal state, as the user may play a different word
+                self.bot.restore_state(state)
+        guess, remaining = suggestion
+        print(f"Suggested next word: {guess} (of {remaining} words)")
+        speculator.start(state, guess)
 
     def accept_guess(self):
         """Accept a guess from the user, validate, and update bot state."""
         guess = self.get_valid_word()
+        if self.speculator is not None:
+            self.speculator.deviate(guess)
         self.bot.guesses[GUESSES].append(guess)
 
     def get_valid_word(self) -> str:
@@ -137,7 +164,7 @@ class Cli:
         print("Enter your word")
         while True:
             word = input("> ").strip().upper()
-            if word in self.wordle.word_list:
+            if self.lexicon.is_valid_word(word):
                 return word
             else:
                 print(
@@ -156,9 +183,9 @@ class Cli:
             # Remove commas and spaces
             cleaned = result_str.replace(",", "").replace(" ", "")
             if len(cleaned) == 5 and all(int(c) in VALID_DIGITS for c in cleaned):
-                # Convert to list of ints
-                result_list = [int(c) for c in cleaned]
-                self.bot.accept_result({RESULT: result_list, MSG: None})
+                # Convert to a pattern
+                pattern = Pattern.from_list([int(c) for c in cleaned])
+                self.bot.accept_result({RESULT: pattern, MSG: None})
                 break
             else:
                 print(
@@ -0,0 +1,241 @@
+"""
+Speculative Suggestions for the CLI.
+
+This module defines the Speculator class, which computes a bot's next suggestion in a background thread
+while the user is still typing their guess and its result.
+
+The likeliest guess is the one the bot just suggested, so the speculator plays it against every result
+it can actually get, from the most to the least likely, and keeps the suggestion for each. If the user
+then plays the suggested guess, their result has usually been played out already, and the suggestion is
+shown at once. Speculation is cancelled as soon as the user plays another word, and its suggestions are
+only ever used for the exact game they were computed for.
+"""
+
+from bots import BotBehaviors
+from bots.util import GUESSES, RESULTS
+from common import ALL_CORRECT, MSG, RESULT, Pattern
+import copy
+import logging
+import threading
+
+# file: cli/speculation.py
+
+MAX_TURNS = 6
+
+
+def get_history_key(guesses: list[str], results: list[dict]) -> tuple:
+    """
+    Get a hashable key for a game so far.
+
+    Parameters
+    ----------
+    guesses : list[str]
+        The guesses of the game.
+    results : list[dict]
+        The result of each guess, with its Pattern under the key RESULT.
+
+    Returns
+    -------
+    tuple
+        The guesses, and the code of each result.
+    """
+    return tuple(guesses), tuple(int(result[RESULT]) for result in results)
+
+
+class Speculator:
+    """
+    A background thread computing a bot's next suggestion for every result of its current suggestion.
+
+    Attributes
+    ----------
+    logger : logging.Logger
+        A logger instance for logging speculation events and errors.
+    bot : BotBehaviors
+        The bot whose suggestions are computed. Each thread plays a shallow copy of it,
+        which shares its settings, opening book and strategy.
+    guess : str | None
+        The guess being speculated on, or None if there is no speculation.
+    suggestions : dict[tuple, tuple[str, int]]
+        The suggestion and the number of possible words for each game played out, keyed by its history.
+    current : tuple | None
+        The history of the game being played out, if any.
+    cancelled : threading.Event
+        Set to stop the thread after the game it is playing out.
+    condition : threading.Condition
+        Notified when the thread finishes playing out a game, guarding the suggestions and the current game.
+    thread : threading.Thread | None
+        The thread, if speculation was started.
+    """
+
+    def __init__(self, bot: BotBehaviors) -> None:
+        """
+        Initialize the Speculator instance.
+
+        Parameters
+        ----------
+        bot : BotBehaviors
+            The bot whose suggestions are computed.
+        """
+        self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
+        self.bot = bot
+        self.guess: str | None = None
+        self.suggestions: dict[tuple, tuple[str, int]] = {}
+        self.current: tuple | None = None
+        self.cancelled = threading.Event()
+        self.condition = threading.Condition()
+        self.thread: threading.Thread | None = None
+
+    def start(self, state: dict, guess: str) -> None:
+        """
+        Start speculating on a guess, cancelling any previous speculation.
+
+        Nothing is started if the guess is not a valid word or there is no turn after it.
+
+        Parameters
+        ----------
+        state : dict
+            The state of the bot before the guess, as taken by save_state.
+        guess : str
+            The guess, usually the bot's suggestion.
+        """
+        self.cancel()
+        if (
+            not self.bot.lexicon.is_valid_word(guess)
+            or len(state[GUESSES]) + 1 >= MAX_TURNS
+        ):
+            return
+        self.guess = guess
+        self.cancelled = threading.Event()
+        # Load the opening book and strategy here, so the copy shares them rather than building its own
+        self.bot.prepare()
+        self.thread = threading.Thread(
+            target=self.speculate,
+            args=(copy.copy(self.bot), state, guess, self.cancelled),
+            name="speculator",
+            daemon=True,
+        )
+        self.thread.start()
+
+    def speculate(
+        self, bot: BotBehaviors, state: dict, guess: str, cancelled: threading.Event
+    ) -> None:
+        """
+        Play the guess out against each of its possible results, from the most to the least likely.
+
+        Parameters
+        ----------
+        bot : BotBehaviors
+            The copy of the bot to play, used by no other thread.
+        state : dict
+            The state of the bot before the guess.
+        guess : str
+            The guess.
+        cancelled : threading.Event
+            Set when the speculation is cancelled.
+        """
+        buckets = bot.filter.partition(state["possible_words"], guess)
+        patterns = sorted(
+            (p for p in buckets if p != ALL_CORRECT),
+            key=lambda p: len(buckets[p]),
+            reverse=True,
+        )
+        for pattern in patterns:
+            if cancelled.is_set() or not self.play_out(
+                bot, state, guess, pattern, cancelled
+            ):
+                break
+        self.logger.info(f"Stopped speculating on {guess}")
+
+    def play_out(
+        self,
+        bot: BotBehaviors,
+        state: dict,
+        guess: str,
+        pattern: Pattern,
+        cancelled: threading.Event,
+    ) -> bool:
+        """
+        Play the guess out against one of its results, and keep the suggestion for it.
+
+        Parameters
+        ----------
+        bot : BotBehaviors
+            The copy of the bot to play, used by no other thread.
+        state : dict
+            The state of the bot before the guess.
+        guess : str
+            The guess.
+        pattern : Pattern
+            The result of the guess.
+        cancelled : threading.Event
+            Set when the speculation is cancelled.
+
+        Returns
+        -------
+        bool
+            Whether to go on speculating, which is False once cancelled or if the bot failed.
+        """
+        bot.restore_state(state)
+        bot.guesses[GUESSES].append(guess)
+        bot.accept_result({RESULT: pattern, MSG: None})
+        key = get_history_key(bot.guesses[GUESSES], bot.guesses[RESULTS])
+        with self.condition:
+            if cancelled.is_set():
+                return False
+            self.current = key
+        suggestion: str | None = None
+        try:
+            remaining = len(bot.possible_words)
+            suggestion = bot.generate_guess()
+        except Exception:
+            self.logger.exception(f"Failed to speculate on {guess} {pattern}")
+        finally:
+            # Store the suggestion as the game stops being current, so a waiting get finds it
+            with self.condition:
+                if suggestion is not None and not cancelled.is_set():
+                    self.suggestions[key] = (suggestion, remaining)
+                if self.current == key:
+                    self.current = None
+                self.condition.notify_all()
+        return suggestion is not None
+
+    def get(self, guesses: list[str], results: list[dict]) -> tuple[str, int] | None:
+        """
+        Get the suggestion for a game, waiting for it if it is being computed.
+
+        Parameters
+        ----------
+        guesses : list[str]
+            The guesses of the game.
+        results : list[dict]
+            The result of each guess.
+
+        Returns
+        -------
+        tuple[str, int] | None
+            The suggestion and the number of possible words, or None if the game was not speculated on.
+        """
+        key = get_history_key(guesses, results)
+        with self.condition:
+            while self.current == key:
+                self.condition.wait()
+            return self.suggestions.get(key)
+
+    def deviate(self, guess: str) -> None:
+        """
+        Cancel the speculation if the user plays another guess than the one speculated on.
+
+        Parameters
+        ----------
+        guess : str
+            The guess played.
+        """
+        if guess != self.guess:
+            self.cancel()
+
+    def cancel(self) -> None:
+        """Stop the thread after the game it is playing out, and discard its suggestions."""
+        self.cancelled.set()
+        with self.condition:
+            self.guess = None
+            self.suggestions = {}
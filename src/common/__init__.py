@@ -3,7 +3,8 @@ Module for Common Utilities.
 
 This module provides various utility functions and constants used throughout the Wordle bot application.
 
-It includes functions for handling word lists, formatting guesses, and defining constants related to game results.
+It includes functions for handling word lists, formatting guesses, and defining constants and the Pattern type related to game results,
+as well as the word list and precomputed feedback matrix shared by the game and the bots.
 """
 
 from .util import (
@@ -13,9 +14,25 @@ from .util import (
     MISPLACED_LETTER,
     CORRECT_LETTER,
     LOG_FILE,
-    ALL_CORRECT,
+    CACHE_DIR_VARIABLE,
     boolean_comprehension,
+    get_cache_dir,
     get_word_list,
     prettify_guess,
     prettify_guess_no_color,
 )
+from .lexicon import Lexicon, get_lexicon
+from .pattern import (
+    ALL_CORRECT,
+    PATTERN_COUNT,
+    Pattern,
+    score_guess,
+)
+from .pattern_matrix import (
+    PatternKernel,
+    PatternMatrix,
+    TiledPatternMatrix,
+    get_pattern_matrix,
+    score_many,
+    select_pattern_matrix,
+)
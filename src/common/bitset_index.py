@@ -0,0 +1,189 @@
+"""
+Inverted Letter Index over Word Ids.
+
+This module provides the BitsetIndex class, which maps each letter predicate used to filter candidates
+to the set of words satisfying it, stored as a Python integer bitset over word ids.
+
+Bit `i` of a bitset is set if the word with id `i` is in the set, so intersecting candidate sets is a
+single AND, removing a set is an AND NOT, and counting a set is a popcount.
+"""
+
+import numpy as np
+
+# File: common/bitset_index.py
+
+
+def ids_to_bitset(ids: np.ndarray, size: int) -> int:
+    """
+    Convert an array of word ids to a bitset.
+
+    Parameters
+    ----------
+    ids : np.ndarray
+        The word ids in the set.
+    size : int
+        The number of words in the lexicon.
+
+    Returns
+    -------
+    int
+        The bitset with the bit of each id set.
+    """
+    members = np.zeros(size, dtype=bool)
+    members[ids] = True
+    return mask_to_bitset(members)
+
+
+def mask_to_bitset(mask: np.ndarray) -> int:
+    """
+    Convert a boolean array indexed by word id to a bitset.
+
+    Parameters
+    ----------
+    mask : np.ndarray
+        A boolean array that is True for the words in the set.
+
+    Returns
+    -------
+    int
+        The bitset with the bit of each selected id set.
+    """
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+def bitset_to_ids(bitset: int, size: int) -> np.ndarray:
+    """
+    Convert a bitset to an ascending array of word ids.
+
+    Parameters
+    ----------
+    bitset : int
+        The bitset to convert.
+    size : int
+        The number of words in the lexicon.
+
+    Returns
+    -------
+    np.ndarray
+        The ids of the words in the set.
+    """
+    data = np.frombuffer(bitset.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(data, count=size, bitorder="little"))
+
+
+class BitsetIndex:
+    """
+    An inverted index from letter predicates to bitsets of word ids.
+
+    Attributes
+    ----------
+    size : int
+        The number of words in the lexicon.
+    all : int
+        The bitset of every word.
+    at : list[list[int]]
+        `at[i][l]` is the bitset of words with letter `l` at position `i`.
+    at_least : list[list[int]]
+        `at_least[k - 1][l]` is the bitset of words containing letter `l` at least `k` times,
+        so `at_least[0][l]` is the bitset of words containing letter `l`.
+    repeated : int
+        The bitset of words that contain any letter more than once.
+    """
+
+    def __init__(self, letters: np.ndarray, counts: np.ndarray) -> None:
+        """
+        Build the index for a word list.
+
+        Parameters
+        ----------
+        letters : np.ndarray
+            An `(N, 5)` array of letter indices, indexed by word id.
+        counts : np.ndarray
+            An `(N, 26)` array of letter counts, indexed by word id.
+        """
+        self.size: int = len(letters)
+        self.all: int = (1 << self.size) - 1
+        self.at: list[list[int]] = [
+            [mask_to_bitset(letters[:, i] == letter) for letter in range(26)]
+            for i in range(letters.shape[1])
+        ]
+        self.at_least: list[list[int]] = [
+            [mask_to_bitset(counts[:, letter] >= k) for letter in range(26)]
+            for k in range(1, letters.shape[1] + 1)
+        ]
+        self.repeated: int = mask_to_bitset(counts.max(axis=1) > 1)
+
+    def from_ids(self, ids: np.ndarray) -> int:
+        """
+        Convert an array of word ids to a bitset.
+
+        Parameters
+        ----------
+        ids : np.ndarray
+            The word ids in the set.
+
+        Returns
+        -------
+        int
+            The bitset with the bit of each id set.
+        """
+        return ids_to_bitset(ids, self.size)
+
+    def to_ids(self, bitset: int) -> np.ndarray:
+        """
+        Convert a bitset to an ascending array of word ids.
+
+        Parameters
+        ----------
+        bitset : int
+            The bitset to convert.
+
+        Returns
+        -------
+        np.ndarray
+            The ids of the words in the set.
+        """
+        return bitset_to_ids(bitset, self.size)
+
+    def count_letter(self, bitset: int, letter: int) -> int:
+        """
+        Count the occurrences of a letter over a set of words.
+
+        Parameters
+        ----------
+        bitset : int
+            The set of words.
+        letter : int
+            The index of the letter, where `A` is 0.
+
+        Returns
+        -------
+        int
+            The total number of times the letter occurs in the words.
+        """
+        return sum((bitset & words[letter]).bit_count() for words in self.at_least)
+
+    def get_first_occurrence(self, bitset: int, letter: int) -> int | None:
+        """
+        Find where a letter first occurs in a set of words, reading the words in order of id.
+
+        Parameters
+        ----------
+        bitset : int
+            The set of words.
+        letter : int
+            The index of the letter, where `A` is 0.
+
+        Returns
+        -------
+        int | None
+            `5 * id + position` of the first occurrence, or None if no word contains the letter.
+        """
+        first = None
+        for i, words in enumerate(self.at):
+            matches = bitset & words[letter]
+            if matches:
+                occurrence = 5 * ((matches & -matches).bit_length() - 1) + i
+                if first is None or occurrence < first:
+                    first = occurrence
+        return first
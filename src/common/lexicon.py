@@ -0,0 +1,207 @@
+"""
+Shared Word List.
+
+This module provides the Lexicon class, an immutable view of a word list together with the
+lookup tables derived from it, and `get_lexicon`, which loads the Wordle word list once per process.
+
+The game, the filters and the bots all share the same Lexicon, so constructing any of them
+does not re-read the word list or recompute anything derived from it.
+"""
+
+import hashlib
+import numpy as np
+from .bitset_index import BitsetIndex
+from .util import get_word_list
+
+# File: common/lexicon.py
+
+MAX_LETTER_COUNT = 5
+
+
+def words_to_letters(words: list[str] | tuple[str, ...]) -> np.ndarray:
+    """
+    Convert a list of 5-letter uppercase words to an `(N, 5)` array of letter indices.
+
+    Parameters
+    ----------
+    words : list[str] | tuple[str, ...]
+        The words to convert.
+
+    Returns
+    -------
+    np.ndarray
+        A `uint8` array where `A` is 0 and `Z` is 25.
+    """
+    return np.frombuffer("".join(words).encode(), dtype=np.uint8).reshape(-1, 5) - ord(
+        "A"
+    )
+
+
+def get_letter_counts(letters: np.ndarray) -> np.ndarray:
+    """
+    Count the occurrences of each letter in each word.
+
+    Parameters
+    ----------
+    letters : np.ndarray
+        An `(N, 5)` array of letter indices.
+
+    Returns
+    -------
+    np.ndarray
+        An `(N, 26)` `uint8` array of letter counts.
+    """
+    counts = np.zeros((len(letters), 26), dtype=np.uint8)
+    rows = np.arange(len(letters))
+    for i in range(5):
+        np.add.at(counts, (rows, letters[:, i]), 1)
+    return counts
+
+
+def get_letter_index(letter: str) -> int:
+    """
+    Get the index of an uppercase letter in the alphabet.
+
+    Parameters
+    ----------
+    letter : str
+        An uppercase letter.
+
+    Returns
+    -------
+    int
+        The index of the letter, where `A` is 0 and `Z` is 25.
+    """
+    return ord(letter) - ord("A")
+
+
+def get_letter_mask(word: str) -> int:
+    """
+    Compute the set of letters in a word as a bitmask.
+
+    Parameters
+    ----------
+    word : str
+        An uppercase word.
+
+    Returns
+    -------
+    int
+        A 26-bit mask where bit `i` is set if the word contains the `i`-th letter of the alphabet.
+    """
+    mask = 0
+    for c in word:
+        mask |= 1 << (ord(c) - ord("A"))
+    return mask
+
+
+class Lexicon:
+    """
+    An immutable word list and the lookup tables derived from it.
+
+    Word ids are indices into the word list, and are shared by every structure indexed by word.
+
+    Attributes
+    ----------
+    words : tuple[str, ...]
+        The words, in the order of the word list.
+    word_list : list[str]
+        The same words as a list, shared with every user of the lexicon. It must not be modified.
+    ids : dict[str, int]
+        A mapping from each word to its id.
+    letters : np.ndarray
+        A read-only `(N, 5)` `uint8` array of letter indices, where `A` is 0.
+    counts : np.ndarray
+        A read-only `(N, 26)` `uint8` array of letter counts.
+    masks : tuple[int, ...]
+        The set of letters of each word as a 26-bit mask.
+    unique_words : list[str]
+        The words that do not repeat any letter, in the order of the word list.
+    bitsets : BitsetIndex
+        An inverted index from letter predicates to bitsets of word ids.
+    hash : str
+        A short digest identifying the word list, used to key caches derived from it.
+    """
+
+    def __init__(self, words: list[str] | tuple[str, ...]) -> None:
+        """
+        Build the lexicon for a word list.
+
+        Parameters
+        ----------
+        words : list[str] | tuple[str, ...]
+            The 5-letter uppercase words, in order.
+        """
+        self.words: tuple[str, ...] = tuple(words)
+        self.word_list: list[str] = list(self.words)
+        self.ids: dict[str, int] = {word: i for i, word in enumerate(self.words)}
+        self.letters: np.ndarray = words_to_letters(self.words)
+        self.letters.setflags(write=False)
+        self.counts: np.ndarray = get_letter_counts(self.letters)
+        self.counts.setflags(write=False)
+        self.masks: tuple[int, ...] = tuple(get_letter_mask(w) for w in self.words)
+        self.unique_words: list[str] = [
+            word
+            for word, mask in zip(self.words, self.masks)
+            if mask.bit_count() == len(word)
+        ]
+        self.bitsets: BitsetIndex = BitsetIndex(self.letters, self.counts)
+        self.hash: str = hashlib.sha1("\n".join(self.words).encode()).hexdigest()[:16]
+
+    def __len__(self) -> int:
+        """Get the number of words in the lexicon."""
+        return len(self.words)
+
+    def __contains__(self, word: object) -> bool:
+        """Check whether a word is in the lexicon, in constant time."""
+        return word in self.ids
+
+    def is_valid_word(self, word: str) -> bool:
+        """
+        Check whether a word is in the lexicon, in constant time.
+
+        Parameters
+        ----------
+        word : str
+            The word to check.
+
+        Returns
+        -------
+        bool
+            True if the word is in the word list, False otherwise.
+        """
+        return word in self.ids
+
+    def get_id(self, word: str) -> int | None:
+        """
+        Look up the id of a word, in constant time.
+
+        Parameters
+        ----------
+        word : str
+            The word to look up.
+
+        Returns
+        -------
+        int | None
+            The index of the word in the word list, or None if it is not a valid word.
+        """
+        return self.ids.get(word)
+
+
+lexicon: Lexicon | None = None
+
+
+def get_lexicon() -> Lexicon:
+    """
+    Get the process-wide lexicon for the Wordle word list, loading it on first use.
+
+    Returns
+    -------
+    Lexicon
+        The shared lexicon.
+    """
+    global lexicon
+    if lexicon is None:
+        lexicon = Lexicon(get_word_list())
+    return lexicon
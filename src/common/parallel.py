@@ -0,0 +1,122 @@
+"""
+Parallel Evaluation of Guesses.
+
+This module provides the map_blocks function, which splits an array of word ids into one block per thread
+and evaluates the blocks at once in a shared thread pool, concatenating the results in order.
+
+Threads rather than processes are used because the costly kernels, indexing the feedback matrix and counting
+and weighing histograms, are NumPy operations that release the GIL, and threads share the feedback matrix and
+the bot's state without copying them. The number of threads defaults to the number of cores, and can be set with
+the `WORDLE_THREADS` environment variable, or with set_thread_count, e.g. to 1 in worker processes that already
+run in parallel.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+import os
+import numpy as np
+
+# File: common/parallel.py
+
+THREADS_VARIABLE = "WORDLE_THREADS"
+# Below this many elements of work, a single thread is faster than splitting the work
+MIN_PARALLEL_ELEMENTS = 1 << 21
+
+thread_count: int | None = None
+executor: ThreadPoolExecutor | None = None
+
+
+def get_thread_count() -> int:
+    """
+    Get the number of threads to evaluate guesses in.
+
+    Returns
+    -------
+    int
+        The number set with set_thread_count, else the `WORDLE_THREADS` environment variable,
+        else the number of cores.
+
+    Raises
+    ------
+    ValueError
+        If the `WORDLE_THREADS` environment variable is set to something else than a whole number.
+    """
+    if thread_count is not None:
+        return thread_count
+    value = os.environ.get(THREADS_VARIABLE, "").strip()
+    if not value:
+        return os.cpu_count() or 1
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise ValueError(
+            f"Invalid {THREADS_VARIABLE} {value!r}, expected a number of threads such as 4"
+        ) from None
+
+
+def set_thread_count(threads: int | None) -> None:
+    """
+    Set the number of threads to evaluate guesses in, replacing the thread pool.
+
+    Parameters
+    ----------
+    threads : int | None
+        The number of threads, or None to return to the default.
+    """
+    global thread_count, executor
+    thread_count = None if threads is None else max(1, threads)
+    if executor is not None:
+        executor.shutdown(wait=False)
+        executor = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool shared by every evaluation, creating it on first use.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+        The thread pool, with one thread per evaluated block.
+    """
+    global executor
+    if executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=get_thread_count(), thread_name_prefix="evaluator"
+        )
+    return executor
+
+
+def map_blocks(
+    function: Callable[[np.ndarray], np.ndarray],
+    ids: np.ndarray,
+    cost: int = 1,
+    min_elements: int | None = None,
+) -> np.ndarray:
+    """
+    Evaluate a function over blocks of ids in parallel, as if over all of them at once.
+
+    Parameters
+    ----------
+    function : Callable[[np.ndarray], np.ndarray]
+        The function, taking ids and returning one row of results per id.
+    ids : np.ndarray
+        The ids.
+    cost : int, optional
+        The elements of work per id, such as the number of secrets each guess is scored against,
+        so small evaluations are not split. Defaults to 1.
+    min_elements : int | None, optional
+        The elements of work below which the ids are evaluated in a single thread,
+        defaults to MIN_PARALLEL_ELEMENTS.
+
+    Returns
+    -------
+    np.ndarray
+        The results for every id, in order.
+    """
+    threads = get_thread_count()
+    min_elements = MIN_PARALLEL_ELEMENTS if min_elements is None else min_elements
+    if threads <= 1 or len(ids) < 2 or len(ids) * cost < min_elements:
+        return function(ids)
+    blocks = np.array_split(ids, min(threads, len(ids)))
+    return np.concatenate(list(get_executor().map(function, blocks)))
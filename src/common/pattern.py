@@ -0,0 +1,214 @@
+"""
+Compact Feedback Patterns.
+
+This module provides the Pattern class, an integer representation of the result of a guess.
+
+A pattern encodes the result of letter `i` as base-3 digit `i`, i.e. `sum(result[i] * 3**i)`,
+so every possible result is a number between 0 and 242. All 243 patterns are interned, and each
+decodes to a shared tuple of digits, so that comparing, hashing and storing results are integer operations
+while code expecting the legacy `list[int]` form can still index, iterate over and compare against them.
+"""
+
+from .util import CORRECT_LETTER, RESULT
+
+# File: common/pattern.py
+
+PATTERN_COUNT = 3**5
+PATTERN_WEIGHTS = tuple(3**i for i in range(5))
+
+
+class Pattern(int):
+    """
+    The result of a guess, encoded as a base-3 integer.
+
+    Instances are interned, so `Pattern(code)` always returns the same object for the same code.
+    Patterns compare equal to the legacy list form of a result, e.g. `Pattern(242) == [2, 2, 2, 2, 2]`.
+
+    Attributes
+    ----------
+    digits : tuple[int, ...]
+        The result of each letter in the guess, shared between all uses of the pattern.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, code: int = 0) -> "Pattern":
+        """
+        Get the interned pattern for a code.
+
+        Parameters
+        ----------
+        code : int, optional
+            The base-3 encoded result, between 0 and 242. Defaults to 0.
+
+        Returns
+        -------
+        Pattern
+            The interned pattern.
+        """
+        return PATTERNS[code]
+
+    @classmethod
+    def from_list(cls, result: list[int] | tuple[int, ...]) -> "Pattern":
+        """
+        Encode the legacy list form of a result as a pattern.
+
+        Parameters
+        ----------
+        result : list[int] | tuple[int, ...]
+            The result of each letter in the guess.
+
+        Returns
+        -------
+        Pattern
+            The interned pattern.
+        """
+        return PATTERNS[sum(r * w for r, w in zip(result, PATTERN_WEIGHTS))]
+
+    @classmethod
+    def from_result(
+        cls, result: "dict | Pattern | list[int] | tuple[int, ...] | int"
+    ) -> "Pattern":
+        """
+        Get the pattern of a result, in any of the forms used throughout the package.
+
+        Parameters
+        ----------
+        result : dict | Pattern | list[int] | tuple[int, ...] | int
+            A result dictionary as returned by `Wordle.guess`, a pattern or code, or the legacy list form.
+
+        Returns
+        -------
+        Pattern
+            The interned pattern.
+        """
+        value = result[RESULT] if isinstance(result, dict) else result
+        if isinstance(value, int):
+            return PATTERNS[value]
+        return cls.from_list(value)
+
+    @property
+    def digits(self) -> tuple[int, ...]:
+        """Get the result of each letter in the guess."""
+        return DIGITS[self]
+
+    def to_list(self) -> list[int]:
+        """
+        Decode the pattern to the legacy list form of a result.
+
+        Returns
+        -------
+        list[int]
+            A new list with the result of each letter in the guess.
+        """
+        return list(DIGITS[self])
+
+    def count(self, value: int) -> int:
+        """
+        Count the letters of the guess with a given result.
+
+        Parameters
+        ----------
+        value : int
+            The result to count, e.g. CORRECT_LETTER.
+
+        Returns
+        -------
+        int
+            The number of letters with that result.
+        """
+        return DIGITS[self].count(value)
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        """Get the result of a letter, or a slice of results as a list, as in the legacy list form."""
+        if isinstance(index, slice):
+            return list(DIGITS[self][index])
+        return DIGITS[self][index]
+
+    def __iter__(self):
+        """Iterate over the result of each letter."""
+        return iter(DIGITS[self])
+
+    def __len__(self) -> int:
+        """Get the number of letters in the pattern."""
+        return 5
+
+    def __contains__(self, value) -> bool:
+        """Check whether any letter has the given result."""
+        return value in DIGITS[self]
+
+    def __eq__(self, other) -> bool:
+        """Compare against another pattern or code, or against the legacy list form."""
+        if isinstance(other, (list, tuple)):
+            return DIGITS[self] == tuple(other)
+        return int.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        """Compare against another pattern or code, or against the legacy list form."""
+        return not self == other
+
+    __hash__ = int.__hash__
+
+    def __str__(self) -> str:
+        """Format the pattern in its legacy list form."""
+        return str(list(DIGITS[self]))
+
+    def __format__(self, format_spec: str) -> str:
+        """Format the pattern in its legacy list form, unless a format is specified."""
+        if format_spec:
+            return int.__format__(self, format_spec)
+        return str(self)
+
+    def __repr__(self) -> str:
+        """Represent the pattern with its legacy list form."""
+        return f"{self.__class__.__name__}({list(DIGITS[self])})"
+
+    def __reduce__(self):
+        """Pickle patterns by code, so they are interned again when unpickled."""
+        return (Pattern, (int(self),))
+
+
+DIGITS: tuple[tuple[int, ...], ...] = tuple(
+    tuple((code // w) % 3 for w in PATTERN_WEIGHTS) for code in range(PATTERN_COUNT)
+)
+PATTERNS: tuple[Pattern, ...] = tuple(
+    int.__new__(Pattern, code) for code in range(PATTERN_COUNT)
+)
+ALL_CORRECT = Pattern.from_list([CORRECT_LETTER for _ in range(5)])
+
+
+def score_guess(guess: str, secret: str) -> Pattern:
+    """
+    Compute the result of a guess against a secret word.
+
+    Letters in the correct position are marked first, then the remaining occurrences of each
+    letter in the secret are handed out as misplaced letters from left to right.
+    Only the letters both words have are compared, so the letters past the end of a shorter word,
+    such as the empty secret of a game that was not started, are incorrect.
+
+    Parameters
+    ----------
+    guess : str
+        The guessed word.
+    secret : str
+        The secret word.
+
+    Returns
+    -------
+    Pattern
+        The interned pattern for the result.
+    """
+    code = 0
+    unmatched = ""
+    length = min(len(guess), len(secret), 5)
+    for i in range(length):
+        if guess[i] == secret[i]:
+            code += 2 * PATTERN_WEIGHTS[i]
+        else:
+            unmatched += secret[i]
+    for i in range(length):
+        letter = guess[i]
+        if letter != secret[i] and letter in unmatched:
+            unmatched = unmatched.replace(letter, "", 1)
+            code += PATTERN_WEIGHTS[i]
+    return PATTERNS[code]
@@ -0,0 +1,849 @@
+"""
+Precomputed Feedback Matrix.
+
+This module provides the PatternMatrix class, which holds the Wordle feedback for every
+(guess, secret) pair of a word list as base-3 encoded `uint8` codes.
+
+The matrix is built once, saved to the user's cache directory keyed by a hash of the word list, and
+memory-mapped on later runs so that startup is near-instant and multiple processes share the same pages.
+Feedback codes use the same encoding as the Pattern class.
+
+On hosts without room for the full matrix, the TiledPatternMatrix stores blocks of rows compressed on disk
+and keeps a bounded number of them decompressed, and the PatternKernel computes the feedback on the fly.
+All three answer the same lookups, and get_pattern_matrix picks the one that fits the memory budget.
+"""
+
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import threading
+import zlib
+import numpy as np
+from .lexicon import Lexicon, get_lexicon
+from .pattern import PATTERN_COUNT, PATTERNS, Pattern
+from .util import get_cache_dir
+
+# File: common/pattern_matrix.py
+
+PATTERN_WEIGHTS = np.array([3**i for i in range(5)], dtype=np.uint8)
+HISTOGRAM_BLOCK_ELEMENTS = 1 << 22
+TILE_ROWS = 256
+TILES_MAGIC = b"WTILES01"
+TILES_HEADER = np.dtype(
+    [
+        ("magic", "S8"),
+        ("lexicon", "S16"),
+        ("rows", "<u4"),
+        ("tile_rows", "<u4"),
+        ("tiles", "<u4"),
+        ("reserved", "<u4"),
+    ]
+)
+MEMORY_BUDGET_VARIABLE = "WORDLE_MEMORY_BUDGET"
+SIZE_SUFFIXES = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+# Scoring a guess against a secret costs about as much as decompressing this many codes
+KERNEL_SECRET_COST = 32
+
+
+def score_row(guess: np.ndarray, secrets: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Compute the feedback codes of one guess against many secrets.
+
+    Letters in the correct position are marked first, then the remaining occurrences of each
+    letter in the secret are handed out as misplaced letters from left to right.
+
+    Parameters
+    ----------
+    guess : np.ndarray
+        A `(5,)` array of letter indices for the guessed word.
+    secrets : np.ndarray
+        An `(M, 5)` array of letter indices for the secret words.
+    counts : np.ndarray
+        An `(M, 26)` array of letter counts for the secret words.
+
+    Returns
+    -------
+    np.ndarray
+        An `(M,)` `uint8` array of feedback codes.
+    """
+    correct = secrets == guess
+    codes = (correct * (2 * PATTERN_WEIGHTS)).sum(axis=1, dtype=np.uint8)
+    for i in range(5):
+        same_letter = guess == guess[i]
+        available = counts[:, guess[i]] - correct[:, same_letter].sum(
+            axis=1, dtype=np.uint8
+        )
+        used = (~correct[:, :i][:, same_letter[:i]]).sum(axis=1, dtype=np.uint8)
+        misplaced = ~correct[:, i] & (available > used)
+        codes += misplaced * PATTERN_WEIGHTS[i]
+    return codes
+
+
+def score_block(
+    guesses: np.ndarray, secrets: np.ndarray, counts: np.ndarray
+) -> np.ndarray:
+    """
+    Compute the feedback codes of many guesses against many secrets, with the same rules as score_row.
+
+    Parameters
+    ----------
+    guesses : np.ndarray
+        A `(G, 5)` array of letter indices for the guessed words.
+    secrets : np.ndarray
+        An `(M, 5)` array of letter indices for the secret words.
+    counts : np.ndarray
+        An `(M, 26)` array of letter counts for the secret words.
+
+    Returns
+    -------
+    np.ndarray
+        A `(G, M)` `uint8` array of feedback codes.
+    """
+    correct = guesses[:, None, :] == secrets[None, :, :]
+    codes = (correct * (2 * PATTERN_WEIGHTS)).sum(axis=2, dtype=np.uint8)
+    for i in range(5):
+        same_letter = (guesses == guesses[:, i : i + 1])[:, None, :]
+        available = counts[:, guesses[:, i]].T - (correct & same_letter).sum(
+            axis=2, dtype=np.uint8
+        )
+        used = (~correct[:, :, :i] & same_letter[:, :, :i]).sum(axis=2, dtype=np.uint8)
+        misplaced = ~correct[:, :, i] & (available > used)
+        codes += misplaced * PATTERN_WEIGHTS[i]
+    return codes
+
+
+def score_pairs(
+    guesses: np.ndarray, secrets: np.ndarray, counts: np.ndarray
+) -> np.ndarray:
+    """
+    Compute the feedback codes of guesses against secrets pairwise, with the same rules as score_row.
+
+    Parameters
+    ----------
+    guesses : np.ndarray
+        A `(K, 5)` array of letter indices for the guessed words.
+    secrets : np.ndarray
+        A `(K, 5)` array of letter indices for the secret words.
+    counts : np.ndarray
+        A `(K, 26)` array of letter counts for the secret words.
+
+    Returns
+    -------
+    np.ndarray
+        A `(K,)` `uint8` array where entry `k` is the feedback code of guess `k` against secret `k`.
+    """
+    correct = guesses == secrets
+    codes = (correct * (2 * PATTERN_WEIGHTS)).sum(axis=1, dtype=np.uint8)
+    rows = np.arange(len(guesses))
+    for i in range(5):
+        same_letter = guesses == guesses[:, i : i + 1]
+        available = counts[rows, guesses[:, i]] - (correct & same_letter).sum(
+            axis=1, dtype=np.uint8
+        )
+        used = (~correct[:, :i] & same_letter[:, :i]).sum(axis=1, dtype=np.uint8)
+        misplaced = ~correct[:, i] & (available > used)
+        codes += misplaced * PATTERN_WEIGHTS[i]
+    return codes
+
+
+def score_many(
+    guess_id: int,
+    candidate_ids: np.ndarray | None = None,
+    lexicon: Lexicon | None = None,
+) -> np.ndarray:
+    """
+    Compute the feedback codes of one guess against many secrets, without a precomputed matrix.
+
+    This works for word lists of any size, including those too large to tabulate.
+
+    Parameters
+    ----------
+    guess_id : int
+        The id of the guessed word.
+    candidate_ids : np.ndarray | None, optional
+        The ids of the secret words, defaults to every word.
+    lexicon : Lexicon | None, optional
+        The word list the ids refer to, defaults to the shared Wordle lexicon.
+
+    Returns
+    -------
+    np.ndarray
+        A `uint8` array of feedback codes, one per secret.
+    """
+    lexicon = get_lexicon() if lexicon is None else lexicon
+    letters, counts = lexicon.letters, lexicon.counts
+    if candidate_ids is None:
+        return score_row(letters[guess_id], letters, counts)
+    return score_row(letters[guess_id], letters[candidate_ids], counts[candidate_ids])
+
+
+def build_pattern_matrix(lexicon: Lexicon) -> np.ndarray:
+    """
+    Build the full feedback matrix for a word list.
+
+    Parameters
+    ----------
+    lexicon : Lexicon
+        The word list, used both as guesses and as secrets.
+
+    Returns
+    -------
+    np.ndarray
+        An `(N, N)` `uint8` array where entry `[g, s]` is the feedback code of guess `g` against secret `s`.
+    """
+    matrix = np.empty((len(lexicon), len(lexicon)), dtype=np.uint8)
+    for i, guess in enumerate(lexicon.letters):
+        matrix[i] = score_row(guess, lexicon.letters, lexicon.counts)
+    return matrix
+
+
+class PatternKernel:
+    """
+    Feedback for a word list, computed on the fly from its letter tables without any storage.
+
+    It is the base of the stored matrices, which look the feedback up instead by overriding get_codes and get_row.
+
+    Attributes
+    ----------
+    logger : logging.Logger
+        A logger instance for logging cache events.
+    lexicon : Lexicon
+        The word list, which defines the word ids.
+    """
+
+    def __init__(self, lexicon: Lexicon | None = None) -> None:
+        """
+        Initialize the kernel for a word list.
+
+        Parameters
+        ----------
+        lexicon : Lexicon | None, optional
+            The word list, defaults to the shared Wordle lexicon.
+        """
+        self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
+        self.lexicon: Lexicon = get_lexicon() if lexicon is None else lexicon
+
+    def get_codes(
+        self, guess_ids: np.ndarray | None = None, secret_ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Get the feedback codes of many guesses against many secrets.
+
+        Parameters
+        ----------
+        guess_ids : np.ndarray | None, optional
+            The ids of the guessed words, defaults to every word.
+        secret_ids : np.ndarray | None, optional
+            The ids of the secret words, defaults to every word.
+
+        Returns
+        -------
+        np.ndarray
+            A `(G, M)` `uint8` array where entry `[i, j]` is the feedback code of guess `guess_ids[i]`
+            against secret `secret_ids[j]`.
+        """
+        letters, counts = self.lexicon.letters, self.lexicon.counts
+        guesses = letters if guess_ids is None else letters[guess_ids]
+        if secret_ids is not None:
+            letters, counts = letters[secret_ids], counts[secret_ids]
+        codes = np.empty((len(guesses), len(letters)), dtype=np.uint8)
+        block_size = max(1, HISTOGRAM_BLOCK_ELEMENTS // (5 * max(1, len(letters))))
+        for start in range(0, len(guesses), block_size):
+            codes[start : start + block_size] = score_block(
+                guesses[start : start + block_size], letters, counts
+            )
+        return codes
+
+    def get_row(
+        self, guess_id: int, secret_ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Get the feedback codes of a guess against many secrets.
+
+        Parameters
+        ----------
+        guess_id : int
+            The id of the guessed word.
+        secret_ids : np.ndarray | None, optional
+            The ids of the secret words, defaults to every word.
+
+        Returns
+        -------
+        np.ndarray
+            A `uint8` array of feedback codes, one per secret.
+        """
+        return score_many(guess_id, secret_ids, self.lexicon)
+
+    def get_pairs(self, guess_ids: np.ndarray, secret_ids: np.ndarray) -> np.ndarray:
+        """
+        Get the feedback codes of guesses against secrets pairwise.
+
+        Parameters
+        ----------
+        guess_ids : np.ndarray
+            The ids of the guessed words.
+        secret_ids : np.ndarray
+            The ids of the secret words, one per guess.
+
+        Returns
+        -------
+        np.ndarray
+            A `uint8` array where entry `k` is the feedback code of guess `guess_ids[k]` against
+            secret `secret_ids[k]`.
+        """
+        letters, counts = self.lexicon.letters, self.lexicon.counts
+        return score_pairs(letters[guess_ids], letters[secret_ids], counts[secret_ids])
+
+    def get_pattern(self, guess_id: int, secret_id: int) -> Pattern:
+        """
+        Look up the feedback for a guess against a secret.
+
+        Parameters
+        ----------
+        guess_id : int
+            The id of the guessed word.
+        secret_id : int
+            The id of the secret word.
+
+        Returns
+        -------
+        Pattern
+            The interned feedback pattern.
+        """
+        return PATTERNS[self.get_row(guess_id, np.array([secret_id]))[0]]
+
+    def get_pattern_for_words(self, guess: str, secret: str) -> Pattern:
+        """
+        Look up the feedback for a guessed word against a secret word.
+
+        Parameters
+        ----------
+        guess : str
+            The guessed word.
+        secret : str
+            The secret word.
+
+        Returns
+        -------
+        Pattern
+            The interned feedback pattern.
+        """
+        return self.get_pattern(self.lexicon.ids[guess], self.lexicon.ids[secret])
+
+    def get_histograms(
+        self, secret_ids: np.ndarray, guess_ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Count how many secrets fall into each feedback bucket, for many guesses at once.
+
+        The guesses are processed in blocks, offsetting the codes of each guess in a block by
+        `PATTERN_COUNT` times its row so that a single `np.bincount` counts the whole block.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ids of the remaining secret words.
+        guess_ids : np.ndarray | None, optional
+            The ids of the guesses to count for, defaults to every word.
+
+        Returns
+        -------
+        np.ndarray
+            A `(G, PATTERN_COUNT)` array where entry `[i, p]` is the number of secrets for which
+            guess `guess_ids[i]` gives feedback code `p`.
+        """
+        if guess_ids is None:
+            guess_ids = np.arange(len(self.lexicon))
+        histograms = np.empty((len(guess_ids), PATTERN_COUNT), dtype=np.int64)
+        block_size = max(1, HISTOGRAM_BLOCK_ELEMENTS // max(1, len(secret_ids)))
+        block_size = min(block_size, max(1, len(guess_ids)))
+        offsets = np.arange(block_size, dtype=np.intp)[:, None] * PATTERN_COUNT
+        for start in range(0, len(guess_ids), block_size):
+            block = guess_ids[start : start + block_size]
+            codes = self.get_codes(block, secret_ids) + offsets[: len(block)]
+            histograms[start : start + len(block)] = np.bincount(
+                codes.ravel(), minlength=len(block) * PATTERN_COUNT
+            ).reshape(len(block), PATTERN_COUNT)
+        return histograms
+
+
+class PatternMatrix(PatternKernel):
+    """
+    A feedback matrix for a word list, persisted to disk and memory-mapped.
+
+    Attributes
+    ----------
+    path : str
+        The location of the cached matrix on disk.
+    matrix : np.ndarray
+        The `(N, N)` feedback matrix, indexed by `[guess_id, secret_id]`.
+    """
+
+    def __init__(
+        self, lexicon: Lexicon | None = None, cache_dir: str | None = None
+    ) -> None:
+        """
+        Load the feedback matrix for a word list, building and caching it if necessary.
+
+        Parameters
+        ----------
+        lexicon : Lexicon | None, optional
+            The word list, defaults to the shared Wordle lexicon.
+        cache_dir : str | None, optional
+            The directory to cache the matrix in, defaults to the user's cache directory (see `get_cache_dir`).
+        """
+        super().__init__(lexicon)
+        if cache_dir is None:
+            cache_dir = get_cache_dir()
+        self.path: str = os.path.join(
+            cache_dir, f"wordle_word_list.{self.lexicon.hash}.npy"
+        )
+        if not os.path.exists(self.path):
+            self.save()
+        self.matrix: np.ndarray = np.load(self.path, mmap_mode="r")
+
+    def save(self) -> None:
+        """
+        Build the matrix and write it to the cache path.
+
+        The matrix is written to a temporary file first and moved into place, so that
+        concurrent processes never observe a partially written cache.
+        """
+        self.logger.info(f"Building feedback matrix for {len(self.lexicon)} words")
+        matrix = build_pattern_matrix(self.lexicon)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            np.save(f, matrix)
+        os.replace(temp_path, self.path)
+        self.logger.info(f"Saved feedback matrix to {self.path}")
+
+    def get_codes(
+        self, guess_ids: np.ndarray | None = None, secret_ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Look up the feedback codes of many guesses against many secrets.
+
+        Parameters
+        ----------
+        guess_ids : np.ndarray | None, optional
+            The ids of the guessed words, defaults to every word.
+        secret_ids : np.ndarray | None, optional
+            The ids of the secret words, defaults to every word.
+
+        Returns
+        -------
+        np.ndarray
+            A `(G, M)` `uint8` array of feedback codes.
+        """
+        if guess_ids is None:
+            return self.matrix if secret_ids is None else self.matrix[:, secret_ids]
+        if secret_ids is None:
+            return self.matrix[guess_ids]
+        return self.matrix[np.ix_(guess_ids, secret_ids)]
+
+    def get_row(
+        self, guess_id: int, secret_ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Look up the feedback codes of a guess against many secrets.
+
+        Parameters
+        ----------
+        guess_id : int
+            The id of the guessed word.
+        secret_ids : np.ndarray | None, optional
+            The ids of the secret words, defaults to every word.
+
+        Returns
+        -------
+        np.ndarray
+            A `uint8` array of feedback codes, indexed by secret id if every secret is scored.
+        """
+        if secret_ids is None:
+            return self.matrix[guess_id]
+        return self.matrix[guess_id, secret_ids]
+
+    def get_pairs(self, guess_ids: np.ndarray, secret_ids: np.ndarray) -> np.ndarray:
+        """
+        Look up the feedback codes of guesses against secrets pairwise.
+
+        Parameters
+        ----------
+        guess_ids : np.ndarray
+            The ids of the guessed words.
+        secret_ids : np.ndarray
+            The ids of the secret words, one per guess.
+
+        Returns
+        -------
+        np.ndarray
+            A `uint8` array of feedback codes, one per pair.
+        """
+        return self.matrix[guess_ids, secret_ids]
+
+    def get_pattern(self, guess_id: int, secret_id: int) -> Pattern:
+        """
+        Look up the feedback for a guess against a secret.
+
+        Parameters
+        ----------
+        guess_id : int
+            The id of the guessed word.
+        secret_id : int
+            The id of the secret word.
+
+        Returns
+        -------
+        Pattern
+            The interned feedback pattern.
+        """
+        return PATTERNS[self.matrix[guess_id, secret_id]]
+
+
+class TiledPatternMatrix(PatternKernel):
+    """
+    A feedback matrix stored as compressed tiles of rows, of which a bounded number are kept decompressed.
+
+    The tiles are built once and saved to the user's cache directory in a single file: a fixed header, the ids of the
+    stored guesses as `uint32`, the offsets of the tiles as `uint64`, then each tile compressed with zlib.
+    The file is memory-mapped and tiles are decompressed on first use into a least recently used cache.
+    Only the rows of a subset of guesses can be stored, and the feedback of other guesses is computed on the fly.
+
+    Attributes
+    ----------
+    path : str
+        The location of the tiles on disk.
+    guess_ids : np.ndarray
+        The ascending ids of the guesses whose rows are stored.
+    rows : np.ndarray
+        The row of each word id among the stored rows, or -1 if its row is not stored.
+    tile_rows : int
+        The number of rows per tile.
+    max_tiles : int
+        The maximum number of tiles kept decompressed.
+    tiles : OrderedDict[int, np.ndarray]
+        The decompressed tiles, from least to most recently used.
+    lock : threading.Lock
+        Guards the cache of tiles, so the matrix can be shared by threads.
+    data : np.ndarray
+        The memory-mapped file.
+    offsets : np.ndarray
+        The offsets of the compressed tiles in the file, with one extra entry for the end of the last tile.
+    """
+
+    def __init__(
+        self,
+        lexicon: Lexicon | None = None,
+        cache_dir: str | None = None,
+        guess_ids: np.ndarray | None = None,
+        max_tiles: int = 16,
+        tile_rows: int = TILE_ROWS,
+    ) -> None:
+        """
+        Load the tiles for a word list, building and saving them if necessary.
+
+        Parameters
+        ----------
+        lexicon : Lexicon | None, optional
+            The word list, defaults to the shared Wordle lexicon.
+        cache_dir : str | None, optional
+            The directory to cache the tiles in, defaults to the user's cache directory (see `get_cache_dir`).
+        guess_ids : np.ndarray | None, optional
+            The ids of the guesses whose rows are stored, defaults to every word.
+        max_tiles : int, optional
+            The maximum number of tiles kept decompressed, defaults to 16.
+        tile_rows : int, optional
+            The number of rows per tile when building the tiles, defaults to `TILE_ROWS`.
+
+        Raises
+        ------
+        ValueError
+            If the cached file is not a tile file, or was built for a different word list.
+        """
+        super().__init__(lexicon)
+        n = len(self.lexicon)
+        self.guess_ids: np.ndarray = (
+            np.arange(n) if guess_ids is None else np.unique(guess_ids)
+        )
+        self.rows: np.ndarray = np.full(n, -1, dtype=np.intp)
+        self.rows[self.guess_ids] = np.arange(len(self.guess_ids))
+        if cache_dir is None:
+            cache_dir = get_cache_dir()
+        subset = (
+            "all"
+            if guess_ids is None
+            else hashlib.sha1(self.guess_ids.astype("<u4").tobytes()).hexdigest()[:16]
+        )
+        self.path: str = os.path.join(
+            cache_dir, f"wordle_tiles.{self.lexicon.hash}.{subset}.bin"
+        )
+        self.tile_rows: int = tile_rows
+        self.max_tiles: int = max(1, max_tiles)
+        self.tiles: OrderedDict[int, np.ndarray] = OrderedDict()
+        self.lock = threading.Lock()
+        if not os.path.exists(self.path):
+            self.save()
+        self.load()
+
+    def save(self) -> None:
+        """
+        Build the tiles and write them to the cache path.
+
+        The tiles are written to a temporary file first and moved into place, so that
+        concurrent processes never observe a partially written cache.
+        """
+        self.logger.info(
+            f"Building {len(self.guess_ids)} feedback rows in tiles of {self.tile_rows}"
+        )
+        tiles = [
+            zlib.compress(
+                PatternKernel.get_codes(
+                    self, self.guess_ids[start : start + self.tile_rows]
+                ).tobytes()
+            )
+            for start in range(0, len(self.guess_ids), self.tile_rows)
+        ]
+        header = np.zeros(1, dtype=TILES_HEADER)
+        header["magic"] = TILES_MAGIC
+        header["lexicon"] = self.lexicon.hash.encode()
+        header["rows"] = len(self.guess_ids)
+        header["tile_rows"] = self.tile_rows
+        header["tiles"] = len(tiles)
+        offsets = np.cumsum([0] + [len(tile) for tile in tiles]).astype("<u8")
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(header.tobytes())
+            f.write(self.guess_ids.astype("<u4").tobytes())
+            f.write(offsets.tobytes())
+            for tile in tiles:
+                f.write(tile)
+        os.replace(temp_path, self.path)
+        self.logger.info(f"Saved {offsets[-1]} bytes of tiles to {self.path}")
+
+    def load(self) -> None:
+        """
+        Memory-map the tiles from the cache path.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a tile file, or was built for a different word list.
+        """
+        data = np.memmap(self.path, dtype=np.uint8, mode="r")
+        header = data[: TILES_HEADER.itemsize].view(TILES_HEADER)[0]
+        if header["magic"] != TILES_MAGIC:
+            raise ValueError(f"{self.path} is not a tile file")
+        if header["lexicon"].decode() != self.lexicon.hash:
+            raise ValueError(f"{self.path} was built for a different word list")
+        rows, tiles = int(header["rows"]), int(header["tiles"])
+        self.tile_rows = int(header["tile_rows"])
+        offset = TILES_HEADER.itemsize + 4 * rows
+        self.offsets = data[offset : offset + 8 * (tiles + 1)].view("<u8")
+        self.data = data[offset + 8 * (tiles + 1) :]
+        self.tiles.clear()
+
+    def get_tile(self, tile: int) -> np.ndarray:
+        """
+        Get a tile of rows, decompressing it if it is not cached and evicting the least recently used tile.
+
+        Parameters
+        ----------
+        tile : int
+            The index of the tile.
+
+        Returns
+        -------
+        np.ndarray
+            The `(R, N)` feedback codes of the tile's rows.
+        """
+        with self.lock:
+            if tile in self.tiles:
+                self.tiles.move_to_end(tile)
+                return self.tiles[tile]
+        start, end = int(self.offsets[tile]), int(self.offsets[tile + 1])
+        codes = np.frombuffer(
+            zlib.decompress(self.data[start:end].tobytes()), dtype=np.uint8
+        )
+        codes = codes.reshape(-1, len(self.lexicon))
+        with self.lock:
+            self.tiles[tile] = codes
+            if len(self.tiles) > self.max_tiles:
+                self.tiles.popitem(last=False)
+        return codes
+
+    def get_codes(
+        self, guess_ids: np.ndarray | None = None, secret_ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Look up the feedback codes of many guesses against many secrets, one tile at a time.
+
+        Rows of tiles that are not decompressed are computed on the fly instead when there are few secrets.
+
+        Parameters
+        ----------
+        guess_ids : np.ndarray | None, optional
+            The ids of the guessed words, defaults to every word.
+        secret_ids : np.ndarray | None, optional
+            The ids of the secret words, defaults to every word.
+
+        Returns
+        -------
+        np.ndarray
+            A `(G, M)` `uint8` array of feedback codes.
+        """
+        if guess_ids is None:
+            guess_ids = np.arange(len(self.lexicon))
+        size = len(self.lexicon) if secret_ids is None else len(secret_ids)
+        codes = np.empty((len(guess_ids), size), dtype=np.uint8)
+        rows = self.rows[guess_ids]
+        stored = rows >= 0
+        if not stored.all():
+            codes[~stored] = super().get_codes(guess_ids[~stored], secret_ids)
+        # Against few secrets, scoring rows is cheaper than decompressing tiles that are not cached
+        cheap = size * KERNEL_SECRET_COST < len(self.lexicon)
+        tiles = rows // self.tile_rows
+        for tile in np.unique(tiles[stored]).tolist():
+            selected = np.flatnonzero(stored & (tiles == tile))
+            if cheap and tile not in self.tiles:
+                codes[selected] = super().get_codes(guess_ids[selected], secret_ids)
+                continue
+            block = self.get_tile(tile)[rows[selected] % self.tile_rows]
+            codes[selected] = block if secret_ids is None else block[:, secret_ids]
+        return codes
+
+    def get_row(
+        self, guess_id: int, secret_ids: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Look up the feedback codes of a guess against many secrets.
+
+        Parameters
+        ----------
+        guess_id : int
+            The id of the guessed word.
+        secret_ids : np.ndarray | None, optional
+            The ids of the secret words, defaults to every word.
+
+        Returns
+        -------
+        np.ndarray
+            A `uint8` array of feedback codes, one per secret.
+        """
+        row = int(self.rows[guess_id])
+        if row < 0:
+            return super().get_row(guess_id, secret_ids)
+        codes = self.get_tile(row // self.tile_rows)[row % self.tile_rows]
+        return codes if secret_ids is None else codes[secret_ids]
+
+
+def get_memory_budget() -> int | None:
+    """
+    Get the configured memory budget for the feedback lookups of a process.
+
+    Returns
+    -------
+    int | None
+        The number of bytes set in the `WORDLE_MEMORY_BUDGET` environment variable, or None for no budget.
+    """
+    budget = os.environ.get(MEMORY_BUDGET_VARIABLE, "").strip()
+    return parse_size(budget, MEMORY_BUDGET_VARIABLE) if budget else None
+
+
+def parse_size(value: str, name: str) -> int:
+    """
+    Parse a number of bytes, optionally with a binary suffix such as `256M` or `1GiB`.
+
+    Parameters
+    ----------
+    value : str
+        The number of bytes, followed by an optional K, M, G or T suffix, which may end in B or iB.
+    name : str
+        The name of the setting, for the error message.
+
+    Returns
+    -------
+    int
+        The number of bytes.
+
+    Raises
+    ------
+    ValueError
+        If the value is not a non-negative number of bytes.
+    """
+    text = value.strip().upper().removesuffix("B").removesuffix("I")
+    number, suffix = text.rstrip("KMGT"), text[len(text.rstrip("KMGT")) :]
+    try:
+        size = float(number) * SIZE_SUFFIXES[suffix]
+    except (KeyError, ValueError):
+        size = -1
+    if not 0 <= size < float("inf"):
+        raise ValueError(
+            f"Invalid {name} {value!r}, expected a number of bytes such as 268435456 or 256M"
+        )
+    return int(size)
+
+
+def select_pattern_matrix(
+    lexicon: Lexicon | None = None,
+    memory_budget: int | None = None,
+    guess_ids: np.ndarray | None = None,
+    cache_dir: str | None = None,
+) -> PatternKernel:
+    """
+    Pick the feedback lookup that fits a memory budget.
+
+    The full matrix is used if it fits, otherwise as many tiles of a TiledPatternMatrix as fit,
+    or the PatternKernel if not even one tile fits.
+
+    Parameters
+    ----------
+    lexicon : Lexicon | None, optional
+        The word list, defaults to the shared Wordle lexicon.
+    memory_budget : int | None, optional
+        The number of bytes of feedback codes to keep in memory, defaults to no limit.
+    guess_ids : np.ndarray | None, optional
+        The ids of the guesses whose rows are stored, defaults to every word.
+        A subset of guesses is always stored in tiles.
+    cache_dir : str | None, optional
+        The directory to cache the feedback in, defaults to the user's cache directory.
+
+    Returns
+    -------
+    PatternKernel
+        The feedback lookup.
+    """
+    lexicon = get_lexicon() if lexicon is None else lexicon
+    n = len(lexicon)
+    if guess_ids is None and (memory_budget is None or n * n <= memory_budget):
+        return PatternMatrix(lexicon, cache_dir)
+    rows = n if guess_ids is None else len(np.unique(guess_ids))
+    tile_bytes = min(TILE_ROWS, rows) * n
+    if memory_budget is None:
+        return TiledPatternMatrix(lexicon, cache_dir, guess_ids, max_tiles=n)
+    if memory_budget >= tile_bytes:
+        return TiledPatternMatrix(
+            lexicon, cache_dir, guess_ids, max_tiles=memory_budget // tile_bytes
+        )
+    return PatternKernel(lexicon)
+
+
+pattern_matrix: PatternKernel | None = None
+
+
+def get_pattern_matrix() -> PatternKernel:
+    """
+    Get the process-wide feedback lookup for the shared Wordle lexicon, loading it on first use.
+
+    The lookup is the one that fits the memory budget set in the `WORDLE_MEMORY_BUDGET` environment variable,
+    which is the full feedback matrix if it is not set.
+
+    Returns
+    -------
+    PatternKernel
+        The shared feedback lookup.
+    """
+    global pattern_matrix
+    if pattern_matrix is None:
+        pattern_matrix = select_pattern_matrix(memory_budget=get_memory_budget())
+    return pattern_matrix
@@ -4,10 +4,11 @@ Utility Functions and Constants.
 This module provides various utility functions and constants used throughout the Wordle bot application.
 
 It includes functions for reading a word list, formatting guesses with ANSI color coding,
-and generating boolean comprehensions for lists.
+generating boolean comprehensions for lists, and locating the directory that caches are written to.
 """
 
 import os
+from typing import Iterable
 
 # File: common/util.py
 
@@ -20,7 +21,7 @@ CORRECT_LETTER = 2
 
 LOG_FILE = "wordle.ansi"
 
-ALL_CORRECT = [CORRECT_LETTER for _ in range(5)]
+CACHE_DIR_VARIABLE = "WORDLE_CACHE_DIR"
 
 
 def boolean_comprehension(
@@ -66,7 +67,27 @@ def get_word_list() -> list[str]:
         return [word.strip().upper() for word in f.readlines()]
 
 
-def prettify_guess(guess: str, result: list[int]) -> str:
+def get_cache_dir() -> str:
+    """
+    Get the directory that feedback matrices, strategies and opening books are cached in, creating it if needed.
+
+    Returns
+    -------
+    str
+        The `WORDLE_CACHE_DIR` environment variable if set, else `wordle_bot` in `$XDG_CACHE_HOME`,
+        which defaults to `~/.cache`.
+    """
+    directory = os.environ.get(CACHE_DIR_VARIABLE)
+    if not directory:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        directory = os.path.join(cache_home, "wordle_bot")
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def prettify_guess(guess: str, result: Iterable[int]) -> str:
     """
     Format a guess with ANSI color coding based on the result.
 
@@ -74,8 +95,8 @@ def prettify_guess(guess: str, result: list[int]) -> str:
     ----------
     guess : str
         The guessed word.
-    result : list[int]
-        A list of integers representing the result of the guess, where:
+    result : Iterable[int]
+        A Pattern, or a list of integers representing the result of the guess, where:
         - 0 indicates an incorrect letter,
         - 1 indicates a misplaced letter,
         - 2 indicates a correct letter.
@@ -100,7 +121,7 @@ def prettify_guess(guess: str, result: list[int]) -> str:
     return s + end
 
 
-def prettify_guess_no_color(guess: str, result: list[int]) -> str:
+def prettify_guess_no_color(guess: str, result: Iterable[int]) -> str:
     """
     Format a guess without ANSI color coding based on the result.
 
@@ -108,8 +129,8 @@ def prettify_guess_no_color(guess: str, result: list[int]) -> str:
     ----------
     guess : str
         The guessed word.
-    result : list[int]
-        A list of integers representing the result of the guess, where:
+    result : Iterable[int]
+        A Pattern, or a list of integers representing the result of the guess, where:
         - 0 indicates an incorrect letter,
         - 1 indicates a misplaced letter,
         - 2 indicates a correct letter.
@@ -119,7 +140,7 @@ def prettify_guess_no_color(guess: str, result: list[int]) -> str:
     str
         The formatted guess without color coding.
     """
-    return f"{guess}\t{result}"
+    return f"{guess}\t{list(result)}"
 
 
 def get_all_subclasses(clazz: type):
@@ -6,7 +6,7 @@ to play a wordle game with a bot of choice.
 """
 
 from tester import WordleTester
-from bots import BotBehaviors
+from bots import BotBehaviors, CompiledBot
 from common.util import LOG_FILE, get_all_subclasses
 from cli import Cli
 from cli.util import get_bot_selection, get_choice_from_prompt
@@ -51,19 +51,63 @@ def run_tests() -> None:
         selection: int = get_bot_selection(bots)
         choice: int = get_choice_from_prompt("Print failures?", ["No", "Yes"])
         print_failures: bool = choice == 1
-        WordleTester().test(bots[selection](), print_failures=print_failures)
+        choice = get_choice_from_prompt(
+            "Share turns between games? (deterministic bots only)", ["No", "Yes"]
+        )
+        WordleTester().test(
+            bots[selection](),
+            print_failures=print_failures,
+            workers=os.cpu_count() or 1,
+            share_prefixes=choice == 1,
+        )
         print("Run another test? (y/N)")
         again = input("> ").strip().lower()
         if again != "y":
             break
 
 
+def run_benchmark() -> None:
+    """
+    Measure the per-turn latency of a bot of choice using WordleTester().
+
+    Parameters
+    ----------
+        None
+
+    Returns
+    -------
+        None
+    """
+    bots = get_all_subclasses(BotBehaviors)
+    selection: int = get_bot_selection(bots)
+    WordleTester().benchmark(bots[selection]())
+
+
+def run_compile() -> None:
+    """
+    Compile a bot of choice into a strategy file, to be replayed by a CompiledBot.
+
+    Parameters
+    ----------
+        None
+
+    Returns
+    -------
+        None
+    """
+    bots = get_all_subclasses(BotBehaviors)
+    selection: int = get_bot_selection(bots)
+    compiled = CompiledBot(bots[selection]())
+    strategy = compiled.get_strategy()
+    print(f"Compiled {len(strategy)} guesses to {compiled.path}")
+
+
 def main():
     """Main function to run the Wordle bot or tests."""
     while True:
         choice: int = get_choice_from_prompt(
             "What would you like to do?",
-            ["Play a game", "Run tests", "Quit"],
+            ["Play a game", "Run tests", "Benchmark a bot", "Compile a bot", "Quit"],
             has_default=False,
         )
         if choice == 0:
@@ -72,6 +116,10 @@ def main():
         elif choice == 1:
             run_tests()
         elif choice == 2:
+            run_benchmark()
+        elif choice == 3:
+            run_compile()
+        elif choice == 4:
             break
 
 
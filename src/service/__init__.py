@@ -0,0 +1,14 @@
+"""
+Module for the Solver Service.
+
+This module initializes the solver service, which lets other programs play bots over a local socket.
+
+It imports the SolverService class, which answers start-session, submit-result, get-suggestion and
+stateless-solve requests, the serve function, which runs the service, the BotPool class,
+which lends reusable bots to the service's threads, and the SessionStore class, which keeps the sessions
+within a memory cap and spills the rest to SQLite, serialized with encode_state.
+"""
+
+from .bot_pool import BotPool
+from .session_store import Session, SessionStore, decode_state, encode_state
+from .solver_service import HOST, PORT, SolverService, serve
@@ -0,0 +1,49 @@
+"""
+Solver Service Script.
+
+Runs the solver service on a local socket until interrupted, e.g. `python -m service --port 8765`.
+Sessions are kept in a SQLite file, so they survive a restart.
+"""
+
+from service import HOST, PORT, SessionStore, serve
+from service.session_store import MEMORY_CAP
+import argparse
+import asyncio
+
+# file: service/__main__.py
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Wordle bot suggestions")
+    parser.add_argument("--host", default=HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=PORT, help="port to listen on")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="threads to play bots in"
+    )
+    parser.add_argument(
+        "--store", default="wordle_sessions.sqlite", help="SQLite file of the sessions"
+    )
+    parser.add_argument(
+        "--memory",
+        type=int,
+        default=MEMORY_CAP,
+        help="bytes of sessions to keep in memory",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        help="seconds a suggestion may take, unless a request sets its own",
+    )
+    args = parser.parse_args()
+    try:
+        asyncio.run(
+            serve(
+                args.host,
+                args.port,
+                args.workers,
+                SessionStore(args.store, args.memory),
+                args.budget,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,126 @@
+"""
+Pool of Reusable Bot Instances.
+
+This module defines the BotPool class, which lends bots of one class to the threads of the solver service.
+
+A bot holds no game of its own while it is in the pool: each game is kept as a snapshot of the bot's state,
+restored into whichever bot is borrowed to play its next turn. Bots are created on demand, so the pool holds
+at most one bot per thread borrowing at once, and every bot shares the process-wide word list and feedback
+lookup, as well as the opening book the pool loads once, so an extra bot only costs its own settings.
+"""
+
+from bots import BotBehaviors
+from bots.opening_book import OpeningBook
+from contextlib import contextmanager
+from typing import Iterator
+import queue
+import threading
+
+# file: service/bot_pool.py
+
+
+class BotPool:
+    """
+    A pool of bots of one class, lent to one thread at a time.
+
+    Attributes
+    ----------
+    bot_class : type[BotBehaviors]
+        The class of the bots.
+    idle : queue.SimpleQueue[BotBehaviors]
+        The bots not lent out.
+    lock : threading.Lock
+        Guards the count of bots created.
+    created : int
+        The number of bots created.
+    opening_book : OpeningBook | None
+        The opening book shared by the bots, loaded or built when the pool is created.
+    initial_state : dict
+        The state of a bot before its first guess.
+    """
+
+    def __init__(self, bot_class: type[BotBehaviors]) -> None:
+        """
+        Initialize the BotPool instance, with one bot to take the initial state from.
+
+        The bot is prepared, loading or building its opening book and other caches, so that bots
+        borrowed later never build them within a request.
+
+        Parameters
+        ----------
+        bot_class : type[BotBehaviors]
+            The class of the bots.
+        """
+        self.bot_class = bot_class
+        self.idle: queue.SimpleQueue[BotBehaviors] = queue.SimpleQueue()
+        self.lock = threading.Lock()
+        self.created = 0
+        self.opening_book: OpeningBook | None = None
+        bot = self.create()
+        bot.prepare()
+        self.opening_book = bot.opening_book
+        self.initial_state: dict = bot.save_state()
+        self.idle.put(bot)
+
+    def create(self) -> BotBehaviors:
+        """
+        Create a bot for the pool.
+
+        Returns
+        -------
+        BotBehaviors
+            The new bot, in its initial state, sharing the pool's opening book.
+        """
+        with self.lock:
+            self.created += 1
+        bot = self.bot_class()
+        bot.opening_book = self.opening_book
+        bot.reset()
+        return bot
+
+    def acquire(self) -> BotBehaviors:
+        """
+        Take an idle bot out of the pool, creating one if none is idle.
+
+        Returns
+        -------
+        BotBehaviors
+            The bot, in whatever state its last game left it.
+        """
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            return self.create()
+
+    def release(self, bot: BotBehaviors) -> None:
+        """
+        Return a bot to the pool.
+
+        Parameters
+        ----------
+        bot : BotBehaviors
+            The bot, taken out with acquire.
+        """
+        self.idle.put(bot)
+
+    @contextmanager
+    def borrow(self, state: dict | None = None) -> Iterator[BotBehaviors]:
+        """
+        Borrow a bot for the duration of a with block.
+
+        Parameters
+        ----------
+        state : dict | None, optional
+            The state to restore into the bot, defaults to the initial state.
+
+        Yields
+        ------
+        BotBehaviors
+            The bot, in the given state.
+        """
+        bot = self.acquire()
+        try:
+            bot.restore_state(self.initial_state if state is None else state)
+            yield bot
+        finally:
+            self.release(bot)
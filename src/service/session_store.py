@@ -0,0 +1,634 @@
+"""
+Persistent Session Store.
+
+This module defines the Session class, which holds a game played through the solver service,
+the encode_state and decode_state functions, which serialize a bot's state compactly,
+and the SessionStore class, which keeps the sessions within a memory cap.
+
+A state is stored as the ids of its guesses, the codes of their results, and its possible words as a bitset
+over the word list, or as their ids when that is smaller, with any other entries of the state as JSON.
+A state with every word possible, such as a new one, stores no words at all.
+
+The store keeps the most recently used sessions in memory, and spills the least recently used to a SQLite
+file once their estimated size exceeds the cap. A spilled session is read back when it is next used, and
+every session is written out when the store is closed, so sessions survive a restart of the service.
+The SQLite file is only used from a thread of the store, in order, so the event loop of the service never
+waits on it: spills are written in the background, and a resumed session is awaited with load.
+"""
+
+from bots.util import GUESSES, RESULTS
+from common import MSG, RESULT, Lexicon, get_lexicon
+from common.pattern import PATTERNS
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+import asyncio
+import json
+import logging
+import sqlite3
+import numpy as np
+
+# file: service/session_store.py
+
+STATE_MAGIC = b"WST1"
+STATE_HEADER = np.dtype(
+    [
+        ("magic", "S4"),
+        ("flags", "u1"),
+        ("guesses", "u1"),
+        ("results", "u1"),
+        ("reserved", "u1"),
+        ("words", "<u4"),
+    ]
+)
+# Flags of a stored state, telling how its possible words are stored
+ALL_WORDS = 1
+WORD_IDS = 2
+
+MEMORY_CAP = 64 * 1024 * 1024
+SESSION_SIZE = 2048
+WORD_SIZE = 8
+
+
+class Session:
+    """
+    A game played through the service.
+
+    Attributes
+    ----------
+    bot : str
+        The class name of the bot playing the game.
+    state : dict
+        The bot's state, as taken by save_state.
+    over : bool
+        Whether the game is won or out of turns.
+    lock : asyncio.Lock
+        Serializes the requests on the session, which may come from several connections.
+    """
+
+    def __init__(self, bot: str, state: dict, over: bool = False) -> None:
+        """
+        Initialize the Session instance.
+
+        Parameters
+        ----------
+        bot : str
+            The class name of the bot playing the game.
+        state : dict
+            The bot's state.
+        over : bool, optional
+            Whether the game is over, defaults to False.
+        """
+        self.bot = bot
+        self.state = state
+        self.over = over
+        self.lock = asyncio.Lock()
+
+    def get_size(self, lexicon: Lexicon) -> int:
+        """
+        Estimate the memory held by the session.
+
+        Parameters
+        ----------
+        lexicon : Lexicon
+            The word list, whose words are shared rather than held by the session.
+
+        Returns
+        -------
+        int
+            The estimated size in bytes.
+        """
+        words = self.state["possible_words"]
+        if words is lexicon.word_list:
+            return SESSION_SIZE
+        return SESSION_SIZE + WORD_SIZE * len(words)
+
+
+def encode_words(words: list[str], lexicon: Lexicon) -> tuple[int, int, bytes]:
+    """
+    Serialize a set of possible words compactly, as nothing, word ids or a bitset, whichever fits.
+
+    Parameters
+    ----------
+    words : list[str]
+        The possible words.
+    lexicon : Lexicon
+        The word list the words are from.
+
+    Returns
+    -------
+    tuple[int, int, bytes]
+        The flags telling how the words are stored, the number of words stored, and the serialized words.
+
+    Raises
+    ------
+    ValueError
+        If a word is not in the word list.
+    """
+    if words is lexicon.word_list:
+        return ALL_WORDS, 0, b""
+    ids = lexicon.ids
+    try:
+        word_ids = np.array([ids[w] for w in words], dtype="<u2")
+    except KeyError as e:
+        raise ValueError(f"{e} is not in the word list") from e
+    if 2 * len(word_ids) < (len(lexicon) + 7) // 8:
+        return WORD_IDS, len(word_ids), word_ids.tobytes()
+    mask = np.zeros(len(lexicon), dtype=bool)
+    mask[word_ids] = True
+    return 0, len(word_ids), np.packbits(mask).tobytes()
+
+
+def encode_state(state: dict, lexicon: Lexicon | None = None) -> bytes:
+    """
+    Serialize a bot's state compactly.
+
+    Parameters
+    ----------
+    state : dict
+        The state, as taken by save_state.
+    lexicon : Lexicon | None, optional
+        The word list the guesses and possible words are from, defaults to the shared Wordle lexicon.
+
+    Returns
+    -------
+    bytes
+        The serialized state.
+
+    Raises
+    ------
+    ValueError
+        If a guess or possible word is not in the word list.
+    """
+    lexicon = get_lexicon() if lexicon is None else lexicon
+    ids = lexicon.ids
+    try:
+        guess_ids = np.array([ids[g] for g in state[GUESSES]], dtype="<u2")
+    except KeyError as e:
+        raise ValueError(f"{e} is not in the word list") from e
+    codes = np.array([int(r[RESULT]) for r in state[RESULTS]], dtype=np.uint8)
+    header = np.zeros(1, dtype=STATE_HEADER)
+    header["magic"] = STATE_MAGIC
+    header["guesses"] = len(guess_ids)
+    header["results"] = len(codes)
+    header["flags"], header["words"], words_bytes = encode_words(
+        state["possible_words"], lexicon
+    )
+    extra = {
+        key: value
+        for key, value in state.items()
+        if key not in (GUESSES, RESULTS, "possible_words")
+    }
+    return b"".join(
+        [
+            header.tobytes(),
+            guess_ids.tobytes(),
+            codes.tobytes(),
+            words_bytes,
+            json.dumps(extra).encode() if extra else b"",
+        ]
+    )
+
+
+def decode_state(data: bytes, lexicon: Lexicon | None = None) -> dict:
+    """
+    Deserialize a bot's state serialized with encode_state.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized state.
+    lexicon : Lexicon | None, optional
+        The word list the state was serialized with, defaults to the shared Wordle lexicon.
+
+    Returns
+    -------
+    dict
+        The state, to be restored with restore_state.
+
+    Raises
+    ------
+    ValueError
+        If the data is not a serialized state.
+    """
+    lexicon = get_lexicon() if lexicon is None else lexicon
+    header = np.frombuffer(data, dtype=STATE_HEADER, count=1)[0]
+    if header["magic"] != STATE_MAGIC:
+        raise ValueError("Not a serialized bot state")
+    offset = STATE_HEADER.itemsize
+    guess_ids = np.frombuffer(data, dtype="<u2", count=header["guesses"], offset=offset)
+    offset += guess_ids.nbytes
+    codes = np.frombuffer(data, dtype=np.uint8, count=header["results"], offset=offset)
+    offset += codes.nbytes
+    words: list[str]
+    if header["flags"] & ALL_WORDS:
+        words = lexicon.word_list
+    elif header["flags"] & WORD_IDS:
+        word_ids = np.frombuffer(
+            data, dtype="<u2", count=header["words"], offset=offset
+        )
+        offset += word_ids.nbytes
+        words = [lexicon.words[i] for i in word_ids.tolist()]
+    else:
+        size = (len(lexicon) + 7) // 8
+        mask = np.unpackbits(
+            np.frombuffer(data, dtype=np.uint8, count=size, offset=offset),
+            count=len(lexicon),
+        )
+        offset += size
+        words = [lexicon.words[i] for i in np.flatnonzero(mask).tolist()]
+    state = json.loads(data[offset:]) if offset < len(data) else {}
+    state[GUESSES] = [lexicon.words[i] for i in guess_ids.tolist()]
+    state[RESULTS] = [{RESULT: PATTERNS[code], MSG: None} for code in codes.tolist()]
+    state["possible_words"] = words
+    return state
+
+
+class SessionStore:
+    """
+    A store of sessions, keeping the most recently used in memory and spilling the rest to SQLite.
+
+    Attributes
+    ----------
+    logger : logging.Logger
+        A logger instance for logging store events and errors.
+    path : str
+        The location of the SQLite file, or ":memory:" for a store that does not persist.
+    memory_cap : int
+        The estimated size in bytes the sessions in memory are kept under.
+    lexicon : Lexicon
+        The word list of the sessions.
+    connection : sqlite3.Connection
+        The connection to the SQLite file, only used from the thread of the io executor after initialization.
+    io : ThreadPoolExecutor
+        The single thread reading and writing the SQLite file, in the order the reads and writes are made.
+    stored : set[str]
+        The ids of the sessions in the SQLite file, or being written to it.
+    sessions : OrderedDict[str, Session]
+        The sessions in memory, by id, from least to most recently used.
+    sizes : dict[str, int]
+        The estimated size of each session in memory.
+    memory_used : int
+        The estimated size of the sessions in memory.
+    dirty : set[str]
+        The ids of the sessions in memory that changed since they were last written out.
+    count : int
+        The number of sessions, in memory or on disk.
+    stats : dict[str, int]
+        The number of hits in memory, of sessions resumed from disk, of unknown sessions looked up,
+        of sessions evicted from memory, and of sessions written out.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        memory_cap: int = MEMORY_CAP,
+        lexicon: Lexicon | None = None,
+    ) -> None:
+        """
+        Initialize the SessionStore instance, opening or creating its SQLite file.
+
+        Parameters
+        ----------
+        path : str, optional
+            The location of the SQLite file, defaults to a store that does not persist.
+        memory_cap : int, optional
+            The estimated size in bytes to keep the sessions in memory under, defaults to MEMORY_CAP.
+        lexicon : Lexicon | None, optional
+            The word list of the sessions, defaults to the shared Wordle lexicon.
+        """
+        self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
+        self.path = path
+        self.memory_cap = memory_cap
+        self.lexicon: Lexicon = get_lexicon() if lexicon is None else lexicon
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS sessions "
+            "(id TEXT PRIMARY KEY, bot TEXT NOT NULL, over INTEGER NOT NULL, state BLOB NOT NULL)"
+        )
+        self.connection.commit()
+        self.sessions: OrderedDict[str, Session] = OrderedDict()
+        self.sizes: dict[str, int] = {}
+        self.memory_used = 0
+        self.dirty: set[str] = set()
+        self.stored: set[str] = {
+            row[0] for row in self.connection.execute("SELECT id FROM sessions")
+        }
+        self.count: int = len(self.stored)
+        self.io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="store")
+        self.stats: dict[str, int] = {
+            "hits": 0,
+            "resumed": 0,
+            "misses": 0,
+            "evicted": 0,
+            "written": 0,
+        }
+
+    def __len__(self) -> int:
+        """Count the sessions, in memory or on disk."""
+        return self.count
+
+    def get(self, session_id: str) -> Session | None:
+        """
+        Get a session, waiting for it to be read back from disk if it was spilled.
+
+        Parameters
+        ----------
+        session_id : str
+            The id of the session.
+
+        Returns
+        -------
+        Session | None
+            The session, or None if there is no such session.
+        """
+        session = self.get_in_memory(session_id)
+        if session is not None or session_id not in self.stored:
+            return session
+        return self.resume(session_id, self.io.submit(self.read, session_id).result())
+
+    async def load(self, session_id: str) -> Session | None:
+        """
+        Get a session, reading it back from disk in the store's thread if it was spilled.
+
+        Parameters
+        ----------
+        session_id : str
+            The id of the session.
+
+        Returns
+        -------
+        Session | None
+            The session, or None if there is no such session.
+        """
+        session = self.get_in_memory(session_id)
+        if session is not None or session_id not in self.stored:
+            return session
+        read = asyncio.wrap_future(self.io.submit(self.read, session_id))
+        return self.resume(session_id, await read)
+
+    def get_in_memory(self, session_id: str) -> Session | None:
+        """
+        Get a session in memory, marking it as the most recently used.
+
+        Parameters
+        ----------
+        session_id : str
+            The id of the session.
+
+        Returns
+        -------
+        Session | None
+            The session, or None if it is not in memory, counting a miss if it is not on disk either.
+        """
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self.sessions.move_to_end(session_id)
+            self.stats["hits"] += 1
+        elif session_id not in self.stored:
+            self.stats["misses"] += 1
+        return session
+
+    def read(self, session_id: str) -> tuple[str, int, bytes] | None:
+        """
+        Read a session from disk, in the store's thread.
+
+        Parameters
+        ----------
+        session_id : str
+            The id of the session.
+
+        Returns
+        -------
+        tuple[str, int, bytes] | None
+            The bot, whether the game is over, and the serialized state of the session,
+            or None if it is not on disk.
+        """
+        return self.connection.execute(
+            "SELECT bot, over, state FROM sessions WHERE id = ?", (session_id,)
+        ).fetchone()
+
+    def resume(
+        self, session_id: str, row: tuple[str, int, bytes] | None
+    ) -> Session | None:
+        """
+        Keep a session read from disk in memory.
+
+        The session may have been resumed by another request, or deleted, while it was read,
+        in which case the session in memory, or None, is returned instead.
+
+        Parameters
+        ----------
+        session_id : str
+            The id of the session.
+        row : tuple[str, int, bytes] | None
+            The session as read from disk.
+
+        Returns
+        -------
+        Session | None
+            The session, or None if there is no such session.
+        """
+        if session_id in self.sessions or session_id not in self.stored:
+            return self.get_in_memory(session_id)
+        assert row is not None
+        bot, over, data = row
+        session = Session(bot, decode_state(data, self.lexicon), bool(over))
+        self.stats["resumed"] += 1
+        self.add(session_id, session)
+        return session
+
+    def put(self, session_id: str, session: Session) -> None:
+        """
+        Add a new session, or mark a session in memory as changed.
+
+        Parameters
+        ----------
+        session_id : str
+            The id of the session.
+        session : Session
+            The session.
+        """
+        if session_id not in self.sessions and session_id not in self.stored:
+            self.count += 1
+        self.dirty.add(session_id)
+        self.add(session_id, session)
+
+    def add(self, session_id: str, session: Session) -> None:
+        """
+        Keep a session in memory as the most recently used, evicting others if the memory cap is exceeded.
+
+        Parameters
+        ----------
+        session_id : str
+            The id of the session.
+        session : Session
+            The session.
+        """
+        self.memory_used -= self.sizes.get(session_id, 0)
+        self.sessions[session_id] = session
+        self.sessions.move_to_end(session_id)
+        self.sizes[session_id] = session.get_size(self.lexicon)
+        self.memory_used += self.sizes[session_id]
+        if self.memory_used > self.memory_cap:
+            self.evict()
+
+    def delete(self, session_id: str) -> None:
+        """
+        Forget a session, in memory and on disk.
+
+        Parameters
+        ----------
+        session_id : str
+            The id of the session.
+        """
+        in_memory = self.sessions.pop(session_id, None) is not None
+        self.memory_used -= self.sizes.pop(session_id, 0)
+        self.dirty.discard(session_id)
+        if session_id in self.stored:
+            self.stored.discard(session_id)
+            self.submit(self.remove, session_id)
+        elif not in_memory:
+            return
+        self.count -= 1
+
+    def evict(self) -> None:
+        """
+        Spill the least recently used sessions until the sessions in memory fit under the cap.
+
+        The most recently used session, and sessions with a request in progress, are kept.
+        """
+        evicted = []
+        candidates = islice(self.sessions.items(), len(self.sessions) - 1)
+        for session_id, session in candidates:
+            if self.memory_used <= self.memory_cap:
+                break
+            if session.lock.locked():
+                continue
+            evicted.append(session_id)
+            self.memory_used -= self.sizes[session_id]
+        self.write([i for i in evicted if i in self.dirty])
+        for session_id in evicted:
+            del self.sessions[session_id]
+            del self.sizes[session_id]
+        self.stats["evicted"] += len(evicted)
+
+    def write(self, session_ids: list[str]) -> Future | None:
+        """
+        Write sessions in memory out to disk, in the store's thread.
+
+        The sessions are serialized at once, so they may change or leave memory while they are written.
+
+        Parameters
+        ----------
+        session_ids : list[str]
+            The ids of the sessions.
+
+        Returns
+        -------
+        Future | None
+            The pending write, or None if there are no sessions to write.
+        """
+        if not session_ids:
+            return None
+        rows = []
+        for session_id in session_ids:
+            session = self.sessions[session_id]
+            data = encode_state(session.state, self.lexicon)
+            rows.append((session_id, session.bot, int(session.over), data))
+        self.dirty.difference_update(session_ids)
+        self.stored.update(session_ids)
+        self.stats["written"] += len(rows)
+        return self.submit(self.insert, rows)
+
+    def insert(self, rows: list[tuple[str, str, int, bytes]]) -> None:
+        """
+        Insert or replace rows of the SQLite file, in the store's thread.
+
+        Parameters
+        ----------
+        rows : list[tuple[str, str, int, bytes]]
+            The id, bot, whether the game is over, and serialized state of each session.
+        """
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO sessions (id, bot, over, state) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        self.connection.commit()
+
+    def remove(self, session_id: str) -> None:
+        """
+        Delete a row of the SQLite file, in the store's thread.
+
+        Parameters
+        ----------
+        session_id : str
+            The id of the session.
+        """
+        self.connection.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+        self.connection.commit()
+
+    def submit(self, function, *args) -> Future:
+        """
+        Run a change to the SQLite file in the store's thread, logging it if it fails.
+
+        Parameters
+        ----------
+        function : Callable
+            The function making the change.
+        *args
+            Its arguments.
+
+        Returns
+        -------
+        Future
+            The pending change.
+        """
+        future = self.io.submit(function, *args)
+        future.add_done_callback(self.log_failure)
+        return future
+
+    def log_failure(self, future: Future) -> None:
+        """
+        Log the error of a change to the SQLite file, if it failed.
+
+        Parameters
+        ----------
+        future : Future
+            The change, done.
+        """
+        error = future.exception()
+        if error is not None:
+            self.logger.error(f"Could not update {self.path}: {error!r}")
+
+    def get_stats(self) -> dict:
+        """
+        Get the statistics of the store.
+
+        Returns
+        -------
+        dict
+            The counts of the stats attribute, with the number of sessions, in memory and in total,
+            and the estimated size of the sessions in memory.
+        """
+        return {
+            **self.stats,
+            "sessions": self.count,
+            "in_memory": len(self.sessions),
+            "memory_used": self.memory_used,
+            "memory_cap": self.memory_cap,
+        }
+
+    def flush(self) -> None:
+        """Write every changed session in memory out to disk, waiting for every pending write."""
+        self.write(list(self.dirty))
+        self.io.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """Write every changed session out, and close the SQLite file."""
+        self.flush()
+        self.io.shutdown()
+        self.connection.close()
+        self.logger.info(f"Closed {self.path} with {self.count} sessions")
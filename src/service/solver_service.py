@@ -0,0 +1,552 @@
+"""
+Asyncio Solver Service.
+
+This module defines the SolverService class, which serves bot suggestions to other programs over a local
+TCP socket.
+
+The protocol is one JSON object per line in each direction. Every request has an "op" key, and may have an
+"id" key, which is echoed in the response. Every response has an "ok" key, and an "error" key when it is false.
+
+- "start", with an optional "bot" class name: start a session, answering its "session" key.
+- "suggest", with a "session" and an optional "budget" in seconds: the bot's next guess, as "guess",
+  and the number of "remaining" words. Bots that support deadlines answer with the best guess found
+  within the budget, counted from when the request is read.
+- "result", with a "session", the "guess" played and its "result", as 5 digits or a list of them:
+  advance the session, answering the number of "remaining" words and whether the game is "over".
+- "solve", with an optional "bot" and "budget", and the "guesses" and "results" of a game: the bot's
+  next guess, as for "suggest", without a session.
+- "end", with a "session": forget the session.
+- "stats": the number of "sessions", of "bots" created, by class, and the statistics of the "store".
+
+Sessions only hold snapshots of a bot's state, kept in a SessionStore, and every turn is played by a bot
+borrowed from a pool, in a thread of an executor so the event loop keeps serving other connections while
+the bot thinks.
+"""
+
+from bots import BayesianBot, BotBehaviors
+from bots.util import GUESSES
+from common import (
+    ALL_CORRECT,
+    MSG,
+    RESULT,
+    Pattern,
+    get_lexicon,
+    get_pattern_matrix,
+)
+from common.util import get_all_subclasses
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from .bot_pool import BotPool
+from .session_store import Session, SessionStore
+import asyncio
+import json
+import logging
+import time
+import uuid
+
+# file: service/solver_service.py
+
+HOST = "127.0.0.1"
+PORT = 8765
+# Connections waiting to be accepted, which bursts of thousands of clients overflow at the default of 100
+BACKLOG = 4096
+MAX_TURNS = 6
+
+
+def parse_result(result: str | list[int]) -> Pattern:
+    """
+    Parse the result of a guess, as 5 digits or a list of them.
+
+    Parameters
+    ----------
+    result : str | list[int]
+        The result, such as "01220" or [0, 1, 2, 2, 0].
+
+    Returns
+    -------
+    Pattern
+        The pattern of the result.
+
+    Raises
+    ------
+    ValueError
+        If the result is not 5 digits, each 0, 1 or 2.
+    """
+    digits = [int(c) for c in result] if isinstance(result, str) else result
+    if (
+        not isinstance(digits, list)
+        or len(digits) != 5
+        or any(digit not in (0, 1, 2) for digit in digits)
+    ):
+        raise ValueError(f"Invalid result {result!r}, expected 5 digits of 0, 1 or 2")
+    return Pattern.from_list(digits)
+
+
+class SolverService:
+    """
+    A service answering the requests of the protocol, and the server running it on a local socket.
+
+    Attributes
+    ----------
+    logger : logging.Logger
+        A logger instance for logging service events and errors.
+    bot_classes : dict[str, type[BotBehaviors]]
+        The bots that can be played, by class name.
+    default_bot : str
+        The bot played when a request names none.
+    pools : dict[str, BotPool]
+        The pools of bots, by class name, created on first use.
+    pool_lock : asyncio.Lock
+        Serializes the creation of pools, so concurrent first requests prepare a bot class only once.
+    store : SessionStore
+        The sessions, by id.
+    executor : ThreadPoolExecutor
+        The threads the bots are played in.
+    budget : float | None
+        The seconds a suggestion may take when a request gives no budget, None for no limit.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        default_bot: type[BotBehaviors] = BayesianBot,
+        store: SessionStore | None = None,
+        budget: float | None = None,
+    ) -> None:
+        """
+        Initialize the SolverService instance.
+
+        Parameters
+        ----------
+        workers : int | None, optional
+            The number of threads to play bots in, defaults to the executor's default.
+        default_bot : type[BotBehaviors], optional
+            The bot played when a request names none, defaults to BayesianBot.
+        store : SessionStore | None, optional
+            The store of the sessions, defaults to one in memory only.
+        budget : float | None, optional
+            The seconds a suggestion may take when a request gives no budget, defaults to no limit.
+        """
+        self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
+        self.bot_classes: dict[str, type[BotBehaviors]] = {
+            bot.__name__: bot for bot in get_all_subclasses(BotBehaviors)
+        }
+        self.default_bot: str = default_bot.__name__
+        self.pools: dict[str, BotPool] = {}
+        self.pool_lock = asyncio.Lock()
+        self.store: SessionStore = SessionStore() if store is None else store
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="solver"
+        )
+        self.budget = budget
+
+    async def run(self, function, *args):
+        """
+        Run a function in the executor.
+
+        Parameters
+        ----------
+        function : Callable
+            The function.
+        *args
+            Its arguments.
+
+        Returns
+        -------
+        Any
+            The function's return value.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, function, *args
+        )
+
+    async def get_pool(self, bot: str | None) -> BotPool:
+        """
+        Get the pool of a bot class, creating it in the executor on first use.
+
+        Creating a pool prepares its bots, which may build their opening book, so it is done once
+        while any other request for the same pool waits.
+
+        Parameters
+        ----------
+        bot : str | None
+            The class name of the bot, or None for the default bot.
+
+        Returns
+        -------
+        BotPool
+            The pool.
+
+        Raises
+        ------
+        ValueError
+            If there is no bot of that name.
+        """
+        name = self.default_bot if bot is None else bot
+        if name not in self.bot_classes:
+            raise ValueError(f"Unknown bot {name}")
+        if name not in self.pools:
+            async with self.pool_lock:
+                if name not in self.pools:
+                    self.pools[name] = await self.run(BotPool, self.bot_classes[name])
+        return self.pools[name]
+
+    async def get_session(self, request: dict) -> Session:
+        """
+        Get the session of a request, reading it back from disk if it was spilled.
+
+        Parameters
+        ----------
+        request : dict
+            The request, with a "session" key.
+
+        Returns
+        -------
+        Session
+            The session.
+
+        Raises
+        ------
+        ValueError
+            If there is no such session.
+        """
+        session = await self.store.load(str(request.get("session")))
+        if session is None:
+            raise ValueError(f"Unknown session {request.get('session')}")
+        return session
+
+    @asynccontextmanager
+    async def lock_session(self, request: dict) -> AsyncIterator[Session]:
+        """
+        Hold the lock of the session of a request for the duration of an async with block.
+
+        The session may be spilled to disk and resumed as a new Session while waiting for its lock,
+        so it is looked up again once locked, until the session locked is the one in the store.
+
+        Parameters
+        ----------
+        request : dict
+            The request, with a "session" key.
+
+        Yields
+        ------
+        Session
+            The session, locked.
+
+        Raises
+        ------
+        ValueError
+            If there is no such session.
+        """
+        session = await self.get_session(request)
+        while True:
+            async with session.lock:
+                current = await self.get_session(request)
+                if current is session:
+                    yield session
+                    return
+            session = current
+
+    def get_deadline(self, request: dict) -> float | None:
+        """
+        Get the deadline of a suggestion from the budget of its request, or of the service.
+
+        Parameters
+        ----------
+        request : dict
+            The request, with an optional "budget" in seconds.
+
+        Returns
+        -------
+        float | None
+            The `time.monotonic()` value by which the suggestion is needed, or None for no limit.
+
+        Raises
+        ------
+        ValueError
+            If the budget is not a number of seconds at least 0.
+        """
+        budget = request.get("budget", self.budget)
+        if budget is None:
+            return None
+        # A bool is an int, and NaN is neither below nor at least 0
+        if (
+            isinstance(budget, bool)
+            or not isinstance(budget, (int, float))
+            or not budget >= 0
+        ):
+            raise ValueError(f"Invalid budget {budget!r}, expected seconds")
+        return time.monotonic() + budget
+
+    def get_guess(
+        self, pool: BotPool, state: dict, deadline: float | None = None
+    ) -> tuple[str, int]:
+        """
+        Generate a bot's next guess from a state, without changing the state.
+
+        Parameters
+        ----------
+        pool : BotPool
+            The pool to borrow the bot from.
+        state : dict
+            The bot's state.
+        deadline : float | None, optional
+            The `time.monotonic()` value by which the guess is needed, defaults to no limit.
+
+        Returns
+        -------
+        tuple[str, int]
+            The guess, and the number of words still possible.
+        """
+        with pool.borrow(state) as bot:
+            remaining = len(bot.possible_words)
+            return bot.generate_guess(deadline), remaining
+
+    def play_turns(
+        self, pool: BotPool, state: dict, guesses: list[str], results: list[Pattern]
+    ) -> dict:
+        """
+        Apply guesses and their results to a bot's state.
+
+        Parameters
+        ----------
+        pool : BotPool
+            The pool to borrow the bot from.
+        state : dict
+            The bot's state.
+        guesses : list[str]
+            The guesses played.
+        results : list[Pattern]
+            The result of each guess.
+
+        Returns
+        -------
+        dict
+            The bot's new state.
+        """
+        with pool.borrow(state) as bot:
+            for guess, result in zip(guesses, results):
+                bot.guesses[GUESSES].append(guess)
+                bot.accept_result({RESULT: result, MSG: None})
+            return bot.save_state()
+
+    def check_guesses(self, guesses: list[str]) -> list[str]:
+        """
+        Check that guesses are valid words.
+
+        Parameters
+        ----------
+        guesses : list[str]
+            The guesses, in any case.
+
+        Returns
+        -------
+        list[str]
+            The guesses, in upper case.
+
+        Raises
+        ------
+        ValueError
+            If a guess is not a valid word.
+        """
+        lexicon = get_lexicon()
+        words = [str(guess).strip().upper() for guess in guesses]
+        for word in words:
+            if not lexicon.is_valid_word(word):
+                raise ValueError(f"'{word}' is not a valid word")
+        return words
+
+    async def start(self, request: dict) -> dict:
+        """Start a session."""
+        pool = await self.get_pool(request.get("bot"))
+        session_id = uuid.uuid4().hex
+        self.store.put(session_id, Session(pool.bot_class.__name__, pool.initial_state))
+        return {"session": session_id}
+
+    async def suggest(self, request: dict) -> dict:
+        """Suggest the next guess of a session."""
+        deadline = self.get_deadline(request)
+        async with self.lock_session(request) as session:
+            if session.over:
+                raise ValueError("The game is over")
+            pool = await self.get_pool(session.bot)
+            guess, remaining = await self.run(
+                self.get_guess, pool, session.state, deadline
+            )
+        return {"guess": guess, "remaining": remaining}
+
+    async def result(self, request: dict) -> dict:
+        """Advance a session by a guess and its result."""
+        guesses = self.check_guesses([request.get("guess", "")])
+        result = parse_result(request.get("result", ""))
+        async with self.lock_session(request) as session:
+            if session.over:
+                raise ValueError("The game is over")
+            pool = await self.get_pool(session.bot)
+            session.state = await self.run(
+                self.play_turns, pool, session.state, guesses, [result]
+            )
+            session.over = (
+                result == ALL_CORRECT or len(session.state[GUESSES]) >= MAX_TURNS
+            )
+            self.store.put(request["session"], session)
+        return {
+            "remaining": len(session.state["possible_words"]),
+            "over": session.over,
+        }
+
+    async def solve(self, request: dict) -> dict:
+        """Suggest the next guess of a game given in full, without a session."""
+        deadline = self.get_deadline(request)
+        guesses = self.check_guesses(request.get("guesses", []))
+        results = [parse_result(result) for result in request.get("results", [])]
+        if len(guesses) != len(results):
+            raise ValueError("Expected one result per guess")
+        pool = await self.get_pool(request.get("bot"))
+
+        def solve_game() -> tuple[str, int]:
+            state = self.play_turns(pool, pool.initial_state, guesses, results)
+            return self.get_guess(pool, state, deadline)
+
+        guess, remaining = await self.run(solve_game)
+        return {"guess": guess, "remaining": remaining}
+
+    async def end(self, request: dict) -> dict:
+        """Forget a session."""
+        await self.get_session(request)
+        self.store.delete(request["session"])
+        return {}
+
+    async def stats(self, request: dict) -> dict:
+        """Count the sessions and the bots created, and get the statistics of the store."""
+        return {
+            "sessions": len(self.store),
+            "bots": {name: pool.created for name, pool in self.pools.items()},
+            "store": self.store.get_stats(),
+        }
+
+    async def handle(self, request: dict) -> dict:
+        """
+        Answer a request of the protocol.
+
+        Parameters
+        ----------
+        request : dict
+            The request.
+
+        Returns
+        -------
+        dict
+            The response, with "ok" false and an "error" if the request failed.
+        """
+        operations = {
+            "start": self.start,
+            "suggest": self.suggest,
+            "result": self.result,
+            "solve": self.solve,
+            "end": self.end,
+            "stats": self.stats,
+        }
+        response: dict
+        try:
+            if not isinstance(request, dict) or request.get("op") not in operations:
+                raise ValueError("Unknown operation")
+            response = {"ok": True, **await operations[request["op"]](request)}
+        except ValueError as e:
+            response = {"ok": False, "error": str(e)}
+        except Exception:
+            self.logger.exception(f"Failed to answer {request}")
+            response = {"ok": False, "error": "Internal error"}
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Answer the requests of a connection in order, until it is closed.
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            The stream of requests.
+        writer : asyncio.StreamWriter
+            The stream of responses.
+        """
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError:
+                    request = None
+                response = await self.handle(request)  # type: ignore[arg-type]
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start_server(self, host: str = HOST, port: int = PORT) -> asyncio.Server:
+        """
+        Load the shared word list and feedback lookup, and start serving on a local socket.
+
+        Parameters
+        ----------
+        host : str, optional
+            The address to listen on, defaults to localhost.
+        port : int, optional
+            The port to listen on, 0 for any free port, defaults to PORT.
+
+        Returns
+        -------
+        asyncio.Server
+            The server, already serving.
+        """
+        await self.run(get_pattern_matrix)
+        await self.get_pool(None)
+        server = await asyncio.start_server(
+            self.handle_connection, host, port, backlog=BACKLOG
+        )
+        self.logger.info(f"Serving on {server.sockets[0].getsockname()}")
+        return server
+
+    def close(self) -> None:
+        """Shut the executor down, after the bots in play finish their turns, and close the store."""
+        self.executor.shutdown()
+        self.store.close()
+
+
+async def serve(
+    host: str = HOST,
+    port: int = PORT,
+    workers: int | None = None,
+    store: SessionStore | None = None,
+    budget: float | None = None,
+):
+    """
+    Run the solver service until cancelled.
+
+    Parameters
+    ----------
+    host : str, optional
+        The address to listen on, defaults to localhost.
+    port : int, optional
+        The port to listen on, defaults to PORT.
+    workers : int | None, optional
+        The number of threads to play bots in, defaults to the executor's default.
+    store : SessionStore | None, optional
+        The store of the sessions, defaults to one in memory only.
+    budget : float | None, optional
+        The seconds a suggestion may take when a request gives no budget, defaults to no limit.
+    """
+    service = SolverService(workers, store=store, budget=budget)
+    server = await service.start_server(host, port)
+    print(f"Serving on {host}:{server.sockets[0].getsockname()[1]}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
@@ -0,0 +1,11 @@
+"""
+Module for Offline Solving.
+
+This module initializes the offline solver functionality.
+
+It imports the DecisionTreeSolver class, which computes a complete decision tree of guesses for a word list,
+and the Strategy class, which stores such a tree in a compact binary file that is memory-mapped for play.
+"""
+
+from .decision_tree import DecisionTreeSolver, build_strategy
+from .strategy import Strategy, get_strategy_path
@@ -0,0 +1,781 @@
+"""
+Offline Decision Tree Solver.
+
+This module provides the DecisionTreeSolver class, which computes a complete strategy for a word list:
+a guess at the root, and for each feedback pattern of that guess, a subtree solving the secret words
+left in that bucket.
+
+The solver minimizes one of two objectives. The expected objective is the total number of turns over every
+secret, which is the expected number of turns times the number of secrets, optionally requiring every secret
+to be solved within a number of turns. The worst-case objective is the largest number of turns any secret
+takes, and then the total: the expected objective is solved within 2, 3, ... turns until it succeeds.
+It is a depth-first branch and bound over the most promising guesses of each node, memoizing solved sets
+of secrets. A set of `n > 1` secrets takes at least `2n - 1` turns, since at most one of them can be guessed
+first, which gives the lower bound of a guess
+`3n - [guess is a secret] - (number of distinct feedback patterns)`. Guesses are tried in order of that bound,
+and a guess is abandoned as soon as its solved buckets and the bounds of its unsolved buckets reach
+the best total found so far.
+
+Under a limit on the turns, a node where none of the most promising guesses solves every secret in time
+is searched again with more guesses. If that fails too, the guess solving the most secrets in time is kept,
+so only the secrets of the buckets that cannot be solved in time, such as a family of words differing by
+one letter, take more turns.
+
+The buckets of the root guesses are independent subproblems, so they are solved in a pool of processes.
+"""
+
+from common import ALL_CORRECT, PatternKernel, get_pattern_matrix
+from .strategy import Node, Strategy
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import numpy as np
+
+# file: solver/decision_tree.py
+
+SORTED_COUNT_MAX_SECRETS = 32
+FALLBACK_BREADTH = 8
+INFEASIBLE = 1 << 62
+MAX_TURNS = 6
+EXPECTED = "expected"
+WORST_CASE = "worst-case"
+OBJECTIVES = (EXPECTED, WORST_CASE)
+
+# Per-process solver of the workers of a parallel solve, set up once by init_worker
+worker_solver: "DecisionTreeSolver | None" = None
+
+
+def init_worker(
+    breadth: int, turns: int | None, strict: bool, pattern_matrix: PatternKernel | None
+) -> None:
+    """
+    Set up a worker process of a parallel solve.
+
+    Parameters
+    ----------
+    breadth : int
+        The number of guesses to try at each node.
+    turns : int | None
+        The number of turns every secret must be solved in, or None for no limit.
+    strict : bool
+        Whether buckets that cannot be solved within the turns fail rather than leaving as few secrets as found over the limit.
+    pattern_matrix : PatternKernel | None
+        The feedback matrix, or None for the shared feedback matrix, which each worker maps itself.
+    """
+    global worker_solver
+    worker_solver = DecisionTreeSolver(pattern_matrix, breadth, turns, strict=strict)
+
+
+def solve_bucket(
+    secret_ids: np.ndarray, solver: "DecisionTreeSolver | None" = None
+) -> tuple[int, Node] | None:
+    """
+    Solve a bucket of secrets left after the root guess.
+
+    Parameters
+    ----------
+    secret_ids : np.ndarray
+        The ascending ids of the secrets in the bucket.
+    solver : DecisionTreeSolver | None, optional
+        The solver to use, defaults to the solver of this worker process.
+
+    Returns
+    -------
+    tuple[int, Node] | None
+        The total number of turns to solve every secret of the bucket, and the subtree solving them,
+        or None if the solver is strict and the bucket cannot be solved within its turns.
+    """
+    solver = worker_solver if solver is None else solver
+    assert solver is not None
+    turns = None if solver.turns is None else solver.turns - 1
+    if solver.strict:
+        return solver.solve_subtree(secret_ids, turns)
+    return solver.solve_within(secret_ids, turns)
+
+
+def is_solvable(n: int, turns: int | None) -> bool:
+    """
+    Check whether a set of secrets can possibly be solved within a number of turns.
+
+    Parameters
+    ----------
+    n : int
+        The number of secrets.
+    turns : int | None
+        The number of turns every secret must be solved in, or None for no limit.
+
+    Returns
+    -------
+    bool
+        False if there are no turns left, or a single turn for more than one secret.
+    """
+    if turns is None:
+        return True
+    return turns > 1 or (turns == 1 and n <= 1)
+
+
+def get_buckets(codes: np.ndarray, secret_ids: np.ndarray) -> dict[int, np.ndarray]:
+    """
+    Split a set of secrets by the feedback codes of a guess.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        The feedback code of the guess against each secret.
+    secret_ids : np.ndarray
+        The ascending ids of the secrets.
+
+    Returns
+    -------
+    dict[int, np.ndarray]
+        The ascending ids of the secrets giving each feedback code, excluding ALL_CORRECT.
+    """
+    order = np.argsort(codes, kind="stable")
+    values, starts = np.unique(codes[order], return_index=True)
+    buckets = np.split(secret_ids[order], starts[1:])
+    return {
+        int(code): bucket
+        for code, bucket in zip(values.tolist(), buckets)
+        if code != ALL_CORRECT
+    }
+
+
+def get_best_root(
+    count: int,
+    roots: list[tuple[int, bool, dict[int, np.ndarray]]],
+    results: list[tuple[int, Node] | None],
+) -> tuple[int, Node] | None:
+    """
+    Combine the solved buckets of each root guess into the decision tree with the fewest total turns.
+
+    Parameters
+    ----------
+    count : int
+        The number of secrets, each of which takes a turn for the root guess.
+    roots : list[tuple[int, bool, dict[int, np.ndarray]]]
+        Each root guess, whether it is one of the secrets, and the ascending ids of the secrets of each bucket.
+    results : list[tuple[int, Node] | None]
+        The total number of turns and the subtree of each bucket of each root guess, in order,
+        or None for each bucket that could not be solved.
+
+    Returns
+    -------
+    tuple[int, Node] | None
+        The total number of turns to solve every secret, and the decision tree solving them,
+        or None if every root guess has a bucket that could not be solved.
+    """
+    solved = iter(results)
+    best: tuple[int, Node] | None = None
+    for guess, is_secret, buckets in roots:
+        subtrees: dict[int, tuple[int, Node]] = {}
+        for code in buckets:
+            subtree = next(solved)
+            if subtree is not None:
+                subtrees[code] = subtree
+        if len(subtrees) < len(buckets):
+            continue
+        total = count + sum(turns for turns, _ in subtrees.values())
+        if best is None or total < best[0]:
+            children = {code: node for code, (_, node) in subtrees.items()}
+            best = (total, (guess, is_secret, children))
+    return best
+
+
+class DecisionTreeSolver:
+    """
+    A branch and bound solver for the decision tree minimizing the total number of turns over a word list.
+
+    Attributes
+    ----------
+    logger : logging.Logger
+        A logger instance for logging solver progress.
+    pattern_matrix : PatternKernel
+        The feedback matrix of the word list.
+    shared : bool
+        Whether the feedback matrix is the shared one, which worker processes can map themselves.
+    breadth : int
+        The number of guesses tried at each node, in order of their lower bound.
+    turns : int | None
+        The number of turns every secret must be solved in, or None for no limit.
+    workers : int
+        The number of processes used to solve the buckets of the root guesses.
+    objective : str
+        EXPECTED to minimize the total number of turns, or WORST_CASE to minimize the largest number first.
+    strict : bool
+        Whether a solve fails when some bucket of the root guesses cannot be solved within the turns,
+        rather than leaving as few secrets of that bucket as found over the limit.
+    memo : dict[tuple[bytes, int | None], tuple[int, Node]]
+        The solved sets of secrets, keyed by their ids and the number of turns left.
+    bounds : dict[tuple[bytes, int | None], int]
+        Lower bounds on the total turns of sets of secrets found not to be solvable under a bound.
+    """
+
+    def __init__(
+        self,
+        pattern_matrix: PatternKernel | None = None,
+        breadth: int = 2,
+        turns: int | None = None,
+        workers: int = 1,
+        objective: str = EXPECTED,
+        strict: bool = False,
+    ) -> None:
+        """
+        Initialize the solver.
+
+        Parameters
+        ----------
+        pattern_matrix : PatternKernel | None, optional
+            The feedback matrix, defaults to the shared feedback matrix.
+        breadth : int, optional
+            The number of guesses to try at each node, defaults to 2.
+        turns : int | None, optional
+            The number of turns every secret must be solved in, defaults to no limit.
+            A limit makes the search slower, and buckets of the root guess that cannot be solved
+            within it leave as few secrets as found over it.
+        workers : int, optional
+            The number of processes to solve in, defaults to 1.
+        objective : str, optional
+            EXPECTED to minimize the total number of turns, or WORST_CASE to minimize the largest number
+            of turns any secret takes and then the total, defaults to EXPECTED.
+        strict : bool, optional
+            Whether a solve fails when some bucket of the root guesses cannot be solved within the turns,
+            rather than leaving as few secrets of that bucket as found over the limit, defaults to False.
+
+        Raises
+        ------
+        ValueError
+            If the objective is not one of OBJECTIVES.
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(
+                f"Invalid objective {objective!r}, expected one of {', '.join(OBJECTIVES)}"
+            )
+        self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
+        self.shared: bool = pattern_matrix is None
+        self.pattern_matrix: PatternKernel = (
+            get_pattern_matrix() if pattern_matrix is None else pattern_matrix
+        )
+        self.breadth: int = breadth
+        self.turns: int | None = turns
+        self.workers: int = workers
+        self.objective: str = objective
+        self.strict: bool = strict
+        self.memo: dict[tuple[bytes, int | None], tuple[int, Node]] = {}
+        self.bounds: dict[tuple[bytes, int | None], int] = {}
+
+    def get_lower_bounds(self, secret_ids: np.ndarray) -> np.ndarray:
+        """
+        Compute the lower bound on the total turns of every guess over a set of secrets.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ascending ids of the secrets.
+
+        Returns
+        -------
+        np.ndarray
+            The lower bound of each guess, indexed by word id.
+        """
+        n = len(secret_ids)
+        if n <= SORTED_COUNT_MAX_SECRETS:
+            codes = np.sort(
+                self.pattern_matrix.get_codes(secret_ids=secret_ids), axis=1
+            )
+            distinct = 1 + (np.diff(codes, axis=1) != 0).sum(axis=1)
+        else:
+            distinct = (self.pattern_matrix.get_histograms(secret_ids) > 0).sum(axis=1)
+        is_secret = np.zeros(len(distinct), dtype=np.int64)
+        is_secret[secret_ids] = 1
+        return 3 * n - is_secret - distinct
+
+    def get_guesses(
+        self,
+        secret_ids: np.ndarray,
+        breadth: int,
+        turns: int | None = None,
+        largest: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the most promising guesses for a set of secrets.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ascending ids of the secrets.
+        breadth : int
+            The maximum number of guesses to return.
+        turns : int | None, optional
+            The number of turns every secret must be solved in, defaults to no limit.
+            With two turns, only guesses telling every secret apart are returned.
+        largest : bool, optional
+            Whether to order the guesses by their largest bucket before their lower bound, which suits
+            solving within a number of turns better than the total, defaults to False.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The ids of up to `breadth` guesses in order of their lower bound, preferring secrets
+            and then lower ids, and their lower bounds.
+        """
+        n = len(secret_ids)
+        # A secret telling every other secret apart meets the lower bound of the whole set
+        if n <= 243:
+            codes = self.pattern_matrix.get_codes(secret_ids, secret_ids)
+            for i, row in enumerate(codes):
+                if len(np.unique(row)) == n:
+                    return secret_ids[i : i + 1], np.array([2 * n - 1])
+        lower_bounds = self.get_lower_bounds(secret_ids)
+        is_secret = np.zeros(len(lower_bounds), dtype=bool)
+        is_secret[secret_ids] = True
+        if turns == 2:
+            # Only guesses with a feedback pattern per secret leave one turn for each bucket
+            lower_bounds[lower_bounds > 2 * n - is_secret] = INFEASIBLE
+        keys = [~is_secret, lower_bounds]
+        if largest:
+            keys.append(self.pattern_matrix.get_histograms(secret_ids).max(axis=1))
+        guesses = np.lexsort(keys)[:breadth]
+        guesses = guesses[lower_bounds[guesses] < INFEASIBLE]
+        return guesses, lower_bounds[guesses]
+
+    def solve_subtree(
+        self,
+        secret_ids: np.ndarray,
+        turns: int | None = None,
+        bound: int | None = None,
+    ) -> tuple[int, Node] | None:
+        """
+        Find the subtree with the fewest total turns for a set of secrets, if it is under a bound.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ascending ids of the secrets.
+        turns : int | None, optional
+            The number of turns every secret must be solved in, defaults to no limit.
+        bound : int | None, optional
+            Only subtrees with fewer total turns than the bound are of interest, defaults to no bound.
+
+        Returns
+        -------
+        tuple[int, Node] | None
+            The total number of turns to solve every secret and the subtree solving them,
+            or None if no subtree tried is under the bound and within the turns.
+        """
+        n = len(secret_ids)
+        if not is_solvable(n, turns):
+            return None
+        if n == 1:
+            return 1, (int(secret_ids[0]), True, {})
+        key = (secret_ids.tobytes(), turns)
+        limit = INFEASIBLE if bound is None else bound
+        if key in self.memo:
+            memoized = self.memo[key]
+            return memoized if memoized[0] < limit else None
+        if self.bounds.get(key, 0) >= limit:
+            return None
+        solved = self.search(secret_ids, turns, bound)
+        if solved is None:
+            self.bounds[key] = max(self.bounds.get(key, 0), limit)
+        else:
+            self.memo[key] = solved
+        return solved
+
+    def solve_within(
+        self, secret_ids: np.ndarray, turns: int | None
+    ) -> tuple[int, Node]:
+        """
+        Find a subtree for a set of secrets, solving as many of them as possible within a number of turns.
+
+        If no guess tried solves every secret in time, the guess solving the most of them in time is taken,
+        and each of its buckets is solved within one turn fewer in the same way, so only the secrets of
+        the buckets that cannot be solved in time take longer. Those are solved in the fewest turns found.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ascending ids of the secrets.
+        turns : int | None
+            The number of turns every secret should be solved in, or None for no limit.
+
+        Returns
+        -------
+        tuple[int, Node]
+            The total number of turns to solve every secret and the subtree solving them.
+        """
+        solved = self.solve_subtree(secret_ids, turns)
+        if solved is not None:
+            return solved
+        assert turns is not None
+        self.logger.warning(
+            f"Could not solve {len(secret_ids)} secrets within {turns} turns"
+        )
+        if turns <= 1:
+            return self.solve_fewest_turns(secret_ids)
+        guess = self.get_partial_guess(secret_ids, turns)
+        buckets = get_buckets(
+            self.pattern_matrix.get_row(guess, secret_ids), secret_ids
+        )
+        total = len(secret_ids)
+        children = {}
+        for code, bucket in buckets.items():
+            bucket_total, children[code] = self.solve_within(bucket, turns - 1)
+            total += bucket_total
+        return total, (guess, bool((secret_ids == guess).any()), children)
+
+    def get_partial_guess(self, secret_ids: np.ndarray, turns: int) -> int:
+        """
+        Find the guess whose buckets that can be solved within the turns left hold the most secrets.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ascending ids of the secrets, which cannot all be solved within the turns.
+        turns : int
+            The number of turns the secrets should be solved in.
+
+        Returns
+        -------
+        int
+            The id of the guess, among the guesses tried when the search was widened.
+        """
+        best_guess, best_solved = -1, -1
+        for guess in self.get_guesses(secret_ids, FALLBACK_BREADTH, largest=True)[0]:
+            buckets = get_buckets(
+                self.pattern_matrix.get_row(guess, secret_ids), secret_ids
+            )
+            solved = sum(
+                len(bucket)
+                for bucket in buckets.values()
+                if self.solve_subtree(bucket, turns - 1) is not None
+            )
+            if solved > best_solved:
+                best_guess, best_solved = int(guess), solved
+        return best_guess
+
+    def solve_fewest_turns(self, secret_ids: np.ndarray) -> tuple[int, Node]:
+        """
+        Find a subtree for a set of secrets taking the fewest turns for any secret, among the limits tried.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ascending ids of the secrets.
+
+        Returns
+        -------
+        tuple[int, Node]
+            The total number of turns to solve every secret and the subtree solving them.
+        """
+        for turns in range(2, len(secret_ids) + 1):
+            solved = self.solve_subtree(secret_ids, turns)
+            if solved is not None:
+                return solved
+        solved = self.solve_subtree(secret_ids)
+        assert solved is not None
+        return solved
+
+    def search(
+        self,
+        secret_ids: np.ndarray,
+        turns: int | None,
+        bound: int | None,
+    ) -> tuple[int, Node] | None:
+        """
+        Search the subtrees of a set of secrets, trying more guesses if none tried solves them within the turns.
+
+        Without a bound, a failed search means that no guess tried solves the secrets within the turns,
+        rather than that none beats a subtree found elsewhere, so only then is the search widened.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ascending ids of the secrets.
+        turns : int | None
+            The number of turns every secret must be solved in, or None for no limit.
+        bound : int | None
+            Only subtrees with fewer total turns than the bound are of interest, or None for no bound.
+
+        Returns
+        -------
+        tuple[int, Node] | None
+            The total number of turns to solve every secret and the subtree solving them,
+            or None if no subtree tried is under the bound and within the turns.
+        """
+        solved = self.try_guesses(secret_ids, turns, bound, self.breadth)
+        if (
+            solved is None
+            and bound is None
+            and turns is not None
+            and self.breadth < FALLBACK_BREADTH
+        ):
+            solved = self.try_guesses(
+                secret_ids, turns, bound, FALLBACK_BREADTH, largest=True
+            )
+        return solved
+
+    def try_guesses(
+        self,
+        secret_ids: np.ndarray,
+        turns: int | None,
+        bound: int | None,
+        breadth: int,
+        largest: bool = False,
+    ) -> tuple[int, Node] | None:
+        """
+        Try the most promising guesses for a set of secrets, keeping the subtree with the fewest total turns.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ascending ids of the secrets.
+        turns : int | None
+            The number of turns every secret must be solved in, or None for no limit.
+        bound : int | None
+            Only subtrees with fewer total turns than the bound are of interest, or None for no bound.
+        breadth : int
+            The number of guesses to try, in order of their lower bound.
+        largest : bool, optional
+            Whether to order the guesses by their largest bucket first, defaults to False.
+
+        Returns
+        -------
+        tuple[int, Node] | None
+            The total number of turns to solve every secret and the subtree solving them,
+            or None if no subtree tried is under the bound and within the turns.
+        """
+        best = bound
+        best_node: Node | None = None
+        child_turns = None if turns is None else turns - 1
+        for guess, lower_bound in zip(
+            *self.get_guesses(secret_ids, breadth, turns, largest)
+        ):
+            if best is not None and lower_bound >= best:
+                break
+            buckets = get_buckets(
+                self.pattern_matrix.get_row(guess, secret_ids), secret_ids
+            )
+            solved = self.solve_buckets(buckets, child_turns, int(lower_bound), best)
+            if solved is not None and (best is None or solved[0] < best):
+                best, children = solved
+                best_node = (int(guess), bool((secret_ids == guess).any()), children)
+        if best_node is None:
+            return None
+        assert best is not None
+        return best, best_node
+
+    def solve_buckets(
+        self,
+        buckets: dict[int, np.ndarray],
+        turns: int | None,
+        lower_bound: int,
+        bound: int | None,
+    ) -> tuple[int, dict[int, Node]] | None:
+        """
+        Solve the buckets of a guess, largest first, abandoning the guess once its total reaches a bound.
+
+        Parameters
+        ----------
+        buckets : dict[int, np.ndarray]
+            The ascending ids of the secrets giving each feedback code of the guess.
+        turns : int | None
+            The number of turns every secret must be solved in after the guess, or None for no limit.
+        lower_bound : int
+            The lower bound on the total turns of the guess.
+        bound : int | None
+            Only guesses with fewer total turns than the bound are of interest, or None for no bound.
+
+        Returns
+        -------
+        tuple[int, dict[int, Node]] | None
+            The total number of turns of the guess and the subtree of each bucket,
+            or None if some bucket could not be solved under the bound and within the turns.
+        """
+        total = lower_bound
+        children = {}
+        for code, bucket in sorted(buckets.items(), key=lambda b: -len(b[1])):
+            bucket_bound = 2 * len(bucket) - 1
+            solved = self.solve_subtree(
+                bucket,
+                turns,
+                None if bound is None else bound - total + bucket_bound,
+            )
+            if solved is None:
+                return None
+            total += solved[0] - bucket_bound
+            children[code] = solved[1]
+        return total, children
+
+    def solve(self, secret_ids: np.ndarray | None = None) -> tuple[int, Node]:
+        """
+        Find the best decision tree for a set of secrets, by the solver's objective.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray | None, optional
+            The ascending ids of the secrets, defaults to the whole word list.
+
+        Returns
+        -------
+        tuple[int, Node]
+            The total number of turns to solve every secret, and the decision tree solving them.
+        """
+        if secret_ids is None:
+            secret_ids = np.arange(len(self.pattern_matrix.lexicon))
+        if self.objective == WORST_CASE:
+            return self.solve_worst_case(secret_ids)
+        solved = self.solve_roots(secret_ids)
+        assert solved is not None
+        return solved
+
+    def solve_worst_case(self, secret_ids: np.ndarray) -> tuple[int, Node]:
+        """
+        Find the decision tree with the fewest total turns among those taking the fewest turns for any secret.
+
+        Each number of turns is tried in turn, by a strict solver, up to the solver's limit if any.
+        If no tree meets the limit, the tree with the fewest total turns is solved as for EXPECTED.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ascending ids of the secrets.
+
+        Returns
+        -------
+        tuple[int, Node]
+            The total number of turns to solve every secret, and the decision tree solving them.
+        """
+        limit = len(secret_ids) if self.turns is None else self.turns
+        for turns in range(1 if len(secret_ids) == 1 else 2, limit + 1):
+            solver = DecisionTreeSolver(
+                None if self.shared else self.pattern_matrix,
+                self.breadth,
+                turns,
+                self.workers,
+                strict=True,
+            )
+            solved = solver.solve_roots(secret_ids)
+            if solved is not None:
+                self.logger.info(f"Solved every secret within {turns} turns")
+                return solved
+        self.logger.warning(f"Could not solve every secret within {limit} turns")
+        solved = self.solve_roots(secret_ids)
+        assert solved is not None
+        return solved
+
+    def solve_roots(self, secret_ids: np.ndarray) -> tuple[int, Node] | None:
+        """
+        Find the decision tree with the fewest total turns for a set of secrets, within the solver's turns.
+
+        The buckets of each of the most promising root guesses are solved independently,
+        in a pool of processes if there is more than one worker. A bucket that cannot be solved
+        within the turns is solved with as few secrets as found taking longer, unless the solver is strict.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ascending ids of the secrets.
+
+        Returns
+        -------
+        tuple[int, Node] | None
+            The total number of turns to solve every secret, and the decision tree solving them,
+            or None if the solver is strict and no root guess solves every secret within the turns.
+        """
+        roots = self.get_roots(secret_ids)
+        tasks = [bucket for _, _, buckets in roots for bucket in buckets.values()]
+        self.logger.info(f"Solving {len(tasks)} buckets of {len(roots)} root guesses")
+        return get_best_root(len(secret_ids), roots, self.solve_tasks(tasks))
+
+    def get_roots(
+        self, secret_ids: np.ndarray
+    ) -> list[tuple[int, bool, dict[int, np.ndarray]]]:
+        """
+        Split a set of secrets into buckets by the result of each of the most promising root guesses.
+
+        Parameters
+        ----------
+        secret_ids : np.ndarray
+            The ascending ids of the secrets.
+
+        Returns
+        -------
+        list[tuple[int, bool, dict[int, np.ndarray]]]
+            Each root guess, whether it is one of the secrets, and the ascending ids of the secrets
+            giving each feedback code, excluding ALL_CORRECT.
+        """
+        roots = []
+        for guess, _ in zip(*self.get_guesses(secret_ids, self.breadth)):
+            buckets = get_buckets(
+                self.pattern_matrix.get_row(guess, secret_ids), secret_ids
+            )
+            roots.append((int(guess), bool((secret_ids == guess).any()), buckets))
+        return roots
+
+    def solve_tasks(self, tasks: list[np.ndarray]) -> list[tuple[int, Node] | None]:
+        """
+        Solve the buckets of the root guesses, in a pool of processes if there is more than one worker.
+
+        Parameters
+        ----------
+        tasks : list[np.ndarray]
+            The ascending ids of the secrets of each bucket.
+
+        Returns
+        -------
+        list[tuple[int, Node] | None]
+            The total number of turns and the subtree of each bucket, in order,
+            or None for each bucket a strict solver cannot solve within the turns.
+        """
+        if self.workers <= 1:
+            return [solve_bucket(bucket, self) for bucket in tasks]
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_worker,
+            initargs=(
+                self.breadth,
+                self.turns,
+                self.strict,
+                None if self.shared else self.pattern_matrix,
+            ),
+        ) as executor:
+            return list(executor.map(solve_bucket, tasks, chunksize=4))
+
+
+def build_strategy(
+    path: str,
+    breadth: int = 2,
+    workers: int = 1,
+    turns: int | None = MAX_TURNS,
+    objective: str = EXPECTED,
+) -> Strategy:
+    """
+    Solve the shared word list and save the decision tree as a strategy file.
+
+    Parameters
+    ----------
+    path : str
+        The location of the strategy file.
+    breadth : int, optional
+        The number of guesses to try at each node, defaults to 2.
+    workers : int, optional
+        The number of processes to solve in, defaults to 1.
+    turns : int | None, optional
+        The number of turns every secret must be solved in, defaults to MAX_TURNS, the turns of a game.
+    objective : str, optional
+        EXPECTED or WORST_CASE, defaults to EXPECTED.
+
+    Returns
+    -------
+    Strategy
+        The strategy, before it is saved.
+    """
+    solver = DecisionTreeSolver(
+        breadth=breadth, turns=turns, workers=workers, objective=objective
+    )
+    total, root = solver.solve()
+    solver.logger.info(
+        f"Solved {len(solver.pattern_matrix.lexicon)} words in {total} turns"
+    )
+    strategy = Strategy.from_tree(root, solver.pattern_matrix.lexicon)
+    strategy.save(path)
+    return strategy
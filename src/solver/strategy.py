@@ -0,0 +1,310 @@
+"""
+Compact Strategy Artifacts.
+
+This module provides the Strategy class, a decision tree of guesses stored as flat arrays in a small
+binary file that is memory-mapped on load, so looking up the next guess needs no parsing and the pages
+are shared by every process playing from the same file.
+
+Nodes are numbered depth-first from the root, which is node 0. The file consists of a fixed header
+followed by these little-endian arrays:
+
+- `guesses`, `uint32[N]`: the word id guessed at each node.
+- `edge_starts`, `uint32[N + 1]`: node `i` has the edges `edge_starts[i]` to `edge_starts[i + 1]`.
+- `secret_starts` and `secret_ends`, `uint32[N]`: the secrets left at node `i`
+  are `secrets[secret_starts[i]:secret_ends[i]]`.
+- `children`, `uint32[E]`: the node each edge leads to.
+- `secrets`, `uint32[S]`: word ids of the secrets, ordered so that every subtree is contiguous.
+- `codes`, `uint8[E]`: the feedback code of each edge, ascending within a node.
+"""
+
+from common import Lexicon, get_cache_dir, get_lexicon
+import numpy as np
+import os
+
+# file: solver/strategy.py
+
+MAGIC = b"WSTRAT01"
+HEADER = np.dtype(
+    [
+        ("magic", "S8"),
+        ("lexicon", "S16"),
+        ("nodes", "<u4"),
+        ("edges", "<u4"),
+        ("secrets", "<u4"),
+        ("reserved", "<u4"),
+    ]
+)
+ROOT = 0
+
+# A node of a decision tree is a tuple of the guess id, whether the guess is one of the secrets
+# left at the node, and the child node for each feedback code other than ALL_CORRECT
+Node = tuple[int, bool, dict[int, "Node"]]
+
+
+class Strategy:
+    """
+    A decision tree of guesses, giving the next guess for each feedback pattern.
+
+    Attributes
+    ----------
+    lexicon : Lexicon
+        The word list the word ids refer to.
+    guesses : np.ndarray
+        The word id guessed at each node.
+    edge_starts : np.ndarray
+        The offsets of the edges of each node, with one extra entry for the end of the last node.
+    secret_starts : np.ndarray
+        The offset of the first secret left at each node.
+    secret_ends : np.ndarray
+        The offset after the last secret left at each node.
+    children : np.ndarray
+        The node each edge leads to.
+    secrets : np.ndarray
+        The secret word ids, ordered so that every subtree is contiguous.
+    codes : np.ndarray
+        The feedback code of each edge.
+    """
+
+    def __init__(
+        self,
+        lexicon: Lexicon,
+        guesses: np.ndarray,
+        edge_starts: np.ndarray,
+        secret_starts: np.ndarray,
+        secret_ends: np.ndarray,
+        children: np.ndarray,
+        secrets: np.ndarray,
+        codes: np.ndarray,
+    ) -> None:
+        """
+        Initialize a strategy from its arrays.
+
+        Parameters
+        ----------
+        lexicon : Lexicon
+            The word list the word ids refer to.
+        guesses : np.ndarray
+            The word id guessed at each node.
+        edge_starts : np.ndarray
+            The offsets of the edges of each node, with one extra entry for the end of the last node.
+        secret_starts : np.ndarray
+            The offset of the first secret left at each node.
+        secret_ends : np.ndarray
+            The offset after the last secret left at each node.
+        children : np.ndarray
+            The node each edge leads to.
+        secrets : np.ndarray
+            The secret word ids, ordered so that every subtree is contiguous.
+        codes : np.ndarray
+            The feedback code of each edge.
+        """
+        self.lexicon: Lexicon = lexicon
+        self.guesses: np.ndarray = guesses
+        self.edge_starts: np.ndarray = edge_starts
+        self.secret_starts: np.ndarray = secret_starts
+        self.secret_ends: np.ndarray = secret_ends
+        self.children: np.ndarray = children
+        self.secrets: np.ndarray = secrets
+        self.codes: np.ndarray = codes
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self.guesses)
+
+    @classmethod
+    def from_tree(cls, root: Node, lexicon: Lexicon | None = None) -> "Strategy":
+        """
+        Flatten a decision tree into a strategy.
+
+        Parameters
+        ----------
+        root : Node
+            The root of the decision tree.
+        lexicon : Lexicon | None, optional
+            The word list the word ids refer to, defaults to the shared Wordle lexicon.
+
+        Returns
+        -------
+        Strategy
+            The flattened strategy.
+        """
+        guesses: list[int] = []
+        secret_starts: list[int] = []
+        secret_ends: list[int] = []
+        secrets: list[int] = []
+        edges: list[list[tuple[int, int]]] = []
+
+        def visit(node: Node) -> int:
+            index = len(guesses)
+            guesses.append(node[0])
+            secret_starts.append(len(secrets))
+            secret_ends.append(0)
+            edges.append([])
+            if node[1]:
+                secrets.append(node[0])
+            for code, child in sorted(node[2].items()):
+                edges[index].append((code, visit(child)))
+            secret_ends[index] = len(secrets)
+            return index
+
+        visit(root)
+        edge_starts = np.cumsum([0] + [len(e) for e in edges])
+        return cls(
+            get_lexicon() if lexicon is None else lexicon,
+            np.array(guesses, dtype="<u4"),
+            edge_starts.astype("<u4"),
+            np.array(secret_starts, dtype="<u4"),
+            np.array(secret_ends, dtype="<u4"),
+            np.array([child for e in edges for _, child in e], dtype="<u4"),
+            np.array(secrets, dtype="<u4"),
+            np.array([code for e in edges for code, _ in e], dtype=np.uint8),
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Write the strategy to a binary file.
+
+        The file is written to a temporary file first and moved into place, so that
+        concurrent processes never observe a partially written strategy.
+
+        Parameters
+        ----------
+        path : str
+            The location of the file.
+        """
+        header = np.zeros(1, dtype=HEADER)
+        header["magic"] = MAGIC
+        header["lexicon"] = self.lexicon.hash.encode()
+        header["nodes"] = len(self.guesses)
+        header["edges"] = len(self.children)
+        header["secrets"] = len(self.secrets)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(header.tobytes())
+            for array in (
+                self.guesses,
+                self.edge_starts,
+                self.secret_starts,
+                self.secret_ends,
+                self.children,
+                self.secrets,
+            ):
+                f.write(array.astype("<u4").tobytes())
+            f.write(self.codes.astype(np.uint8).tobytes())
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str, lexicon: Lexicon | None = None) -> "Strategy":
+        """
+        Memory-map a strategy from a binary file.
+
+        Parameters
+        ----------
+        path : str
+            The location of the file.
+        lexicon : Lexicon | None, optional
+            The word list the word ids refer to, defaults to the shared Wordle lexicon.
+
+        Returns
+        -------
+        Strategy
+            The memory-mapped strategy.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a strategy, or was built for a different word list.
+        """
+        lexicon = get_lexicon() if lexicon is None else lexicon
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        header = data[: HEADER.itemsize].view(HEADER)[0]
+        if header["magic"] != MAGIC:
+            raise ValueError(f"{path} is not a strategy file")
+        if header["lexicon"].decode() != lexicon.hash:
+            raise ValueError(f"{path} was built for a different word list")
+        nodes, edges, secrets = (
+            int(header["nodes"]),
+            int(header["edges"]),
+            int(header["secrets"]),
+        )
+        arrays = []
+        offset = HEADER.itemsize
+        for size in (nodes, nodes + 1, nodes, nodes, edges, secrets):
+            arrays.append(data[offset : offset + 4 * size].view("<u4"))
+            offset += 4 * size
+        arrays.append(data[offset : offset + edges])
+        return cls(lexicon, *arrays)
+
+    def get_guess(self, node: int) -> int:
+        """
+        Get the word id guessed at a node.
+
+        Parameters
+        ----------
+        node : int
+            The node.
+
+        Returns
+        -------
+        int
+            The id of the guessed word.
+        """
+        return int(self.guesses[node])
+
+    def get_child(self, node: int, code: int) -> int | None:
+        """
+        Follow the edge of a node for a feedback code.
+
+        Parameters
+        ----------
+        node : int
+            The node.
+        code : int
+            The feedback code of the node's guess.
+
+        Returns
+        -------
+        int | None
+            The next node, or None if no secret left at the node gives the feedback.
+        """
+        start, end = int(self.edge_starts[node]), int(self.edge_starts[node + 1])
+        i = start + int(np.searchsorted(self.codes[start:end], code))
+        if i < end and self.codes[i] == code:
+            return int(self.children[i])
+        return None
+
+    def get_secrets(self, node: int) -> np.ndarray:
+        """
+        Get the secrets left at a node.
+
+        Parameters
+        ----------
+        node : int
+            The node.
+
+        Returns
+        -------
+        np.ndarray
+            The ids of the secrets, in depth-first order.
+        """
+        return self.secrets[self.secret_starts[node] : self.secret_ends[node]]
+
+
+def get_strategy_path(name: str, lexicon: Lexicon | None = None) -> str:
+    """
+    Get the location of a strategy file, in the user's cache directory and keyed by the hash of the word list.
+
+    Parameters
+    ----------
+    name : str
+        The name of the strategy.
+    lexicon : Lexicon | None, optional
+        The word list, defaults to the shared Wordle lexicon.
+
+    Returns
+    -------
+    str
+        The location of the strategy file.
+    """
+    lexicon = get_lexicon() if lexicon is None else lexicon
+    return os.path.join(get_cache_dir(), f"wordle_{name}.{lexicon.hash}.bin")
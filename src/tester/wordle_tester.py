@@ -8,24 +8,82 @@ the performance of the bot.
 """
 
 from common.util import RESULT
-from wordle import Wordle
+from wordle import Wordle, check_possible, get_valid_guess, simulate, simulate_batch
 from common import (
     ALL_CORRECT,
     CORRECT_LETTER,
     INCORRECT_LETTER,
     MISPLACED_LETTER,
-    boolean_comprehension,
+    MSG,
+    Pattern,
     prettify_guess,
     prettify_guess_no_color,
+    score_many,
 )
-from bots import BotBehaviors
+from common.parallel import set_thread_count
+from bots import BotBehaviors, Filter
 from tqdm import tqdm  # type: ignore
 
 # I've no idea why MyPy is complaining about tqdm, it works fine.
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable
 import logging
+import time
+import numpy as np
 
 # file: tester/wordle_tester.py
 
+SHARD_SIZE = 64
+
+# Per-process state of the workers of a parallel test, set up once by init_worker
+worker_tester: "WordleTester | None" = None
+worker_bot: BotBehaviors | None = None
+
+
+def init_worker(bot_class: type[BotBehaviors], config: dict, exact: bool) -> None:
+    """
+    Set up a worker process of a parallel test, constructing its tester and bot once.
+
+    The bot is rebuilt from its class and configured like the bot under test, rather than copied,
+    as bots share large structures such as the word list and the feedback matrix that every worker loads itself.
+    The worker evaluates guesses in a single thread, as the workers already occupy every core.
+
+    Parameters
+    ----------
+    bot_class : type[BotBehaviors]
+        The class of the bot under test, constructed without arguments.
+    config : dict
+        The settings of the bot under test, as returned by its get_config, set on the new bot.
+    exact : bool
+        Whether the bot under test filters guesses and results exactly.
+    """
+    global worker_tester, worker_bot
+    set_thread_count(1)
+    worker_tester = WordleTester()
+    worker_bot = bot_class()
+    for name, value in config.items():
+        setattr(worker_bot, name, value)
+    if worker_bot.filter.exact != exact:
+        worker_bot.filter = Filter(exact)
+
+
+def play_shard(words: list[str]) -> list[dict]:
+    """
+    Play one game for each word of a shard in a worker process.
+
+    Parameters
+    ----------
+    words : list[str]
+        The secret words of the shard.
+
+    Returns
+    -------
+    list[dict]
+        The result of each game, in the order of the words.
+    """
+    assert worker_tester is not None and worker_bot is not None
+    return [worker_tester.play(worker_bot, word) for word in words]
+
 
 class WordleTester(Wordle):
     """
@@ -59,7 +117,13 @@ class WordleTester(Wordle):
         self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
 
     def test(
-        self, bot: BotBehaviors, print_results: bool = True, print_failures=False
+        self,
+        bot: BotBehaviors,
+        print_results: bool = True,
+        print_failures=False,
+        workers: int = 1,
+        share_prefixes: bool = False,
+        batch_size: int = 0,
     ) -> None:
         """
         Runs tests on the bot using a predefined list of words.
@@ -68,49 +132,345 @@ class WordleTester(Wordle):
         sets the secret word, and allows the bot to make guesses until the game is over.
         The results of each test are collected and stored in the test_results list.
 
+        With more than one worker, the word list is split into shards that are played in a pool of
+        processes, each of which constructs its own bot once. The results are merged in the order of
+        the word list, so they are the same as those of a serial run.
+
+        When sharing prefixes, the games are played together as a tree instead (see play_tree),
+        which only asks the bot for a guess once per distinct game so far. With a batch size, the games
+        are played in batches that advance one turn at a time instead (see play_batches).
+
         Parameters
         ----------
         bot : BotBehaviors
             An instance of a bot that inherits from BotBehaviors.
             This bot will generate guesses and accept results based on the game's feedback.
+            With more than one worker, each worker constructs a new instance of the bot's class
+            with the same settings instead (see init_worker).
         print_results : bool, optional
             If True, the results of the tests will be printed to the console.
             Defaults to True.
         print_failures : bool, optional
             If True, additionally prints out failed words in the style of Wordle.
             Defaults to False.
+        workers : int, optional
+            The number of worker processes to play the games in.
+            Defaults to 1, which plays every game in this process.
+            Ignored when sharing prefixes or playing in batches.
+        share_prefixes : bool, optional
+            If True, plays the games as a tree, which requires the bot's guesses to only depend on
+            its past guesses and their results. Defaults to False.
+        batch_size : int, optional
+            If positive, plays the games in batches of this many games in lockstep, which also requires
+            the bot's guesses to only depend on its past guesses and their results. Defaults to 0.
         """
         if print_results:
             print("Running tests")
-        for word in tqdm(self.word_list):
-            self.logger.debug(f"Testing {word}")
-            self.start_game()
-            self.secret_word = word
-            while self.game_in_progress:
-                result = self.guess(bot.generate_guess())
-                bot.accept_result(result)
-                if self.secret_word not in bot.possible_words:
-                    print(
-                        f"Bot erroneously eliminated {self.secret_word} from possible word list"
-                    )
-            self.test_results.append(
-                {
-                    "word": self.secret_word,
-                    RESULT: self.results,
-                    "guesses": self.guesses,
-                }
-            )
-            self.logger.debug(f"Result: {self.test_results[-1]}")
-            if self.results[-1] == ALL_CORRECT:
-                self.successes.append(self.secret_word)
-            else:
-                self.failures.append(self.secret_word)
+        results: Iterable[dict]
+        if share_prefixes:
+            results = self.play_tree(bot)
+        elif batch_size > 0:
+            results = self.play_batches(bot, batch_size)
+        elif workers > 1:
+            # Build the bot's caches once, rather than in every worker
+            bot.prepare()
+            results = self.play_in_parallel(bot, workers)
+        else:
+            results = (self.play(bot, word) for word in tqdm(self.word_list))
+        for result in results:
+            self.record(result)
         if print_results:
             print(self.get_results_str())
             if print_failures:
                 print(self.get_failures_str())
                 print(self.get_wacky_failures_string())
 
+    def play(self, bot: BotBehaviors, word: str) -> dict:
+        """
+        Play a single game of the bot against a secret word.
+
+        The game is played with the lean simulate kernel rather than through the Wordle class.
+
+        Parameters
+        ----------
+        bot : BotBehaviors
+            The bot to play the game.
+        word : str
+            The secret word.
+
+        Returns
+        -------
+        dict
+            The result of the game, with the secret word, the results and the guesses.
+        """
+        self.logger.debug(f"Testing {word}")
+        guess_ids: list[int] = []
+        _, results = simulate(
+            bot, self.lexicon.ids[word], guess_ids, self.lexicon, check=True
+        )
+        words = self.lexicon.words
+        return {
+            "word": word,
+            RESULT: results,
+            "guesses": [words[i] for i in guess_ids],
+        }
+
+    def play_batches(self, bot: BotBehaviors, batch_size: int) -> list[dict]:
+        """
+        Play a game against every word of the word list, in batches of games played in lockstep.
+
+        Parameters
+        ----------
+        bot : BotBehaviors
+            The bot to play the games.
+        batch_size : int
+            The number of games per batch.
+
+        Returns
+        -------
+        list[dict]
+            The result of each game, in the order of the word list.
+        """
+        words = self.lexicon.words
+        records: list[dict] = []
+        for start in tqdm(range(0, len(self.word_list), batch_size)):
+            batch = self.word_list[start : start + batch_size]
+            guess_ids: list[list[int]] = []
+            _, results = simulate_batch(
+                bot,
+                np.array([self.lexicon.ids[word] for word in batch]),
+                guess_ids,
+                self.lexicon,
+                check=True,
+            )
+            records.extend(
+                {
+                    "word": word,
+                    RESULT: result,
+                    "guesses": [words[i] for i in guessed],
+                }
+                for word, result, guessed in zip(batch, results, guess_ids)
+            )
+        return records
+
+    def play_tree(self, bot: BotBehaviors) -> list[dict]:
+        """
+        Play a game against every word of the word list, sharing the turns the games have in common.
+
+        Games whose guesses and results are the same so far are played together: the bot makes its
+        guess once, the secrets are split by the result of the guess, and the bot's state is saved
+        and restored to continue each group of secrets separately. The bot is therefore asked for
+        one guess per node of its game tree, rather than one per turn of every game.
+
+        The results are the same as playing each game with play, provided the bot's guesses only
+        depend on its past guesses and their results.
+
+        Parameters
+        ----------
+        bot : BotBehaviors
+            The bot to play the games.
+
+        Returns
+        -------
+        list[dict]
+            The result of each game, in the order of the word list.
+        """
+        secret_ids = np.array([self.lexicon.get_id(word) for word in self.word_list])
+        records: list[dict] = [{} for _ in self.word_list]
+        bot.reset()
+        with tqdm(total=len(self.word_list)) as progress:
+            nodes = self.play_node(
+                bot,
+                np.arange(len(self.word_list)),
+                secret_ids,
+                [],
+                [],
+                records,
+                progress,
+            )
+        self.logger.info(f"Played {len(self.word_list)} games in {nodes} guesses")
+        bot.reset()
+        return records
+
+    def play_node(
+        self,
+        bot: BotBehaviors,
+        positions: np.ndarray,
+        secret_ids: np.ndarray,
+        guesses: list[str],
+        results: list[Pattern],
+        records: list[dict],
+        progress: tqdm,
+    ) -> int:
+        """
+        Play the next turn of a group of games with the same guesses and results so far.
+
+        Parameters
+        ----------
+        bot : BotBehaviors
+            The bot to play the games, in the state shared by the games.
+        positions : np.ndarray
+            The positions of the secrets in the word list.
+        secret_ids : np.ndarray
+            The ids of the secrets.
+        guesses : list[str]
+            The valid guesses made so far.
+        results : list[Pattern]
+            The results of the guesses made so far.
+        records : list[dict]
+            The results of the games, by position in the word list, filled in as the games end.
+        progress : tqdm
+            The progress bar, updated as the games end.
+
+        Returns
+        -------
+        int
+            The number of valid guesses the bot made.
+
+        Raises
+        ------
+        ValueError
+            If the bot makes too many invalid guesses in a row.
+        """
+        # Rejected guesses do not take a turn, as in play
+        guess_id = get_valid_guess(bot, self.lexicon.ids)
+        nodes = 1
+        guesses = guesses + [self.lexicon.words[guess_id]]
+        codes = score_many(guess_id, secret_ids, self.lexicon)
+        state = bot.save_state()
+        for code in np.unique(codes).tolist():
+            selected = codes == code
+            history = results + [Pattern(code)]
+            if code == ALL_CORRECT or len(history) == 6:
+                # The game is over, which resets the bot
+                for position in positions[selected].tolist():
+                    records[position] = {
+                        "word": self.word_list[position],
+                        RESULT: list(history),
+                        "guesses": list(guesses),
+                    }
+                progress.update(int(selected.sum()))
+                continue
+            bot.restore_state(state)
+            bot.accept_result({RESULT: Pattern(code), MSG: None})
+            check_possible(
+                bot.possible_words, secret_ids[selected].tolist(), self.lexicon
+            )
+            nodes += self.play_node(
+                bot,
+                positions[selected],
+                secret_ids[selected],
+                guesses,
+                history,
+                records,
+                progress,
+            )
+        return nodes
+
+    def play_in_parallel(self, bot: BotBehaviors, workers: int) -> list[dict]:
+        """
+        Play a game against every word of the word list in a pool of worker processes.
+
+        Parameters
+        ----------
+        bot : BotBehaviors
+            The bot under test, rebuilt once per worker with the same class and settings.
+        workers : int
+            The number of worker processes.
+
+        Returns
+        -------
+        list[dict]
+            The result of each game, in the order of the word list.
+        """
+        shards = [
+            self.word_list[i : i + SHARD_SIZE]
+            for i in range(0, len(self.word_list), SHARD_SIZE)
+        ]
+        results: list[list[dict]] = [[] for _ in shards]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(type(bot), bot.get_config(), bot.filter.exact),
+        ) as executor:
+            futures = {
+                executor.submit(play_shard, shard): i for i, shard in enumerate(shards)
+            }
+            with tqdm(total=len(self.word_list)) as progress:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    results[i] = future.result()
+                    progress.update(len(shards[i]))
+        return [result for shard in results for result in shard]
+
+    def benchmark(
+        self, bot: BotBehaviors, samples: int = 100, print_results: bool = True
+    ) -> dict[str, float]:
+        """
+        Measure how long the bot takes to generate each guess.
+
+        Games are played against a sample of secret words spread evenly over the word list,
+        timing every call to the bot's generate_guess.
+
+        Parameters
+        ----------
+        bot : BotBehaviors
+            The bot to benchmark.
+        samples : int, optional
+            The number of games to play, defaults to 100.
+        print_results : bool, optional
+            If True, the latencies will be printed to the console.
+            Defaults to True.
+
+        Returns
+        -------
+        dict[str, float]
+            The number of turns timed, and the mean, median, 95th percentile and maximum latency
+            of a turn, in seconds.
+        """
+        step = max(1, len(self.word_list) // samples)
+        latencies = []
+        for word in tqdm(self.word_list[::step][:samples]):
+            self.start_game()
+            self.secret_word = word
+            while self.game_in_progress:
+                start = time.perf_counter()
+                guess = bot.generate_guess()
+                latencies.append(time.perf_counter() - start)
+                bot.accept_result(self.guess(guess))
+        stats = {
+            "turns": float(len(latencies)),
+            "mean": float(np.mean(latencies)),
+            "p50": float(np.percentile(latencies, 50)),
+            "p95": float(np.percentile(latencies, 95)),
+            "max": float(np.max(latencies)),
+        }
+        if print_results:
+            print(
+                f"Per-turn latency over {len(latencies)} turns: "
+                f"mean {1000 * stats['mean']:.1f} ms, "
+                f"p50 {1000 * stats['p50']:.1f} ms, "
+                f"p95 {1000 * stats['p95']:.1f} ms, "
+                f"max {1000 * stats['max']:.1f} ms"
+            )
+        return stats
+
+    def record(self, result: dict) -> None:
+        """
+        Record the result of a game.
+
+        Parameters
+        ----------
+        result : dict
+            The result of the game, with the secret word, the results and the guesses.
+        """
+        self.test_results.append(result)
+        self.logger.debug(f"Result: {result}")
+        if result[RESULT][-1] == ALL_CORRECT:
+            self.successes.append(result["word"])
+        else:
+            self.failures.append(result["word"])
+
     def get_results_str(self) -> str:
         """
         Generate a summary string of the test results, including the number of correct and incorrect guesses, success rates, and failure details.
@@ -141,10 +501,8 @@ class WordleTester(Wordle):
         for r in self.test_results:
             if r[RESULT][-1] == ALL_CORRECT:
                 continue
-            correct_letters += sum(boolean_comprehension(r[RESULT][-1], CORRECT_LETTER))
-            incorrect_letters += sum(
-                boolean_comprehension(r[RESULT][-1], INCORRECT_LETTER)
-            )
+            correct_letters += r[RESULT][-1].count(CORRECT_LETTER)
+            incorrect_letters += r[RESULT][-1].count(INCORRECT_LETTER)
         string += f"\tAverage correct letters on loss: {correct_letters / len(self.failures):.3f}\n"
         string += f"\tAverage incorrect letters on loss: {incorrect_letters / len(self.failures):.3f}\n"
         string += f"\tAverage misplaced letters on loss: {(5 * len(self.failures) - correct_letters - incorrect_letters) / len(self.failures):.3f}\n"
@@ -4,7 +4,10 @@ Module for Wordle Game Functionality.
 This module initializes the Wordle game functionality.
 
 It imports the Wordle class, which contains methods for starting a game,
-making guesses, and checking results.
+making guesses, and checking results, and the simulate and simulate_batch functions,
+which play a bot against one or many secret words without the bookkeeping of the Wordle class,
+rejecting invalid guesses with get_valid_guess and reporting eliminated secrets with check_possible.
 """
 
+from .simulation import check_possible, get_valid_guess, simulate, simulate_batch
 from .wordle import Wordle
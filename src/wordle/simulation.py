@@ -0,0 +1,316 @@
+"""
+Lean Game Simulation.
+
+This module provides the simulate function, which plays a bot against a secret word without the
+bookkeeping of the Wordle class: no error checks, logging or game state, only the turn loop.
+
+It also provides the simulate_batch function, which plays many games in lockstep: each turn, the games
+with the same guesses and results so far share one decision of the bot, and the guesses of every game
+are scored in a single vectorized call.
+
+Both score guesses with the same feedback lookup as the rest of the package, so a simulated game of valid
+guesses gives the same results as a game played through the Wordle class. Unlike the Wordle class, which scores
+any word, guesses that are not valid words are rejected without taking a turn (see get_valid_guess).
+"""
+
+from common import (
+    ALL_CORRECT,
+    MSG,
+    PATTERN_COUNT,
+    RESULT,
+    Pattern,
+    get_lexicon,
+    get_pattern_matrix,
+)
+from common.lexicon import Lexicon
+from common.pattern import PATTERNS
+from bots import BotBehaviors
+from typing import Container
+import numpy as np
+
+# File: wordle/simulation.py
+
+MAX_TURNS = 6
+MAX_INVALID_GUESSES = 6
+NOT_A_VALID_WORD = {RESULT: None, MSG: "Not a valid word!"}
+
+
+def get_valid_guess(bot: BotBehaviors, ids: dict[str, int]) -> int:
+    """
+    Ask a bot for its next guess, rejecting guesses that are not valid words without taking a turn.
+
+    Parameters
+    ----------
+    bot : BotBehaviors
+        The bot to ask, which is told about each rejected guess.
+    ids : dict[str, int]
+        The id of each valid word.
+
+    Returns
+    -------
+    int
+        The id of the first valid guess.
+
+    Raises
+    ------
+    ValueError
+        If the bot makes `MAX_INVALID_GUESSES` invalid guesses in a row, so a broken bot cannot stall a game.
+    """
+    for _ in range(MAX_INVALID_GUESSES):
+        guess = bot.generate_guess()
+        guess_id = ids.get(guess)
+        if guess_id is not None:
+            return guess_id
+        bot.accept_result(NOT_A_VALID_WORD)
+    raise ValueError(
+        f"{bot.__class__.__name__} made {MAX_INVALID_GUESSES} invalid guesses in a row, the last {guess!r}"
+    )
+
+
+def simulate(
+    bot: BotBehaviors,
+    secret_id: int,
+    guess_ids: list[int] | None = None,
+    lexicon: Lexicon | None = None,
+    check: bool = False,
+) -> tuple[int, list[Pattern]]:
+    """
+    Play a game of a bot against a secret word.
+
+    The game ends when the secret is guessed or after six turns. Guesses that are not valid words
+    are rejected without taking a turn, unlike in the Wordle class (see get_valid_guess).
+
+    Parameters
+    ----------
+    bot : BotBehaviors
+        The bot to play the game.
+    secret_id : int
+        The id of the secret word.
+    guess_ids : list[int] | None, optional
+        A list to append the id of each valid guess to, if given.
+    lexicon : Lexicon | None, optional
+        The word list, defaults to the shared Wordle lexicon.
+    check : bool, optional
+        If True, prints a warning whenever the bot eliminates the secret from its possible words.
+        Defaults to False.
+
+    Returns
+    -------
+    tuple[int, list[Pattern]]
+        The number of turns taken, and the feedback pattern of each turn.
+
+    Raises
+    ------
+    ValueError
+        If the bot makes too many invalid guesses in a row.
+    """
+    lexicon = get_lexicon() if lexicon is None else lexicon
+    ids = lexicon.ids
+    get_pattern = get_pattern_matrix().get_pattern
+    codes: list[Pattern] = []
+    while len(codes) < MAX_TURNS:
+        guess_id = get_valid_guess(bot, ids)
+        code = get_pattern(guess_id, secret_id)
+        codes.append(code)
+        if guess_ids is not None:
+            guess_ids.append(guess_id)
+        if code == ALL_CORRECT:
+            bot.accept_result({RESULT: code, MSG: "You win!"})
+            break
+        if len(codes) == MAX_TURNS:
+            bot.accept_result({RESULT: code, MSG: "You lost!"})
+            break
+        bot.accept_result({RESULT: code, MSG: None})
+        if check:
+            check_possible(bot.possible_words, [secret_id], lexicon)
+    return len(codes), codes
+
+
+def simulate_batch(
+    bot: BotBehaviors,
+    secret_ids: np.ndarray,
+    guess_ids: list[list[int]] | None = None,
+    lexicon: Lexicon | None = None,
+    check: bool = False,
+) -> tuple[np.ndarray, list[list[Pattern]]]:
+    """
+    Play a game of a bot against each of many secret words, advancing every game one turn at a time.
+
+    Games are grouped by the state of the bot, which is the same for games with the same guesses
+    and results so far. The bot makes one guess per group, from a saved copy of the group's state,
+    and the guesses of all games are then scored at once. The results are the same as playing each
+    game with simulate, provided the bot's guesses only depend on its past guesses and their results.
+
+    Parameters
+    ----------
+    bot : BotBehaviors
+        The bot to play the games, which is reset before and after.
+    secret_ids : np.ndarray
+        The ids of the secret words.
+    guess_ids : list[list[int]] | None, optional
+        A list to append, for each game, the list of the ids of its valid guesses to, if given.
+    lexicon : Lexicon | None, optional
+        The word list, defaults to the shared Wordle lexicon.
+    check : bool, optional
+        If True, prints a warning whenever the bot eliminates a secret from its possible words.
+        Defaults to False.
+
+    Returns
+    -------
+    tuple[np.ndarray, list[list[Pattern]]]
+        The number of turns taken, and the feedback pattern of each turn, for each game.
+
+    Raises
+    ------
+    ValueError
+        If the bot makes too many invalid guesses in a row.
+    """
+    lexicon = get_lexicon() if lexicon is None else lexicon
+    lookup = get_pattern_matrix()
+    secret_ids = np.asarray(secret_ids, dtype=np.intp)
+    turns = np.zeros(len(secret_ids), dtype=np.intp)
+    codes = np.zeros((len(secret_ids), MAX_TURNS), dtype=np.uint8)
+    guesses = np.zeros((len(secret_ids), MAX_TURNS), dtype=np.intp)
+    bot.reset()
+    states = [bot.save_state()]
+    active = np.arange(len(secret_ids))
+    groups = np.zeros(len(secret_ids), dtype=np.intp)
+    for turn in range(MAX_TURNS):
+        if len(active) == 0:
+            break
+        group_guesses = guess_groups(bot, states, lexicon.ids)
+        guesses[active, turn] = group_guesses[groups]
+        codes[active, turn] = lookup.get_pairs(
+            group_guesses[groups], secret_ids[active]
+        )
+        turns[active] = turn + 1
+        if turn + 1 == MAX_TURNS:
+            break
+        playing = codes[active, turn] != ALL_CORRECT
+        # The games still playing share a state if they shared one and got the same result
+        keys = groups[playing] * PATTERN_COUNT + codes[active[playing], turn]
+        unique, groups = np.unique(keys, return_inverse=True)
+        active = active[playing]
+        states = accept_group_results(bot, states, unique)
+        if check:
+            check_groups(bot, states, secret_ids[active], groups, lexicon)
+    bot.reset()
+    if guess_ids is not None:
+        guess_ids.extend(guesses[i, :n].tolist() for i, n in enumerate(turns.tolist()))
+    return turns, [
+        [PATTERNS[code] for code in codes[i, :n].tolist()]
+        for i, n in enumerate(turns.tolist())
+    ]
+
+
+def guess_groups(
+    bot: BotBehaviors, states: list[dict], ids: dict[str, int]
+) -> np.ndarray:
+    """
+    Make the next guess of each group of games, updating the state of each group in place.
+
+    Parameters
+    ----------
+    bot : BotBehaviors
+        The bot to play the games.
+    states : list[dict]
+        The state of the bot for each group of games.
+    ids : dict[str, int]
+        The id of each valid word.
+
+    Returns
+    -------
+    np.ndarray
+        The id of the guess of each group.
+    """
+    group_guesses = np.empty(len(states), dtype=np.intp)
+    for i, state in enumerate(states):
+        bot.restore_state(state)
+        group_guesses[i] = get_valid_guess(bot, ids)
+        states[i] = bot.save_state()
+    return group_guesses
+
+
+def accept_group_results(
+    bot: BotBehaviors, states: list[dict], keys: np.ndarray
+) -> list[dict]:
+    """
+    Accept the result of the last guess of the groups of games still playing, giving the states of the new groups.
+
+    Parameters
+    ----------
+    bot : BotBehaviors
+        The bot to play the games.
+    states : list[dict]
+        The state of the bot for each group of games.
+    keys : np.ndarray
+        The ascending keys of the new groups, `group * PATTERN_COUNT + code` for the old group and the result.
+
+    Returns
+    -------
+    list[dict]
+        The state of the bot for each new group.
+    """
+    next_states = []
+    for key in keys.tolist():
+        bot.restore_state(states[key // PATTERN_COUNT])
+        bot.accept_result({RESULT: PATTERNS[key % PATTERN_COUNT], MSG: None})
+        next_states.append(bot.save_state())
+    return next_states
+
+
+def check_groups(
+    bot: BotBehaviors,
+    states: list[dict],
+    secret_ids: np.ndarray,
+    groups: np.ndarray,
+    lexicon: Lexicon,
+) -> None:
+    """
+    Print a warning for every secret that the bot eliminated from the possible words of its group.
+
+    Parameters
+    ----------
+    bot : BotBehaviors
+        The bot playing the games.
+    states : list[dict]
+        The state of the bot for each group of games.
+    secret_ids : np.ndarray
+        The ids of the secrets of the games still playing.
+    groups : np.ndarray
+        The group of each game still playing.
+    lexicon : Lexicon
+        The word list.
+    """
+    order = np.argsort(groups, kind="stable")
+    members = np.split(secret_ids[order], np.cumsum(np.bincount(groups))[:-1])
+    for state, group_secret_ids in zip(states, members):
+        check_possible(state["possible_words"], group_secret_ids.tolist(), lexicon)
+
+
+def check_possible(
+    possible_words: list[str], secret_ids: list[int], lexicon: Lexicon
+) -> None:
+    """
+    Print a warning for every secret that is not among a bot's possible words.
+
+    The possible words are put in a set once, so checking many secrets takes a lookup each,
+    and every word of the word list is looked up in its ids without a copy.
+
+    Parameters
+    ----------
+    possible_words : list[str]
+        The bot's possible words.
+    secret_ids : list[int]
+        The ids of the secrets, which the bot should not have eliminated.
+    lexicon : Lexicon
+        The word list.
+    """
+    possible: Container[str] = (
+        lexicon.ids if possible_words is lexicon.word_list else set(possible_words)
+    )
+    for secret_id in secret_ids:
+        if lexicon.words[secret_id] not in possible:
+            print(
+                f"Bot erroneously eliminated {lexicon.words[secret_id]} from possible word list"
+            )
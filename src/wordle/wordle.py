@@ -10,14 +10,16 @@ making guesses, and checking results.
 from random import randint
 from common import (
     boolean_comprehension,
-    get_word_list,
+    get_lexicon,
+    get_pattern_matrix,
+    score_guess,
     LOG_FILE,
     RESULT,
     MSG,
     CORRECT_LETTER,
-    INCORRECT_LETTER,
-    MISPLACED_LETTER,
     ALL_CORRECT,
+    Lexicon,
+    Pattern,
 )
 import logging
 
@@ -39,11 +41,13 @@ class Wordle:
         Indicates whether a game is currently in progress.
     guesses : list[str]
         A list of words guessed by the player.
-    results : list[list[int]]
-        A list of results corresponding to each guess, where each result is a list of integers
+    results : list[Pattern]
+        A list of results corresponding to each guess, where each result is a Pattern
         representing the status of each letter in the guess (correct, misplaced, or incorrect).
+    lexicon : Lexicon
+        The shared word list and its lookup tables.
     word_list : list[str]
-        A list of valid words that can be used in the game.
+        A list of valid words that can be used in the game, shared with the lexicon.
     logger : logging.Logger
         A logger instance for logging game events and errors.
 
@@ -55,6 +59,8 @@ class Wordle:
         Returns a list of indices where the value is 1 in the given list.
     is_misplaced_letter(letter: str, word: str, result: list[int], index: int) -> bool
         Check if a letter in the guessed word is misplaced compared to the secret word.
+    get_pattern(guess_id: int, secret_id: int) -> Pattern
+        Look up the feedback code of a guess against a secret by word id.
     check_error_conditions(word: str) -> dict
         Check for error conditions before making a guess and returns a dictionary with the result and message.
     guess(word: str) -> dict
@@ -69,14 +75,15 @@ class Wordle:
 
         Sets the secret word to an empty string, initializes the number of turns taken to 0,
         and sets the game in progress flag to False. Initialize lists for guesses and results.
-        Loads the word list from a file and sets up logging.
+        Uses the shared word list and sets up logging.
         """
         self.secret_word: str = ""
         self.turns_taken: int = 0
         self.game_in_progress: bool = False
         self.guesses: list[str] = []
-        self.results: list[list[int]] = []
-        self.word_list: list[str] = get_word_list()
+        self.results: list[Pattern] = []
+        self.lexicon: Lexicon = get_lexicon()
+        self.word_list: list[str] = self.lexicon.word_list
         self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
         logging.basicConfig(
             filename=LOG_FILE,
@@ -124,8 +131,8 @@ class Wordle:
         Check if a letter in the guessed word is misplaced compared to the secret word.
 
         A letter is considered misplaced if it exists in the secret word but is not in the correct position
-        and the number of occurrences in the secret word is greater than or equal to the number of
-        occurrences in the guessed word up to the current index.
+        and the number of occurrences in the secret word that are not guessed correctly is greater than or
+        equal to the number of occurrences in the guessed word up to the current index that are not guessed correctly.
 
         Parameters
         ----------
@@ -156,12 +163,34 @@ class Wordle:
         secret_count = sum(occurances_in_secret_word) - sum(
             idx in correct_indices for idx in letter_indices
         )
-        guess_count = sum(occurances_in_guess[: index + 1])
+        guess_count = sum(occurances_in_guess[: index + 1]) - sum(
+            idx in correct_indices for idx in letter_indices if idx <= index
+        )
         self.logger.info(f"S: {secret_count}\tG: {guess_count}")
         if secret_count == 0 or secret_count < guess_count:
             return False
         return True
 
+    def get_pattern(self, guess_id: int, secret_id: int) -> Pattern:
+        """
+        Look up the feedback code of a guess against a secret by word id.
+
+        Word ids are indices into the lexicon. The feedback matrix is loaded on first use.
+
+        Parameters
+        ----------
+        guess_id : int
+            The id of the guessed word.
+        secret_id : int
+            The id of the secret word.
+
+        Returns
+        -------
+        Pattern
+            The interned feedback pattern.
+        """
+        return get_pattern_matrix().get_pattern(guess_id, secret_id)
+
     def check_error_conditions(self, word: str) -> dict:
         """
         Check for error conditions before making a guess.
@@ -183,7 +212,7 @@ class Wordle:
         if not self.game_in_progress:
             self.logger.warning("Game not started!")
             return {RESULT: None, MSG: "Game not started!"}
-        if word not in self.word_list:
+        if not self.lexicon.is_valid_word(word):
             self.logger.warning("Not a valid word!")
             return {RESULT: None, MSG: "Not a valid word!"}
         return {RESULT: None, MSG: None}
@@ -204,7 +233,7 @@ class Wordle:
         -------
         dict
             A dictionary containing the result of the guess and a message.
-            If the guess is valid, the result is a list indicating the status of each letter
+            If the guess is valid, the result is a Pattern indicating the status of each letter
             (correct, misplaced, or incorrect). If the player wins, the message indicates a win.
             If the player loses, the message indicates a loss.
             If there are errors, the result is None and the message describes the error.
@@ -213,22 +242,7 @@ class Wordle:
         errors = self.check_error_conditions(word)
         if errors[RESULT] is not None:
             return errors
-        result = []
-        index = 0
-
-        for correct_letter, guessed_letter in zip(self.secret_word, word):
-            if guessed_letter == correct_letter:
-                result.append(CORRECT_LETTER)
-            else:
-                result.append(INCORRECT_LETTER)
-        index = 0
-        for correct_letter, guessed_letter, r in zip(self.secret_word, word, result):
-            if r is CORRECT_LETTER:
-                index += 1
-                continue
-            elif self.is_misplaced_letter(guessed_letter, word, result, index):
-                result[index] = MISPLACED_LETTER
-            index += 1
+        result = score_guess(word, self.secret_word)
         self.turns_taken += 1
         if self.turns_taken == 6:
             self.game_in_progress = False
@@ -0,0 +1,23 @@
+"""
+Shared fixtures of the test suite.
+
+Opening books built by the tests are kept in a temporary directory rather than the user's cache directory,
+shared by every test so that each book is only built once per run.
+"""
+
+import pytest
+from bots import opening_book  # type: ignore
+
+# file: tests/conftest.py
+
+
+@pytest.fixture(scope="session")
+def book_dir(tmp_path_factory) -> str:
+    """Get the temporary directory of the opening books built by the tests."""
+    return str(tmp_path_factory.mktemp("books"))
+
+
+@pytest.fixture(autouse=True)
+def isolate_books(book_dir, monkeypatch):
+    """Build and load opening books in the temporary directory."""
+    monkeypatch.setattr(opening_book, "get_cache_dir", lambda: book_dir)
@@ -5,7 +5,7 @@ This module contains unit tests for the BotBehaviors class, ensuring that the bo
 """
 
 from common.util import MSG, RESULT  # type: ignore
-from bots import BotBehaviors  # type: ignore
+from bots import BayesianBot, BotBehaviors  # type: ignore
 from bots.util import GUESSES, RESULTS  # type: ignore
 
 
@@ -73,3 +73,41 @@ class TestBotBehaviors:
         assert bot_behaviors.guesses[GUESSES] == []
         assert bot_behaviors.guesses[RESULTS] == []  # Assuming the bot resets
         assert bot_behaviors.possible_words == bot_behaviors.filter.word_list
+
+    def test_incremental_filtering(self):
+        """Test that each accepted result narrows the possible words to those compatible with every guess."""
+        bot_behaviors = BotBehaviors()
+        for guess, result in [("CRANE", [0, 1, 0, 0, 1]), ("SPOIL", [0, 0, 0, 0, 0])]:
+            bot_behaviors.guesses[GUESSES].append(guess)
+            bot_behaviors.accept_result({RESULT: result, MSG: None})
+        assert bot_behaviors.possible_words == (
+            bot_behaviors.filter.filter_compatible_with_past_guesses(
+                bot_behaviors.filter.word_list, bot_behaviors.guesses
+            )
+        )
+        assert "TUBER" in bot_behaviors.possible_words
+
+    def test_save_state(self):
+        """Test that a saved state is restored after further guesses and results."""
+        bot_behaviors = BotBehaviors()
+        bot_behaviors.guesses[GUESSES].append("CRANE")
+        bot_behaviors.accept_result({RESULT: [0, 1, 0, 0, 1], MSG: None})
+        state = bot_behaviors.save_state()
+        possible_words = bot_behaviors.possible_words
+        bot_behaviors.guesses[GUESSES].append("SPOIL")
+        bot_behaviors.accept_result({RESULT: [0, 0, 0, 0, 0], MSG: None})
+        assert len(bot_behaviors.possible_words) < len(possible_words)
+        bot_behaviors.restore_state(state)
+        assert bot_behaviors.guesses[GUESSES] == ["CRANE"]
+        assert len(bot_behaviors.guesses[RESULTS]) == 1
+        assert bot_behaviors.possible_words == possible_words
+
+    def test_generate_guess_by_deadline(self):
+        """Test that bots with cheap guesses ignore deadlines, even past ones."""
+        bot = BayesianBot()
+        for _ in range(2):
+            state = bot.save_state()
+            guess = bot.generate_guess()
+            bot.restore_state(state)
+            assert bot.generate_guess(deadline=0.0) == guess
+            bot.accept_result({RESULT: [0, 0, 0, 0, 0], MSG: None})
@@ -9,10 +9,14 @@ import io
 from contextlib import redirect_stdout
 import pytest
 from bots.bot_behaviors import BotBehaviors  # type: ignore
+from bots.bayesian_bot import BayesianBot  # type: ignore
 from bots.example_bot import ExampleBot  # type: ignore
 from bots.util import GUESSES, RESULTS  # type: ignore
 from common.util import RESULT, get_all_subclasses  # type: ignore
 from cli.cli import Cli  # type: ignore
+from cli.speculation import Speculator  # type: ignore
+from common import Pattern  # type: ignore
+import time
 from .cli_test_utils import string_sequence_generator  # type: ignore
 
 # file: tests/test_cli.py
@@ -94,6 +98,106 @@ class TestCli:
         assert "ABENG" in f.getvalue().splitlines()[0]  # Should be first word
         assert len(cli.bot.guesses[GUESSES]) == 0  # Should have no guesses
 
+    def test_speculative_guess(self, monkeypatch):
+        """Test that the Cli shows the speculated suggestion, which matches the bot's own"""
+        # Setup output mocking and new Cli instance
+        f = io.StringIO()
+        cli = Cli()
+        cli.bot = BayesianBot()
+
+        # Suggest a first guess, and wait for every result of it to be played out
+        with redirect_stdout(f):
+            cli.provide_guess()
+        cli.speculator.thread.join()
+        guess = f.getvalue().split()[3]
+        assert len(cli.speculator.suggestions) > 100
+
+        # Play the suggested guess
+        gen = string_sequence_generator([guess, "01000"])
+        monkeypatch.setattr("builtins.input", lambda _: next(gen))
+        with redirect_stdout(f):
+            cli.accept_guess()
+            cli.accept_result()
+        key = (
+            tuple(cli.bot.guesses[GUESSES]),
+            (int(cli.bot.guesses[RESULTS][0][RESULT]),),
+        )
+        speculated = cli.speculator.suggestions[key]
+
+        # The suggestion is the bot's own
+        state = cli.bot.save_state()
+        expected = (cli.bot.generate_guess(), len(cli.bot.possible_words))
+        cli.bot.restore_state(state)
+        assert speculated == expected
+        f = io.StringIO()
+        with redirect_stdout(f):
+            cli.provide_guess()
+        assert f"{expected[0]} (of {expected[1]} words)" in f.getvalue()
+        cli.speculator.cancel()
+
+    def test_contradictory_results(self, monkeypatch):
+        """Test that the Cli reports results leaving no possible word instead of suggesting one"""
+        f = io.StringIO()
+        cli = Cli()
+        cli.bot = ExampleBot()
+        gen = string_sequence_generator(["GHOST", "00000", "GHOST", "22221"])
+        monkeypatch.setattr("builtins.input", lambda _: next(gen))
+        with redirect_stdout(f):
+            for _ in range(2):
+                cli.accept_guess()
+                cli.accept_result()
+            cli.provide_guess()
+        assert "No suggestion" in f.getvalue().splitlines()[-1]
+        assert cli.bot.guesses[GUESSES] == ["GHOST", "GHOST"]
+
+    def test_speculation_deviation(self, monkeypatch):
+        """Test that the Cli discards speculation when the user plays another word"""
+        # Setup output mocking and new Cli instance
+        f = io.StringIO()
+        cli = Cli()
+        cli.bot = ExampleBot()
+
+        # Suggest ABENG, then play GHOST instead
+        gen = string_sequence_generator(["GHOST", "00000"])
+        monkeypatch.setattr("builtins.input", lambda _: next(gen))
+        with redirect_stdout(f):
+            cli.provide_guess()
+            cli.accept_guess()
+            cli.accept_result()
+        assert cli.speculator.guess is None
+        assert cli.speculator.cancelled.is_set()
+        assert (
+            cli.speculator.get(cli.bot.guesses[GUESSES], cli.bot.guesses[RESULTS])
+            is None
+        )
+
+        # The next suggestion is computed directly
+        with redirect_stdout(f):
+            cli.provide_guess()
+        assert "Suggested next word" in f.getvalue().splitlines()[-1]
+        cli.speculator.cancel()
+
+    def test_speculation_wait(self, monkeypatch):
+        """Test that asking for a suggestion being speculated on waits for it rather than missing it"""
+        bot = BayesianBot()
+        generate_guess = BayesianBot.generate_guess
+
+        def slow_guess(self):
+            time.sleep(0.05)
+            return generate_guess(self)
+
+        monkeypatch.setattr(BayesianBot, "generate_guess", slow_guess)
+        speculator = Speculator(bot)
+        speculator.start(bot.save_state(), "AROSE")
+        current = None
+        while current is None:
+            time.sleep(0.001)
+            current = speculator.current
+        guesses, codes = current
+        results = [{RESULT: Pattern(code)} for code in codes]
+        assert speculator.get(list(guesses), results) is not None
+        speculator.cancel()
+
     def test_accept_guess(self, monkeypatch):
         """Test that the Cli can corectly accept guesses"""
         # Setup output mocking and new Cli instance
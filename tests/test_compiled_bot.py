@@ -0,0 +1,69 @@
+"""
+Test suite for the CompiledBot class.
+
+This module contains tests for compiling bots into strategy files, ensuring that a CompiledBot
+plays exactly the same games as the bot it was compiled from.
+"""
+
+import numpy as np
+import pytest
+from bots import BayesianBot, CompiledBot, ExampleBot  # type: ignore
+from bots import compiled_bot  # type: ignore
+from bots.compiled_bot import compile_bot, get_compiled_path  # type: ignore
+from tester.wordle_tester import WordleTester  # type: ignore
+
+# file: tests/test_compiled_bot.py
+
+SECRET_IDS = np.arange(0, 14855, 100)
+
+
+class TestCompiledBot:
+    """
+    Unit tests for the CompiledBot class.
+
+    This class tests that compiled strategies replay the guesses of the original bots.
+    """
+
+    @pytest.mark.parametrize("bot_class", [ExampleBot, BayesianBot])
+    def test_same_games(self, bot_class, tmp_path):
+        """Test that a compiled bot plays the same games as the original bot."""
+        path = str(tmp_path / "compiled.bin")
+        compile_bot(bot_class(), SECRET_IDS).save(path)
+        original = WordleTester()
+        original.word_list = [original.word_list[i] for i in SECRET_IDS.tolist()]
+        original.test(bot_class(), print_results=False)
+        compiled = WordleTester()
+        compiled.word_list = original.word_list
+        compiled.test(CompiledBot(bot_class(), path), print_results=False)
+        assert compiled.test_results == original.test_results
+
+    def test_keeps_every_secret(self):
+        """Test that the compiled strategy keeps every secret, including those the bot loses."""
+        strategy = compile_bot(ExampleBot(), SECRET_IDS)
+        assert sorted(strategy.get_secrets(0).tolist()) == SECRET_IDS.tolist()
+
+    def test_compiles_once(self, tmp_path, monkeypatch):
+        """Test that a parallel test compiles the strategy once, before its workers load it."""
+        log = tmp_path / "compiled.log"
+
+        def compile_secrets(bot):
+            with open(log, "a") as f:
+                f.write("compiled\n")
+            return compile_bot(bot, SECRET_IDS)
+
+        monkeypatch.setattr(compiled_bot, "compile_bot", compile_secrets)
+        path = str(tmp_path / "compiled.bin")
+        tester = WordleTester()
+        tester.word_list = [tester.word_list[i] for i in SECRET_IDS.tolist()]
+        tester.test(CompiledBot(ExampleBot(), path), print_results=False, workers=2)
+        assert log.read_text() == "compiled\n"
+        assert len(tester.test_results) == len(SECRET_IDS)
+
+    def test_path(self):
+        """Test that strategies are kept apart by the class and configuration of the compiled bot."""
+        bot = BayesianBot()
+        path = get_compiled_path(bot)
+        assert path == get_compiled_path(BayesianBot())
+        bot.MAX_WORDS = 4
+        assert get_compiled_path(bot) != path
+        assert get_compiled_path(ExampleBot()) != path
@@ -0,0 +1,70 @@
+"""
+Test suite for the Constraint class in the bots module.
+
+This module contains unit tests for the Constraint class, ensuring that constraints
+accept exactly the words the original letter-by-letter filters accepted.
+"""
+
+from common import Pattern  # type: ignore
+from common import get_lexicon  # type: ignore
+from common.lexicon import get_letter_counts, words_to_letters  # type: ignore
+from bots import Filter  # type: ignore
+from bots.constraint import Constraint  # type: ignore
+
+# file: tests/test_constraint.py
+
+WORDS = ["APPLE", "WORLD", "THERE", "HELLO", "PLATE", "TOTAL"]
+LETTERS = words_to_letters(WORDS)
+COUNTS = get_letter_counts(LETTERS)
+
+
+def matching(constraint: Constraint) -> list[str]:
+    """Get the words that meet a constraint, checking them with its vectorized mask and its bitsets."""
+    words = [w for w, ok in zip(WORDS, constraint.get_mask(LETTERS, COUNTS)) if ok]
+    lexicon = get_lexicon()
+    bitset = sum(1 << lexicon.ids[w] for w in WORDS)
+    selected = constraint.get_bitset(lexicon.bitsets, bitset)
+    assert [w for w in WORDS if selected >> lexicon.ids[w] & 1] == words
+    return words
+
+
+class TestConstraint:
+    """
+    Unit tests for the Constraint class.
+
+    This class tests the conversion of guesses and results to constraints, and the combination of constraints.
+    """
+
+    def test_from_result(self):
+        """Test that a compiled constraint matches the expected words."""
+        constraint = Constraint.from_result("THERE", Pattern.from_list([0, 0, 0, 1, 0]))
+        assert matching(constraint) == ["WORLD"]
+        constraint = Constraint.from_result("APPLE", {"result": [0, 0, 0, 0, 2]})
+        assert matching(constraint) == ["THERE"]
+
+    def test_combine(self):
+        """Test that combined constraints match words compatible with every guess."""
+        first = Constraint.from_result("PLATE", Pattern.from_list([1, 1, 1, 0, 2]))
+        second = Constraint.from_result("TOTAL", Pattern.from_list([0, 0, 0, 1, 1]))
+        combined = first.combine(second)
+        assert matching(combined) == [
+            w for w in matching(first) if w in matching(second)
+        ]
+        assert matching(combined) == ["APPLE"]
+
+    def test_contradiction(self):
+        """Test that contradictory letter counts match no words."""
+        constraint = Constraint()
+        constraint.min_counts[0] = 2
+        constraint.max_counts[0] = 1
+        assert matching(constraint) == []
+
+    def test_words_outside_word_list(self):
+        """Test that the filter handles words missing from the word list."""
+        filter_instance = Filter()
+        words = ["AAAAB", "APPLE"]
+        result = Pattern.from_list([2, 0, 0, 0, 0])
+        assert filter_instance.filter_compatible_with_guess(words, "AZZZZ", result) == [
+            "AAAAB",
+            "APPLE",
+        ]
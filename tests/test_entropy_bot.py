@@ -0,0 +1,158 @@
+"""
+Test suite for the EntropyBot class.
+
+This module contains tests for the EntropyBot class, specifically for the entropy of feedback histograms
+and for the guesses the bot generates.
+"""
+
+import numpy as np
+import pytest
+import time
+from common.util import RESULT, MSG  # type: ignore
+from bots import EntropyBot  # type: ignore
+from bots.entropy_bot import get_entropies, get_letter_scores  # type: ignore
+from bots.util import GUESSES  # type: ignore
+from common import parallel  # type: ignore
+from common.parallel import set_thread_count  # type: ignore
+from wordle import Wordle  # type: ignore
+
+# file: tests/test_entropy_bot.py
+
+
+class TestEntropyBot:
+    """
+    Unit tests for the EntropyBot class.
+
+    This class tests that the EntropyBot measures information correctly and solves games.
+    """
+
+    def test_get_entropies(self):
+        """Test the entropy of some simple feedback histograms."""
+        histograms = np.zeros((3, 243), dtype=np.int64)
+        histograms[0, 0] = 4
+        histograms[1, :2] = 2
+        histograms[2, :4] = 1
+        assert np.allclose(get_entropies(histograms), [0.0, 1.0, 2.0])
+
+    def test_generate_first_guess(self):
+        """Test that the first guess is the precomputed opening."""
+        bot = EntropyBot()
+        assert bot.generate_guess() == "TARES"
+
+    def test_generate_next_guess(self):
+        """Test that the next guess is the most informative, preferring possible words."""
+        bot = EntropyBot()
+        bot.guesses[GUESSES].append("TARES")
+        bot.accept_result({RESULT: [0, 0, 0, 0, 0], MSG: None})
+        guess = bot.generate_next_guess()
+        assert bot.lexicon.is_valid_word(guess)
+        ids = np.array([bot.lexicon.ids[w] for w in bot.possible_words])
+        entropies = get_entropies(bot.pattern_matrix.get_histograms(ids))
+        assert np.isclose(entropies[bot.lexicon.ids[guess]], entropies.max())
+        # With only two words left, one of them is guessed
+        bot.possible_words = ["MUSIC", "MAGIC"]
+        assert bot.generate_next_guess() == "MUSIC"
+
+    def test_solves_games(self):
+        """Test that the bot solves a few games."""
+        wordle = Wordle()
+        bot = EntropyBot()
+        for secret in ["MUSIC", "ZIRAM", "HELLO"]:
+            wordle.start_game()
+            wordle.secret_word = secret
+            while wordle.game_in_progress:
+                bot.accept_result(wordle.guess(bot.generate_guess()))
+            assert wordle.guesses[-1] == secret
+
+    def test_contradictory_results(self):
+        """Test that results leaving no possible word are reported clearly rather than failing to index."""
+        bot = EntropyBot()
+        for result in ([0, 0, 0, 0, 0], [2, 2, 2, 2, 1]):
+            bot.guesses[GUESSES].append("TARES")
+            bot.accept_result({RESULT: result, MSG: None})
+        assert bot.possible_words == []
+        with pytest.raises(ValueError, match="No word"):
+            bot.generate_guess()
+        with pytest.raises(ValueError, match="No word"):
+            bot.generate_guess(deadline=time.monotonic() + 1)
+
+    def test_parallel_entropies(self, monkeypatch):
+        """Test that entropies computed over blocks of guesses in threads equal those computed at once."""
+        bot = EntropyBot()
+        candidates = np.arange(0, len(bot.lexicon), 7)
+        expected = get_entropies(bot.pattern_matrix.get_histograms(candidates))
+        monkeypatch.setattr(parallel, "MIN_PARALLEL_ELEMENTS", 0)
+        try:
+            set_thread_count(4)
+            assert np.array_equal(bot.get_entropies(candidates), expected)
+        finally:
+            set_thread_count(None)
+
+    def test_deadline_skips_unloaded_book(self, monkeypatch):
+        """Test that a guess by a deadline does not load or build the opening book, but uses it once loaded."""
+
+        def fail(self, path):
+            raise AssertionError("The opening book was built within a deadline")
+
+        bot = EntropyBot()
+        bot.guesses[GUESSES].append("TARES")
+        bot.accept_result({RESULT: [0, 0, 0, 0, 0], MSG: None})
+        state = bot.save_state()
+        build = EntropyBot.build_opening_book
+        monkeypatch.setattr(EntropyBot, "build_opening_book", fail)
+        guess = bot.generate_guess(deadline=time.monotonic() + 0.05)
+        assert bot.lexicon.is_valid_word(guess) and bot.opening_book is None
+        monkeypatch.setattr(EntropyBot, "build_opening_book", build)
+        bot.prepare()
+        bot.restore_state(state)
+        expected = bot.get_book_guess()
+        assert expected and bot.generate_guess(deadline=time.monotonic()) == expected
+
+    def test_parallel_deadline(self, monkeypatch):
+        """Test that guesses scored by a deadline are split between threads, and give the same guess."""
+        bot = EntropyBot()
+        bot.guesses[GUESSES].append("TARES")
+        bot.accept_result({RESULT: [0, 0, 0, 0, 0], MSG: None})
+        expected = bot.generate_next_guess()
+        get_executor = parallel.get_executor
+        calls = []
+
+        def count_calls():
+            calls.append(1)
+            return get_executor()
+
+        monkeypatch.setattr(parallel, "get_executor", count_calls)
+        try:
+            set_thread_count(4)
+            assert bot.generate_next_guess_by(time.monotonic() + 600) == expected
+        finally:
+            set_thread_count(None)
+        assert calls
+
+    def test_get_letter_scores(self):
+        """Test that letters splitting the possible words evenly score highest."""
+        presence = np.zeros((3, 26), dtype=bool)
+        presence[0, [0, 1]] = True
+        presence[1, [0, 2]] = True
+        presence[2, [0, 3]] = True
+        # A is in every candidate and tells nothing, B and C split them
+        assert list(get_letter_scores(presence, np.array([0, 1]))) == [1, 1, 0]
+
+    def test_generate_guess_by_deadline(self):
+        """Test that a deadline bounds the scoring, and that a distant one changes nothing."""
+        bot = EntropyBot()
+        bot.guesses[GUESSES].append("TARES")
+        bot.accept_result({RESULT: [0, 0, 0, 0, 0], MSG: None})
+        state = bot.save_state()
+        expected = bot.generate_next_guess()
+        assert bot.generate_next_guess_by(time.monotonic() + 600) == expected
+        # Past the deadline, the most promising guess is returned unscored
+        candidates = bot.get_candidate_ids()
+        ranked = np.argmax(get_letter_scores(bot.letter_presence, candidates))
+        assert bot.generate_next_guess_by(time.monotonic()) == bot.lexicon.words[ranked]
+        bot.restore_state(state)
+        start = time.monotonic()
+        guess = bot.generate_guess(deadline=start + 0.005)
+        assert time.monotonic() - start < 1
+        assert bot.lexicon.is_valid_word(guess)
+        assert bot.guesses[GUESSES][-1] == guess
@@ -4,7 +4,9 @@ Test suite for the Filter class in the bots module.
 This module contains unit tests for the Filter class, ensuring that the filtering methods work as expected.
 """
 
+import numpy as np
 from common.util import RESULT  # type: ignore
+from common import score_guess  # type: ignore
 from bots import Filter  # type: ignore
 from bots.util import GUESSES, RESULTS  # type: ignore
 
@@ -189,3 +191,183 @@ class TestFilter:
         words = ["APPLE", "WORLD", "THERE", "HELLO"]
         filtered_words = filter_instance.filter_unique_letters(words)
         assert filtered_words == ["WORLD"]
+
+    def test_word_id_arrays(self):
+        """Test that every filter accepts and returns arrays of word ids."""
+        filter_instance = Filter()
+        words = ["APPLE", "WORLD", "THERE", "HELLO"]
+        ids = np.array([filter_instance.lexicon.ids[word] for word in words])
+
+        def to_words(selected):
+            assert isinstance(selected, np.ndarray)
+            return [filter_instance.word_list[i] for i in selected]
+
+        assert to_words(filter_instance.filter_containing_letter(ids, "E")) == [
+            "APPLE",
+            "THERE",
+            "HELLO",
+        ]
+        assert to_words(filter_instance.filter_not_containing_letter(ids, "E")) == [
+            "WORLD"
+        ]
+        assert to_words(filter_instance.filter_containing_letter_at(ids, "E", 4)) == [
+            "APPLE",
+            "THERE",
+        ]
+        assert to_words(
+            filter_instance.filter_not_containing_letter_at(ids, "E", 4)
+        ) == ["WORLD", "HELLO"]
+        assert to_words(
+            filter_instance.filter_compatible_with_guess(
+                ids, "THERE", {RESULT: [0, 0, 0, 1, 0]}
+            )
+        ) == ["WORLD"]
+        assert to_words(filter_instance.filter_unique_letters(ids)) == ["WORLD"]
+        assert filter_instance.get_letter_count(
+            ids
+        ) == filter_instance.get_letter_count(words)
+        assert filter_instance.is_letter_possible(ids, "W") is True
+        assert filter_instance.is_letter_possible(ids, "Z") is False
+
+    def test_get_letter_count(self):
+        """Test that letters are counted and keyed in order of first appearance."""
+        filter_instance = Filter()
+        counts = filter_instance.get_letter_count(["WORLD", "HELLO"])
+        assert list(counts.items()) == [
+            ("W", 1),
+            ("O", 2),
+            ("R", 1),
+            ("L", 3),
+            ("D", 1),
+            ("H", 1),
+            ("E", 1),
+        ]
+
+    def test_bitsets(self):
+        """Test that the filters give the same words for bitsets of word ids as for lists."""
+        filter_instance = Filter()
+        words = ["APPLE", "HELLO", "THERE", "WORLD"]
+        bitset = filter_instance.to_bitset(words)
+        index = filter_instance.lexicon.bitsets
+        assert filter_instance.count_words(bitset) == 4
+        assert filter_instance.to_bitset(filter_instance.word_list) == index.all
+
+        def to_words(candidates):
+            return [filter_instance.word_list[i] for i in index.to_ids(candidates)]
+
+        assert to_words(bitset) == words
+        assert to_words(filter_instance.filter_containing_letter(bitset, "E")) == [
+            "APPLE",
+            "HELLO",
+            "THERE",
+        ]
+        assert to_words(filter_instance.filter_not_containing_letter(bitset, "E")) == [
+            "WORLD"
+        ]
+        assert to_words(
+            filter_instance.filter_containing_letter_at(bitset, "E", 4)
+        ) == ["APPLE", "THERE"]
+        assert to_words(
+            filter_instance.filter_not_containing_letter_at(bitset, "E", 4)
+        ) == ["HELLO", "WORLD"]
+        assert to_words(
+            filter_instance.filter_compatible_with_guess(
+                bitset, "THERE", {RESULT: [0, 0, 0, 1, 0]}
+            )
+        ) == ["WORLD"]
+        assert to_words(filter_instance.filter_unique_letters(bitset)) == ["WORLD"]
+        assert filter_instance.get_letter_count(
+            bitset
+        ) == filter_instance.get_letter_count(words)
+        assert list(filter_instance.get_letter_count(bitset)) == list(
+            filter_instance.get_letter_count(words)
+        )
+        assert filter_instance.is_letter_possible(bitset, "W") is True
+        assert filter_instance.is_letter_possible(bitset, "Z") is False
+
+    def test_bitset_constraints(self):
+        """Test that past guesses filter the whole word list the same way as bitsets and as lists."""
+        filter_instance = Filter()
+        guesses = {
+            GUESSES: ["CRANE", "SPOIL"],
+            RESULTS: [{RESULT: [0, 1, 0, 0, 1]}, {RESULT: [0, 0, 0, 0, 0]}],
+        }
+        expected = filter_instance.filter_compatible_with_past_guesses(
+            filter_instance.word_list, guesses
+        )
+        selected = filter_instance.filter_compatible_with_past_guesses(
+            filter_instance.lexicon.bitsets.all, guesses
+        )
+        ids = filter_instance.lexicon.bitsets.to_ids(selected)
+        assert [filter_instance.word_list[i] for i in ids] == expected
+
+    def test_exact_filter(self):
+        """Test that exact filtering keeps every true secret and never keeps more than the lenient filter."""
+        lenient = Filter()
+        exact = Filter(exact=True)
+        words = lenient.word_list
+        lenient_total = 0
+        exact_total = 0
+        for secret in words[::1000]:
+            for guess in ["SISSY", "TEETH", "CRANE", "LLAMA"]:
+                result = score_guess(guess, secret)
+                kept = lenient.filter_compatible_with_guess(words, guess, result)
+                narrowed = exact.filter_compatible_with_guess(words, guess, result)
+                assert secret in narrowed
+                assert set(narrowed) <= set(kept)
+                assert narrowed == [w for w in words if score_guess(guess, w) == result]
+                lenient_total += len(kept)
+                exact_total += len(narrowed)
+        assert exact_total < lenient_total
+
+    def test_exact_filter_forms(self):
+        """Test that exact filtering gives the same words as lists, arrays, bitsets and words outside the word list."""
+        filter_instance = Filter(exact=True)
+        words = ["APPLE", "HELLO", "THERE", "WORLD", "ABCDZ"]
+        result = {RESULT: score_guess("THERE", "APPLE")}
+        assert filter_instance.filter_compatible_with_guess(words, "THERE", result) == [
+            "APPLE"
+        ]
+        ids = np.array([filter_instance.lexicon.ids[w] for w in words[:4]])
+        assert filter_instance.filter_compatible_with_guess(
+            ids, "THERE", result
+        ).tolist() == [ids[0]]
+        bitset = filter_instance.lexicon.bitsets.from_ids(ids)
+        assert filter_instance.lexicon.bitsets.to_ids(
+            filter_instance.filter_compatible_with_guess(bitset, "THERE", result)
+        ).tolist() == [ids[0]]
+
+    def test_partition(self):
+        """Test that partitioning splits the candidates by feedback in every form, and counts them."""
+        filter_instance = Filter()
+        words = filter_instance.word_list[::100]
+        buckets = filter_instance.partition(words, "CRANE")
+        assert list(buckets) == sorted(buckets)
+        assert sum(len(bucket) for bucket in buckets.values()) == len(words)
+        for pattern, bucket in buckets.items():
+            assert all(score_guess("CRANE", w) == pattern for w in bucket)
+        ids = np.array([filter_instance.lexicon.ids[w] for w in words])
+        id_buckets = filter_instance.partition(ids, "CRANE")
+        bitset_buckets = filter_instance.partition(
+            filter_instance.lexicon.bitsets.from_ids(ids), "CRANE"
+        )
+        assert list(id_buckets) == list(buckets) == list(bitset_buckets)
+        for pattern, bucket in buckets.items():
+            expected = [filter_instance.lexicon.ids[w] for w in bucket]
+            assert id_buckets[pattern].tolist() == expected
+            assert (
+                filter_instance.lexicon.bitsets.to_ids(bitset_buckets[pattern]).tolist()
+                == expected
+            )
+
+        counts = filter_instance.partition_counts(words, ["CRANE", "SISSY"])
+        assert counts.shape == (2, 243)
+        assert {p: int(counts[0, p]) for p in np.flatnonzero(counts[0])} == {
+            p: len(b) for p, b in buckets.items()
+        }
+        outside = filter_instance.partition_counts(words + ["ABCDZ"], ["CRANE"])
+        assert outside.sum() == len(words) + 1
+        assert np.array_equal(
+            outside[0] - counts[0],
+            np.eye(243, dtype=int)[score_guess("CRANE", "ABCDZ")],
+        )
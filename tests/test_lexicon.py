@@ -0,0 +1,57 @@
+"""
+Test suite for the Lexicon class in the common module.
+
+This module contains unit tests for the Lexicon class, ensuring that its lookup tables are consistent
+and that a single instance is shared by the game, the filters and the bots.
+"""
+
+from common import Lexicon, get_lexicon  # type: ignore
+from bots import ExampleBot, Filter  # type: ignore
+from cli import Cli  # type: ignore
+from wordle import Wordle  # type: ignore
+
+# file: tests/test_lexicon.py
+
+
+class TestLexicon:
+    """
+    Unit tests for the Lexicon class.
+
+    This class tests the tables derived from the word list and that the lexicon is loaded once per process.
+    """
+
+    def test_tables(self):
+        """Test that the lookup tables agree with the word list."""
+        lexicon = Lexicon(["APPLE", "WORLD", "THERE", "HELLO"])
+        assert lexicon.words == ("APPLE", "WORLD", "THERE", "HELLO")
+        assert lexicon.word_list == ["APPLE", "WORLD", "THERE", "HELLO"]
+        assert lexicon.ids["THERE"] == 2
+        assert len(lexicon) == 4
+        assert lexicon.letters.shape == (4, 5)
+        assert list(lexicon.letters[1]) == [22, 14, 17, 11, 3]
+        assert lexicon.counts[0, ord("P") - ord("A")] == 2
+        assert lexicon.masks[3] == sum(1 << (ord(c) - ord("A")) for c in "HELO")
+        assert lexicon.unique_words == ["WORLD"]
+        assert lexicon.hash != Lexicon(["APPLE", "WORLD"]).hash
+
+    def test_validity_index(self):
+        """Test the constant-time validity and id lookups."""
+        lexicon = Lexicon(["APPLE", "WORLD", "THERE", "HELLO"])
+        assert lexicon.is_valid_word("WORLD") is True
+        assert lexicon.is_valid_word("BANANA") is False
+        assert "HELLO" in lexicon
+        assert "GHOST" not in lexicon
+        assert lexicon.get_id("HELLO") == 3
+        assert lexicon.get_id("GHOST") is None
+
+    def test_shared(self):
+        """Test that every game, filter and bot shares the same lexicon."""
+        lexicon = get_lexicon()
+        assert lexicon is get_lexicon()
+        assert len(lexicon) == 14855
+        assert Wordle().lexicon is lexicon
+        assert Wordle().word_list is lexicon.word_list
+        assert Filter().lexicon is lexicon
+        assert Filter().all_unique_words is lexicon.unique_words
+        assert ExampleBot().lexicon is lexicon
+        assert Cli().lexicon is lexicon
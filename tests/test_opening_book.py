@@ -0,0 +1,103 @@
+"""
+Test suite for opening books.
+
+This module contains unit tests for the OpeningBook class and its use by BotBehaviors, ensuring that
+books give the same guesses as the bots they were built for.
+"""
+
+import os
+from common import Pattern  # type: ignore
+from common.util import RESULT, MSG  # type: ignore
+from common import get_lexicon  # type: ignore
+from bots import BayesianBot, BotBehaviors, EntropyBot, ExampleBot, TreeBot  # type: ignore
+from bots import opening_book  # type: ignore
+from bots.opening_book import (  # type: ignore
+    OpeningBook,
+    get_code_hash,
+    get_opening_book_path,
+)
+from bots.util import GUESSES, RESULTS  # type: ignore
+
+# file: tests/test_opening_book.py
+
+
+class TestOpeningBook:
+    """
+    Unit tests for opening books.
+
+    This class tests building, saving and consulting opening books.
+    """
+
+    def test_get_key(self):
+        """Test the key of a history of guesses and results."""
+        key = OpeningBook.get_key(
+            ["CAGEY", "BLIND"],
+            [{RESULT: Pattern.from_list([0, 0, 0, 0, 0])}, {RESULT: [1, 0, 0, 0, 0]}],
+        )
+        assert key == "CAGEY:0|BLIND:1"
+
+    def test_build(self, tmp_path):
+        """Test that the book gives the guesses the bot would generate, and survives a round trip."""
+        bot = BayesianBot()
+        bot.opening_book_turns = 2
+        book = bot.build_opening_book(str(tmp_path / "book.json"))
+        assert book.entries["CAGEY:0"] == "BLIND"
+        assert book.entries["CAGEY:1|BLIND:9"] == "FROWS"
+        assert bot.guesses[GUESSES] == [] and bot.guesses[RESULTS] == []
+        book.save()
+        loaded = OpeningBook.load(book.path)
+        assert loaded is not None
+        assert loaded.turns == 2 and loaded.entries == book.entries
+        assert OpeningBook.load(str(tmp_path / "missing.json")) is None
+
+    def test_consult(self, tmp_path):
+        """Test that the bot consults its book for the turns it covers."""
+        bot = BayesianBot()
+        bot.opening_book_turns = 1
+        bot.opening_book = OpeningBook(
+            str(tmp_path / "book.json"), 1, {"CAGEY:1": "ZZZZZ"}
+        )
+        assert bot.generate_guess() == "CAGEY"
+        bot.accept_result({RESULT: [1, 0, 0, 0, 0], MSG: None})
+        assert bot.generate_guess() == "ZZZZZ"
+        bot.accept_result({RESULT: [0, 0, 0, 0, 0], MSG: None})
+        assert bot.get_book_guess() is None
+        bot.opening_book_turns = 0
+        bot.guesses[GUESSES].pop()
+        bot.guesses[RESULTS].pop()
+        assert bot.get_book_guess() is None
+
+    def test_config(self):
+        """Test that the configuration keying the book excludes the bot's state."""
+        config = BayesianBot().get_config()
+        assert config["frequency_list"] == "EARIOTNSLCUDPMHGBFYWKVXZJQ"
+        assert config["unique_words_set"] == ["BLIND", "FROWS", "THUMP"]
+        assert "possible_words" not in config and "guesses" not in config
+        assert BotBehaviors.opening_book_turns == 0
+        assert EntropyBot.opening_book_turns == 1 and TreeBot.opening_book_turns == 0
+
+    def test_path(self, book_dir):
+        """Test that books are kept apart by class, configuration and code, in the cache directory."""
+        lexicon = get_lexicon()
+        config = BayesianBot().get_config()
+        path = get_opening_book_path(BayesianBot, config, lexicon)
+        assert os.path.dirname(path) == book_dir
+        assert path == get_opening_book_path(BayesianBot, dict(config), lexicon)
+        assert path != get_opening_book_path(
+            BayesianBot, {**config, "MAX_WORDS": 4}, lexicon
+        )
+        assert path != get_opening_book_path(ExampleBot, config, lexicon)
+
+        class PatchedBot(BayesianBot):
+            """A bot whose guesses may differ from those of its base class."""
+
+        assert get_code_hash(PatchedBot) != get_code_hash(BayesianBot)
+
+    def test_code_hash_modules(self, monkeypatch):
+        """Test that the code hash covers the filtering and scoring modules, not only the bot's classes."""
+        assert "bots.util" in opening_book.GUESS_MODULES
+        code_hash = get_code_hash(BayesianBot)
+        monkeypatch.setattr(
+            opening_book, "GUESS_MODULES", opening_book.GUESS_MODULES[1:]
+        )
+        assert get_code_hash(BayesianBot) != code_hash
@@ -0,0 +1,43 @@
+"""
+Test suite for the parallel evaluation of guesses.
+
+This module contains tests for the map_blocks function, checking that evaluating blocks of ids
+in threads gives the same results as evaluating them at once.
+"""
+
+import numpy as np
+import pytest
+from common import parallel  # type: ignore
+from common.parallel import get_thread_count, map_blocks, set_thread_count  # type: ignore
+
+# file: tests/test_parallel.py
+
+
+class TestParallel:
+    """Unit tests for the map_blocks function and the thread count."""
+
+    def test_map_blocks(self, monkeypatch):
+        """Test that blocks evaluated in threads are concatenated in order."""
+        monkeypatch.setattr(parallel, "MIN_PARALLEL_ELEMENTS", 0)
+        ids = np.arange(1001)
+        try:
+            set_thread_count(3)
+            assert get_thread_count() == 3
+            result = map_blocks(lambda block: np.stack([block, block**2], axis=1), ids)
+            assert np.array_equal(result[:, 0], ids)
+            assert np.array_equal(result[:, 1], ids**2)
+            assert np.array_equal(map_blocks(lambda block: block, ids[:1]), ids[:1])
+        finally:
+            set_thread_count(None)
+
+    def test_thread_count(self, monkeypatch):
+        """Test that the thread count is read from the environment unless set."""
+        monkeypatch.setenv(parallel.THREADS_VARIABLE, "2")
+        assert get_thread_count() == 2
+        set_thread_count(1)
+        assert get_thread_count() == 1
+        set_thread_count(None)
+        assert get_thread_count() == 2
+        monkeypatch.setenv(parallel.THREADS_VARIABLE, "auto")
+        with pytest.raises(ValueError, match=parallel.THREADS_VARIABLE):
+            get_thread_count()
@@ -0,0 +1,73 @@
+"""
+Test suite for the Pattern class in the common module.
+
+This module contains unit tests for the Pattern class, ensuring that patterns are interned,
+encode and decode correctly, and remain compatible with the legacy list form of a result.
+"""
+
+import pickle
+from common import ALL_CORRECT, Pattern, score_guess  # type: ignore
+from wordle import Wordle  # type: ignore
+
+# file: tests/test_pattern.py
+
+
+class TestPattern:
+    """
+    Unit tests for the Pattern class.
+
+    This class tests the encoding of results as integers and the compatibility of patterns
+    with code that expects results as lists.
+    """
+
+    def test_encoding(self):
+        """Test that patterns encode and decode results."""
+        pattern = Pattern.from_list([0, 1, 2, 0, 0])
+        assert pattern == 1 * 3 + 2 * 9
+        assert pattern.to_list() == [0, 1, 2, 0, 0]
+        assert pattern.digits == (0, 1, 2, 0, 0)
+        assert ALL_CORRECT == 242
+        assert Pattern.from_result({"result": [2, 2, 2, 2, 2]}) is ALL_CORRECT
+        assert Pattern.from_result(242) is ALL_CORRECT
+
+    def test_interning(self):
+        """Test that each code maps to a single shared pattern."""
+        assert Pattern(21) is Pattern.from_list([0, 1, 2, 0, 0])
+        assert pickle.loads(pickle.dumps(Pattern(21))) is Pattern(21)
+        assert {Pattern(21): True}[21]
+
+    def test_legacy_compatibility(self):
+        """Test that patterns behave like the list form of a result."""
+        pattern = Pattern.from_list([0, 1, 2, 0, 0])
+        assert pattern == [0, 1, 2, 0, 0]
+        assert [0, 1, 2, 0, 0] == pattern
+        assert pattern != [0, 0, 0, 0, 0]
+        assert list(pattern) == [0, 1, 2, 0, 0]
+        assert pattern[2] == 2
+        assert pattern[:2] == [0, 1]
+        assert isinstance(pattern[:2], list)
+        assert len(pattern) == 5
+        assert 1 in pattern
+        assert pattern.count(0) == 3
+        assert f"{pattern}" == "[0, 1, 2, 0, 0]"
+
+    def test_score_guess(self):
+        """Test that score_guess matches the results of the game."""
+        assert score_guess("TOTAL", "APPLE") == [0, 0, 0, 1, 1]
+        assert score_guess("PLATE", "APPLE") == [1, 1, 1, 0, 2]
+        assert score_guess("DONOR", "HOWTO") == [0, 2, 0, 1, 0]
+        assert score_guess("APPLE", "APPLE") is ALL_CORRECT
+
+        wordle = Wordle()
+        wordle.start_game()
+        wordle.secret_word = "APPLE"
+        result = wordle.guess("PLATE")["result"]
+        assert isinstance(result, Pattern)
+        assert result is score_guess("PLATE", "APPLE")
+
+    def test_score_short_words(self):
+        """Test that letters past the end of a shorter word are incorrect, rather than raising."""
+        assert score_guess("PLATE", "") == [0, 0, 0, 0, 0]
+        assert score_guess("", "APPLE") == [0, 0, 0, 0, 0]
+        # A game that was not started has no secret word
+        assert Wordle().guess("PLATE")["result"] == [0, 0, 0, 0, 0]
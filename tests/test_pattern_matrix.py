@@ -0,0 +1,189 @@
+"""
+Test suite for the PatternMatrix class in the common module.
+
+This module contains unit tests for the feedback matrix, ensuring that it agrees with the game
+and that it is cached and memory-mapped correctly.
+"""
+
+import os
+import numpy as np
+import pytest
+from common import (  # type: ignore
+    CACHE_DIR_VARIABLE,
+    Lexicon,
+    get_cache_dir,
+    score_guess,
+    score_many,
+)
+from common.pattern_matrix import (  # type: ignore
+    MEMORY_BUDGET_VARIABLE,
+    PatternKernel,
+    PatternMatrix,
+    TiledPatternMatrix,
+    build_pattern_matrix,
+    get_memory_budget,
+    select_pattern_matrix,
+)
+from wordle import Wordle  # type: ignore
+
+# file: tests/test_pattern_matrix.py
+
+WORDS = [
+    "APPLE",
+    "PLATE",
+    "TOTAL",
+    "DONOR",
+    "HOWTO",
+    "TEELS",
+    "TERCE",
+    "SOLOS",
+    "ROOSE",
+]
+LEXICON = Lexicon(WORDS)
+
+
+class TestPatternMatrix:
+    """
+    Unit tests for the PatternMatrix class.
+
+    This class tests that the feedback matrix matches the results produced by the game,
+    and that the cache is written once and reused.
+    """
+
+    def test_matches_wordle(self):
+        """Test that every entry of the matrix matches Wordle.guess."""
+        matrix = build_pattern_matrix(LEXICON)
+        wordle = Wordle()
+        for g, guess in enumerate(WORDS):
+            for s, secret in enumerate(WORDS):
+                wordle.start_game()
+                wordle.secret_word = secret
+                result = wordle.guess(guess)["result"]
+                assert matrix[g, s] == sum(r * 3**i for i, r in enumerate(result))
+
+    def test_duplicate_letters(self, tmp_path):
+        """Test that repeated letters are only marked misplaced while unmatched copies remain."""
+        matrix = PatternMatrix(LEXICON, cache_dir=str(tmp_path))
+        assert matrix.get_pattern_for_words("DONOR", "HOWTO") == 2 * 3 + 1 * 27
+        assert matrix.get_pattern_for_words("TEELS", "TERCE") == 2 + 2 * 3 + 1 * 9
+        assert matrix.get_pattern_for_words("APPLE", "APPLE") == 242
+
+    def test_cache(self, tmp_path):
+        """Test that the matrix is cached on disk and memory-mapped on later loads."""
+        matrix = PatternMatrix(LEXICON, cache_dir=str(tmp_path))
+        assert os.path.exists(matrix.path)
+        assert matrix.matrix.shape == (len(WORDS), len(WORDS))
+        assert isinstance(matrix.matrix, np.memmap)
+        modified = os.path.getmtime(matrix.path)
+
+        reloaded = PatternMatrix(LEXICON, cache_dir=str(tmp_path))
+        assert reloaded.path == matrix.path
+        assert os.path.getmtime(reloaded.path) == modified
+        assert np.array_equal(reloaded.matrix, matrix.matrix)
+        assert list(reloaded.get_row(reloaded.lexicon.ids["APPLE"])) == list(
+            matrix.matrix[matrix.lexicon.ids["APPLE"]]
+        )
+
+        # A different word list gets its own cache file
+        other = PatternMatrix(Lexicon(WORDS[:3]), cache_dir=str(tmp_path))
+        assert other.path != matrix.path
+
+    def test_default_cache_dir(self, tmp_path, monkeypatch):
+        """Test that the matrix is cached in the user's cache directory, or the one set in the environment."""
+        monkeypatch.delenv(CACHE_DIR_VARIABLE, raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        assert get_cache_dir() == str(tmp_path / "xdg" / "wordle_bot")
+        monkeypatch.setenv(CACHE_DIR_VARIABLE, str(tmp_path / "cache"))
+        matrix = PatternMatrix(LEXICON)
+        assert os.path.dirname(matrix.path) == str(tmp_path / "cache")
+        assert os.path.exists(matrix.path)
+
+    def test_score_many(self):
+        """Test that scoring one guess against many secrets matches score_guess, without a matrix."""
+        for g, guess in enumerate(WORDS):
+            codes = score_many(g, lexicon=LEXICON)
+            assert codes.dtype == np.uint8
+            assert codes.tolist() == [score_guess(guess, secret) for secret in WORDS]
+        subset = np.array([4, 0, 3])
+        assert score_many(3, subset, LEXICON).tolist() == [
+            score_guess("DONOR", WORDS[s]) for s in subset.tolist()
+        ]
+
+    def test_kernel(self, tmp_path):
+        """Test that the kernel computes the same feedback as the matrix."""
+        matrix = build_pattern_matrix(LEXICON)
+        kernel = PatternKernel(LEXICON)
+        secret_ids = np.array([1, 4, 7])
+        assert np.array_equal(kernel.get_codes(), matrix)
+        assert np.array_equal(
+            kernel.get_codes(np.array([3, 0]), secret_ids),
+            matrix[[3, 0]][:, secret_ids],
+        )
+        assert kernel.get_pattern_for_words("DONOR", "HOWTO") == 2 * 3 + 1 * 27
+        guesses, secrets = np.array([0, 3, 5, 8]), np.array([1, 4, 5, 2])
+        assert np.array_equal(
+            kernel.get_pairs(guesses, secrets),
+            matrix[guesses, secrets],
+        )
+        assert np.array_equal(
+            kernel.get_histograms(secret_ids),
+            PatternMatrix(LEXICON, str(tmp_path)).get_histograms(secret_ids),
+        )
+
+    def test_tiles(self, tmp_path):
+        """Test that tiles give the same feedback as the matrix, keeping a bounded number decompressed."""
+        matrix = build_pattern_matrix(LEXICON)
+        tiled = TiledPatternMatrix(
+            LEXICON, cache_dir=str(tmp_path), max_tiles=2, tile_rows=2
+        )
+        assert os.path.exists(tiled.path)
+        assert np.array_equal(tiled.get_codes(), matrix)
+        assert len(tiled.tiles) == 2
+        assert np.array_equal(tiled.get_row(8), matrix[8])
+        assert list(tiled.tiles) == [3, 4]
+        secret_ids = np.array([2, 5])
+        assert np.array_equal(
+            tiled.get_codes(np.array([6, 1]), secret_ids), matrix[[6, 1]][:, secret_ids]
+        )
+
+        # A subset of guesses is stored, and the other rows are computed on the fly
+        subset = TiledPatternMatrix(
+            LEXICON, cache_dir=str(tmp_path), guess_ids=np.array([5, 1])
+        )
+        assert subset.path != tiled.path
+        assert subset.guess_ids.tolist() == [1, 5]
+        assert np.array_equal(subset.get_codes(), matrix)
+        assert subset.get_pattern(3, 4) == matrix[3, 4]
+
+    def test_memory_budget(self, monkeypatch):
+        """Test that the memory budget is read in bytes or with a binary suffix, and rejected if invalid."""
+        monkeypatch.delenv(MEMORY_BUDGET_VARIABLE, raising=False)
+        assert get_memory_budget() is None
+        for value, expected in (("1000", 1000), ("256M", 256 << 20), ("1GiB", 1 << 30)):
+            monkeypatch.setenv(MEMORY_BUDGET_VARIABLE, value)
+            assert get_memory_budget() == expected
+        monkeypatch.setenv(MEMORY_BUDGET_VARIABLE, "lots")
+        with pytest.raises(ValueError, match=MEMORY_BUDGET_VARIABLE):
+            get_memory_budget()
+
+    def test_select(self, tmp_path):
+        """Test that the feedback lookup is picked to fit the memory budget."""
+        cache_dir = str(tmp_path)
+        n = len(WORDS)
+        assert isinstance(
+            select_pattern_matrix(LEXICON, None, None, cache_dir), PatternMatrix
+        )
+        assert isinstance(
+            select_pattern_matrix(LEXICON, n * n, None, cache_dir), PatternMatrix
+        )
+        # A word list this small fits in a single tile
+        kernel = select_pattern_matrix(LEXICON, n * n - 1, None, cache_dir)
+        assert type(kernel) is PatternKernel
+        assert isinstance(
+            select_pattern_matrix(LEXICON, None, np.array([0]), cache_dir),
+            TiledPatternMatrix,
+        )
+        assert isinstance(
+            select_pattern_matrix(LEXICON, n, np.array([0]), cache_dir),
+            TiledPatternMatrix,
+        )
@@ -0,0 +1,306 @@
+"""
+Test suite for the solver service.
+
+This module contains tests for the SolverService class, checking that its sessions and stateless
+requests suggest the same guesses as a bot played directly, and that it serves them over a socket.
+"""
+
+from service import BotPool, SessionStore, SolverService  # type: ignore
+from service.session_store import SESSION_SIZE  # type: ignore
+from bots import BayesianBot, EntropyBot, ExampleBot  # type: ignore
+from bots.util import GUESSES, RESULTS  # type: ignore
+from common import MSG, RESULT, get_lexicon, score_guess  # type: ignore
+import asyncio
+import json
+
+# file: tests/test_service.py
+
+
+class TestSolverService:
+    """
+    Unit tests for the SolverService class.
+
+    This class tests each operation of the protocol, and a game played over a local socket.
+    """
+
+    def test_session(self):
+        """Test that a session suggests the same guesses as a bot playing the same game."""
+        bot = BayesianBot()
+        secret = "THERE"
+
+        async def play():
+            service = SolverService(workers=2)
+            try:
+                session = (await service.handle({"op": "start"}))["session"]
+                for _ in range(6):
+                    response = await service.handle(
+                        {"op": "suggest", "session": session, "id": 7}
+                    )
+                    remaining = len(bot.possible_words)
+                    guess = bot.generate_guess()
+                    assert response == {
+                        "ok": True,
+                        "guess": guess,
+                        "remaining": remaining,
+                        "id": 7,
+                    }
+                    pattern = score_guess(guess, secret)
+                    response = await service.handle(
+                        {
+                            "op": "result",
+                            "session": session,
+                            "guess": guess.lower(),
+                            "result": "".join(str(d) for d in pattern.to_list()),
+                        }
+                    )
+                    bot.accept_result({RESULT: pattern, MSG: None})
+                    assert response["remaining"] == len(bot.possible_words)
+                    if response["over"]:
+                        break
+                assert guess == secret
+                response = await service.handle({"op": "suggest", "session": session})
+                assert not response["ok"]
+                assert (await service.handle({"op": "stats"}))["sessions"] == 1
+                await service.handle({"op": "end", "session": session})
+                assert (await service.handle({"op": "stats"}))["sessions"] == 0
+            finally:
+                service.close()
+
+        asyncio.run(play())
+
+    def test_concurrent_results(self):
+        """Test that results sent together on a session are both played, while other sessions are spilled."""
+        secret = "THERE"
+
+        def result(session, guess):
+            pattern = score_guess(guess, secret)
+            return {
+                "op": "result",
+                "session": session,
+                "guess": guess,
+                "result": "".join(str(d) for d in pattern.to_list()),
+            }
+
+        async def churn(service, results):
+            started = 1
+            while not all(r.done() for r in results):
+                await service.handle({"op": "start"})
+                started += 1
+                await asyncio.sleep(0)
+            return started
+
+        async def play():
+            store = SessionStore(memory_cap=2 * SESSION_SIZE)
+            service = SolverService(workers=2, store=store)
+            try:
+                session = (await service.handle({"op": "start"}))["session"]
+                results = [
+                    asyncio.create_task(service.handle(result(session, guess)))
+                    for guess in ("AROSE", "UNLIT")
+                ]
+                started = await churn(service, results)
+                assert all(r.result()["ok"] for r in results)
+                assert len(store) == started
+                assert store.get(session).state[GUESSES] == ["AROSE", "UNLIT"]
+            finally:
+                service.close()
+
+        asyncio.run(play())
+
+    def test_results_after_win(self):
+        """Test that of results sent together on a session, those after a win are rejected."""
+
+        async def play():
+            service = SolverService(workers=2)
+            try:
+                session = (await service.handle({"op": "start"}))["session"]
+                responses = await asyncio.gather(
+                    *(
+                        service.handle(
+                            {
+                                "op": "result",
+                                "session": session,
+                                "guess": guess,
+                                "result": result,
+                            }
+                        )
+                        for guess, result in (("THERE", "22222"), ("AROSE", "01002"))
+                    )
+                )
+                assert responses[0]["ok"] and responses[0]["over"]
+                assert not responses[1]["ok"]
+                state = service.store.get(session).state
+                assert state[GUESSES] == ["THERE"]
+            finally:
+                service.close()
+
+        asyncio.run(play())
+
+    def test_solve(self):
+        """Test that a stateless request suggests the same guess as a session with the same history."""
+
+        async def solve():
+            service = SolverService(workers=2)
+            try:
+                session = (await service.handle({"op": "start", "bot": "ExampleBot"}))[
+                    "session"
+                ]
+                guess = (await service.handle({"op": "suggest", "session": session}))[
+                    "guess"
+                ]
+                await service.handle(
+                    {
+                        "op": "result",
+                        "session": session,
+                        "guess": guess,
+                        "result": [0, 1, 0, 0, 0],
+                    }
+                )
+                expected = await service.handle({"op": "suggest", "session": session})
+                response = await service.handle(
+                    {
+                        "op": "solve",
+                        "bot": "ExampleBot",
+                        "guesses": [guess],
+                        "results": ["01000"],
+                    }
+                )
+                assert response == expected
+            finally:
+                service.close()
+
+        asyncio.run(solve())
+
+    def test_budget(self):
+        """Test that suggestions within a budget are valid guesses, and invalid budgets are rejected."""
+
+        async def suggest():
+            service = SolverService(workers=1, budget=0.5)
+            try:
+                session = (await service.handle({"op": "start", "bot": "EntropyBot"}))[
+                    "session"
+                ]
+                for budget in (0, 0.01, None):
+                    request = {"op": "suggest", "session": session}
+                    if budget is not None:
+                        request["budget"] = budget
+                    response = await service.handle(request)
+                    assert response["ok"] and response["guess"] == "TARES"
+                response = await service.handle(
+                    {
+                        "op": "solve",
+                        "bot": "EntropyBot",
+                        "guesses": ["TARES"],
+                        "results": ["00000"],
+                        "budget": 0,
+                    }
+                )
+                assert get_lexicon().is_valid_word(response["guess"])
+                for budget in ("soon", True, -1, float("nan")):
+                    response = await service.handle(
+                        {"op": "suggest", "session": session, "budget": budget}
+                    )
+                    assert not response["ok"]
+            finally:
+                service.close()
+
+        asyncio.run(suggest())
+
+    def test_errors(self):
+        """Test that invalid requests are answered with an error."""
+
+        async def fail():
+            service = SolverService(workers=1)
+            try:
+                session = (await service.handle({"op": "start"}))["session"]
+                requests = [
+                    {"op": "fly"},
+                    {"op": "start", "bot": "NoBot"},
+                    {"op": "suggest", "session": "nope"},
+                    {"op": "result", "session": session, "guess": "ZZZZZ"},
+                    {
+                        "op": "result",
+                        "session": session,
+                        "guess": "CRANE",
+                        "result": "3",
+                    },
+                    {"op": "solve", "guesses": ["CRANE"], "results": []},
+                    {
+                        "op": "solve",
+                        "bot": "EntropyBot",
+                        "guesses": ["TARES", "TARES"],
+                        "results": ["00000", "22221"],
+                    },
+                ]
+                for request in requests:
+                    response = await service.handle(request)
+                    assert not response["ok"] and response["error"]
+                    assert response["error"] != "Internal error"
+            finally:
+                service.close()
+
+        asyncio.run(fail())
+
+    def test_server(self):
+        """Test that requests are answered over a local socket, one line each."""
+
+        async def connect():
+            service = SolverService(workers=1)
+            server = await service.start_server(port=0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                for request in (
+                    {"op": "start"},
+                    {"op": "solve", "guesses": [], "results": []},
+                ):
+                    writer.write(json.dumps(request).encode() + b"\n")
+                    await writer.drain()
+                    assert json.loads(await reader.readline())["ok"]
+                writer.write(b"not json\n")
+                await writer.drain()
+                assert not json.loads(await reader.readline())["ok"]
+                writer.close()
+                await writer.wait_closed()
+            finally:
+                server.close()
+                await server.wait_closed()
+                service.close()
+
+        asyncio.run(connect())
+
+
+class TestBotPool:
+    """Unit tests for the BotPool class."""
+
+    def test_borrow(self):
+        """Test that bots are reused, and created when none is idle."""
+        pool = BotPool(ExampleBot)
+        with pool.borrow() as first:
+            assert first.guesses[GUESSES] == []
+            with pool.borrow() as second:
+                assert second is not first
+        with pool.borrow() as third:
+            assert third in (first, second)
+        assert pool.created == 2
+
+    def test_shared_opening_book(self, monkeypatch):
+        """Test that a pool of EntropyBot answers turn two from its opening book without building it again."""
+        pool = BotPool(EntropyBot)
+        assert pool.opening_book is not None
+
+        def fail(self, path):
+            raise AssertionError("The opening book was built by a borrowed bot")
+
+        monkeypatch.setattr(EntropyBot, "build_opening_book", fail)
+        bot = EntropyBot()
+        guess = bot.generate_guess()
+        bot.accept_result({RESULT: score_guess(guess, "THERE"), MSG: None})
+        state = bot.save_state()
+        expected = pool.opening_book.get(state[GUESSES], state[RESULTS])
+        assert expected is not None
+        with pool.borrow(state) as first, pool.borrow(state) as second:
+            assert first.opening_book is second.opening_book is pool.opening_book
+            assert first.generate_guess() == expected
+            assert second.generate_guess(deadline=0) == expected
+        assert pool.created == 2
@@ -0,0 +1,129 @@
+"""
+Test suite for the session store.
+
+This module contains tests for the serialization of bot states, and for the SessionStore class,
+checking that sessions spilled to disk or kept over a restart resume where they left off.
+"""
+
+from service import Session, SessionStore, decode_state, encode_state  # type: ignore
+from service.session_store import STATE_HEADER  # type: ignore
+from bots import BayesianBot, TreeBot  # type: ignore
+from bots.util import GUESSES  # type: ignore
+from common import MSG, RESULT, get_lexicon, score_guess  # type: ignore
+import asyncio
+import threading
+
+# file: tests/test_session_store.py
+
+
+def play(bot, guesses: list[str], secret: str) -> dict:
+    """Play guesses against a secret, returning the bot's state."""
+    bot.reset()
+    for guess in guesses:
+        bot.guesses[GUESSES].append(guess)
+        bot.accept_result({RESULT: score_guess(guess, secret), MSG: None})
+    return bot.save_state()
+
+
+class TestStateEncoding:
+    """Unit tests for encode_state and decode_state."""
+
+    def test_round_trip(self):
+        """Test that a decoded state equals the encoded one, however its possible words are stored."""
+        bot = BayesianBot()
+        lexicon = get_lexicon()
+        for guesses in ([], ["AROSE"], ["AROSE", "UNLIT"], ["EERIE"]):
+            state = play(bot, guesses, "THERE")
+            data = encode_state(state)
+            decoded = decode_state(data)
+            assert decoded == state
+            if not guesses:
+                assert decoded["possible_words"] is lexicon.word_list
+            # The larger of the bitset and the ids is never stored
+            words = len(state["possible_words"])
+            assert len(data) <= STATE_HEADER.itemsize + 3 * len(guesses) + min(
+                2 * words, (len(lexicon) + 7) // 8
+            )
+            bot.restore_state(decoded)
+            suggestion = bot.generate_guess()
+            bot.restore_state(state)
+            assert bot.generate_guess() == suggestion
+
+    def test_extra_entries(self):
+        """Test that the entries a subclass adds to its state are kept."""
+        bot = TreeBot()
+        bot.node = 3
+        state = bot.save_state()
+        assert decode_state(encode_state(state))["node"] == 3
+
+
+class TestSessionStore:
+    """Unit tests for the SessionStore class."""
+
+    def test_spill_and_resume(self):
+        """Test that sessions over the memory cap are spilled, and resumed unchanged when used."""
+        bot = BayesianBot()
+        store = SessionStore(memory_cap=10_000)
+        states = {}
+        for i, secret in enumerate(("THERE", "CRANE", "MUSIC", "PLANT", "ZESTY")):
+            states[str(i)] = play(bot, ["AROSE"], secret)
+            store.put(str(i), Session("BayesianBot", states[str(i)], over=i == 4))
+        stats = store.get_stats()
+        assert stats["evicted"] > 0 and stats["written"] == stats["evicted"]
+        assert stats["memory_used"] <= 10_000
+        assert len(store) == 5
+        for session_id, state in states.items():
+            session = store.get(session_id)
+            assert session.state == state
+            assert session.over == (session_id == "4")
+        assert store.get_stats()["resumed"] > 0
+        assert store.get("nope") is None
+        store.delete("0")
+        assert store.get("0") is None and len(store) == 4
+        store.close()
+
+    def test_restart(self, tmp_path):
+        """Test that sessions are kept over a restart of the store."""
+        path = str(tmp_path / "sessions.sqlite")
+        bot = BayesianBot()
+        state = play(bot, ["AROSE", "UNLIT"], "THERE")
+        store = SessionStore(path)
+        store.put("a", Session("BayesianBot", state))
+        store.put("b", Session("ExampleBot", bot.save_state()))
+        store.delete("b")
+        store.close()
+        store = SessionStore(path)
+        assert len(store) == 1
+        session = store.get("a")
+        assert session.bot == "BayesianBot" and session.state == state
+        assert store.get("b") is None
+        store.close()
+
+    def test_io_thread(self, tmp_path):
+        """Test that the SQLite file is only used from the store's thread, and resumed sessions are awaited."""
+        store = SessionStore(str(tmp_path / "sessions.sqlite"), memory_cap=10_000)
+        threads = set()
+        for name in ("read", "insert", "remove"):
+
+            def record(*args, function=getattr(store, name)):
+                threads.add(threading.current_thread().name)
+                return function(*args)
+
+            setattr(store, name, record)
+        bot = BayesianBot()
+        states = {}
+        for i, secret in enumerate(("THERE", "CRANE", "MUSIC", "PLANT", "ZESTY")):
+            states[str(i)] = play(bot, ["AROSE"], secret)
+            store.put(str(i), Session("BayesianBot", states[str(i)]))
+        assert store.stored and store.stored.isdisjoint(store.sessions)
+
+        async def resume():
+            return await asyncio.gather(*(store.load(i) for i in ("0", "0", "nope")))
+
+        first, second, missing = asyncio.run(resume())
+        assert first is second and first.state == states["0"]
+        assert missing is None
+        store.delete("1")
+        assert "1" not in store.stored and len(store) == 4
+        store.close()
+        assert threads and all(name.startswith("store") for name in threads)
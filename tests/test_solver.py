@@ -0,0 +1,113 @@
+"""
+Test suite for the solver module.
+
+This module contains unit tests for the DecisionTreeSolver and Strategy classes, ensuring that solved
+decision trees solve every secret and that strategies survive a round trip through their binary files.
+"""
+
+import numpy as np
+import pytest
+from common import ALL_CORRECT, Lexicon, get_lexicon, get_pattern_matrix  # type: ignore
+from solver import DecisionTreeSolver, Strategy  # type: ignore
+from solver.decision_tree import MAX_TURNS  # type: ignore
+from solver.strategy import ROOT  # type: ignore
+
+# file: tests/test_solver.py
+
+SECRET_IDS = np.arange(0, 14855, 300)
+
+
+def play(strategy: Strategy, secret_id: int) -> int:
+    """Follow a strategy to a secret, returning the number of turns taken."""
+    matrix = get_pattern_matrix()
+    node = ROOT
+    turns = 1
+    while True:
+        code = int(matrix.matrix[strategy.get_guess(node), secret_id])
+        if code == ALL_CORRECT:
+            return turns
+        node = strategy.get_child(node, code)
+        turns += 1
+
+
+class TestSolver:
+    """
+    Unit tests for the solver module.
+
+    This class tests that decision trees are solved consistently and stored compactly.
+    """
+
+    def test_solve(self):
+        """Test that the solved tree solves every secret in the total number of turns."""
+        total, root = DecisionTreeSolver().solve(SECRET_IDS)
+        strategy = Strategy.from_tree(root)
+        assert sum(play(strategy, s) for s in SECRET_IDS.tolist()) == total
+        assert sorted(strategy.get_secrets(ROOT).tolist()) == SECRET_IDS.tolist()
+        assert total >= 2 * len(SECRET_IDS) - 1
+
+    def test_parallel(self):
+        """Test that solving in a pool of processes finds the same tree."""
+        serial = DecisionTreeSolver().solve(SECRET_IDS)
+        parallel = DecisionTreeSolver(workers=2).solve(SECRET_IDS)
+        assert parallel == serial
+
+    def test_turns(self):
+        """Test that a limit on the turns is respected when it can be met."""
+        solver = DecisionTreeSolver(turns=4)
+        total, root = solver.solve(SECRET_IDS)
+        strategy = Strategy.from_tree(root)
+        assert max(play(strategy, s) for s in SECRET_IDS.tolist()) <= 4
+        assert solver.solve_subtree(SECRET_IDS[:3], turns=1) is None
+
+    def test_max_turns(self):
+        """Test that a family of words differing by one letter is kept within the turns when it can be."""
+        ids = np.array(
+            [i for i, word in enumerate(get_lexicon().words) if word[1:] == "ILLS"]
+        )
+        _, uncapped = DecisionTreeSolver().solve(ids)
+        assert (
+            max(play(Strategy.from_tree(uncapped), s) for s in ids.tolist()) > MAX_TURNS
+        )
+        _, root = DecisionTreeSolver(turns=MAX_TURNS).solve(ids)
+        assert max(play(Strategy.from_tree(root), s) for s in ids.tolist()) <= MAX_TURNS
+        assert (
+            DecisionTreeSolver(turns=MAX_TURNS - 1, strict=True).solve_roots(ids)
+            is None
+        )
+        total, root = DecisionTreeSolver(turns=MAX_TURNS - 1).solve(ids)
+        assert sum(play(Strategy.from_tree(root), s) for s in ids.tolist()) == total
+
+    def test_worst_case(self):
+        """Test that the worst-case objective takes no more turns for any secret than the expected one."""
+        expected_total, expected_root = DecisionTreeSolver().solve(SECRET_IDS)
+        total, root = DecisionTreeSolver(objective="worst-case").solve(SECRET_IDS)
+        expected, worst = Strategy.from_tree(expected_root), Strategy.from_tree(root)
+        turns = [play(worst, s) for s in SECRET_IDS.tolist()]
+        assert sum(turns) == total >= expected_total
+        assert max(turns) <= max(play(expected, s) for s in SECRET_IDS.tolist())
+        with pytest.raises(ValueError):
+            DecisionTreeSolver(objective="best")
+
+    def test_round_trip(self, tmp_path):
+        """Test that a strategy is memory-mapped back from its file unchanged."""
+        _, root = DecisionTreeSolver().solve(SECRET_IDS)
+        strategy = Strategy.from_tree(root)
+        path = str(tmp_path / "strategy.bin")
+        strategy.save(path)
+        loaded = Strategy.load(path)
+        assert len(loaded) == len(strategy)
+        for name in (
+            "guesses",
+            "edge_starts",
+            "secret_starts",
+            "secret_ends",
+            "children",
+            "secrets",
+            "codes",
+        ):
+            assert np.array_equal(getattr(loaded, name), getattr(strategy, name))
+        for secret_id in SECRET_IDS.tolist():
+            assert play(loaded, secret_id) == play(strategy, secret_id)
+        assert loaded.get_child(ROOT, ALL_CORRECT) is None
+        with pytest.raises(ValueError):
+            Strategy.load(path, Lexicon(["APPLE", "WORLD"]))
@@ -0,0 +1,75 @@
+"""
+Test suite for the TreeBot class.
+
+This module contains tests for the TreeBot class, ensuring that it follows its strategy
+and falls back to filtering once a game leaves the tree.
+"""
+
+import numpy as np
+from common.util import RESULT, MSG  # type: ignore
+from bots import TreeBot, tree_bot  # type: ignore
+from bots.util import GUESSES  # type: ignore
+from solver import DecisionTreeSolver, Strategy  # type: ignore
+from wordle import Wordle  # type: ignore
+
+# file: tests/test_tree_bot.py
+
+SECRET_IDS = np.arange(0, 14855, 300)
+
+
+def make_bot(tmp_path) -> TreeBot:
+    """Solve a small set of secrets and load it into a TreeBot."""
+    _, root = DecisionTreeSolver().solve(SECRET_IDS)
+    path = str(tmp_path / "tree.bin")
+    Strategy.from_tree(root).save(path)
+    return TreeBot(path)
+
+
+class TestTreeBot:
+    """
+    Unit tests for the TreeBot class.
+
+    This class tests that the TreeBot plays from its strategy file.
+    """
+
+    def test_solves_games(self, tmp_path):
+        """Test that the bot solves every secret of its strategy."""
+        bot = make_bot(tmp_path)
+        wordle = Wordle()
+        for secret_id in SECRET_IDS.tolist():
+            wordle.start_game()
+            wordle.secret_word = bot.lexicon.words[secret_id]
+            while wordle.game_in_progress:
+                bot.accept_result(wordle.guess(bot.generate_guess()))
+                assert wordle.secret_word in bot.possible_words
+            assert wordle.guesses[-1] == wordle.secret_word
+            assert bot.node == 0
+
+    def test_leaves_tree(self, tmp_path):
+        """Test that the bot filters the possible words once the game leaves the tree."""
+        bot = make_bot(tmp_path)
+        bot.generate_guess()
+        bot.guesses[GUESSES][-1] = "CRANE"
+        bot.accept_result({RESULT: [0, 1, 0, 0, 1], MSG: None})
+        assert bot.node is None
+        assert bot.possible_words == bot.filter.filter_compatible_with_guess(
+            bot.filter.word_list, "CRANE", {RESULT: [0, 1, 0, 0, 1]}
+        )
+        assert bot.generate_next_guess() == bot.possible_words[0]
+
+    def test_prepare(self, tmp_path, monkeypatch):
+        """Test that preparing the bot solves its strategy once, so copies of the bot load it."""
+        solved = []
+
+        def build_strategy(path, workers=1, turns=None, objective=None):
+            solved.append(path)
+            _, root = DecisionTreeSolver().solve(SECRET_IDS)
+            Strategy.from_tree(root).save(path)
+
+        monkeypatch.setattr(tree_bot, "build_strategy", build_strategy)
+        path = str(tmp_path / "tree.bin")
+        bot = TreeBot(path)
+        bot.prepare()
+        assert solved == [path] and bot.strategy is not None
+        TreeBot(path).prepare()
+        assert solved == [path]
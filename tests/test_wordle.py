@@ -4,8 +4,11 @@ Test suite for the Wordle class in the bots module.
 This module contains unit tests for the Wordle class, ensuring that the game logic works as expected.
 """
 
+import numpy as np
+import pytest
 from common.util import MSG, RESULT  # type: ignore
-from wordle import Wordle  # type: ignore
+from wordle import Wordle, simulate, simulate_batch  # type: ignore
+from bots import BayesianBot, ExampleBot  # type: ignore
 
 # file: tests/test_wordle.py
 
@@ -175,3 +178,69 @@ class TestWordle:
         assert wordle.secret_word in wordle.word_list
         assert len(wordle.secret_word) == 5
         assert wordle.secret_word.isupper()  # Assuming the secret word is uppercase
+
+    def test_simulate(self):
+        """Test that a simulated game gives the same results as a game played through the Wordle class."""
+        wordle = Wordle()
+        for bot in (ExampleBot(), BayesianBot()):
+            for secret in wordle.word_list[::2000]:
+                wordle.start_game()
+                wordle.secret_word = secret
+                while wordle.game_in_progress:
+                    bot.accept_result(wordle.guess(bot.generate_guess()))
+                guess_ids: list[int] = []
+                turns, results = simulate(bot, wordle.lexicon.ids[secret], guess_ids)
+                assert turns == len(results) == wordle.turns_taken
+                assert results == wordle.results
+                assert [wordle.lexicon.words[i] for i in guess_ids] == wordle.guesses
+
+    def test_simulate_invalid_guess(self):
+        """Test that a simulated game rejects invalid guesses without taking a turn."""
+        bot = ExampleBot()
+        bot.generate_first_guess = lambda: "ZZZZZ"
+        turns, results = simulate(bot, bot.lexicon.ids[bot.filter.all_unique_words[1]])
+        assert turns == 1
+        assert results == [[2, 2, 2, 2, 2]]
+
+    def test_simulate_always_invalid(self):
+        """Test that a bot that only makes invalid guesses fails the game rather than stalling it."""
+        bot = ExampleBot()
+        bot.generate_guess = lambda deadline=None: "ZZZZZ"
+        with pytest.raises(ValueError, match="invalid guesses"):
+            simulate(bot, 0)
+
+    def test_simulate_batch_always_invalid(self):
+        """Test that a batch of games with a bot that only makes invalid guesses fails rather than stalling."""
+        bot = ExampleBot()
+        bot.generate_guess = lambda deadline=None: "ZZZZZ"
+        with pytest.raises(ValueError, match="invalid guesses"):
+            simulate_batch(bot, np.arange(3))
+
+    def test_simulate_batch_check(self, capsys):
+        """Test that games played in lockstep warn about eliminated secrets like games played one at a time."""
+
+        class ForgetfulBot(ExampleBot):
+            """A bot that eliminates every word but one that is never the secret after each result."""
+
+            def accept_result(self, result):
+                super().accept_result(result)
+                self.possible_words = [self.lexicon.words[1]]
+
+        secret_ids = np.arange(0, 14855, 1000)
+        simulate_batch(ForgetfulBot(), secret_ids, check=True)
+        batch = capsys.readouterr().out.splitlines()
+        for secret_id in secret_ids.tolist():
+            simulate(ForgetfulBot(), secret_id, check=True)
+        serial = capsys.readouterr().out.splitlines()
+        assert batch and sorted(batch) == sorted(serial)
+
+    def test_simulate_batch(self):
+        """Test that games played in lockstep give the same results as games played one at a time."""
+        secret_ids = np.arange(0, 14855, 500)
+        for bot in (ExampleBot(), BayesianBot()):
+            guess_ids: list[list[int]] = []
+            turns, results = simulate_batch(bot, secret_ids, guess_ids)
+            for i, secret_id in enumerate(secret_ids.tolist()):
+                played: list[int] = []
+                assert simulate(bot, secret_id, played) == (turns[i], results[i])
+                assert played == guess_ids[i]
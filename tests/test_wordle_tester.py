@@ -5,8 +5,12 @@ This module contains tests for the WordleTester class, specifically for the meth
 producing result strings and for running tests with a Wordle bot.
 """
 
-from tester.wordle_tester import WordleTester  # type: ignore
+import pytest
+from tester import wordle_tester  # type: ignore
+from tester.wordle_tester import WordleTester, init_worker  # type: ignore
 from bots.example_bot import ExampleBot  # type: ignore
+from bots.bayesian_bot import BayesianBot  # type: ignore
+from bots.util import GUESSES, Filter  # type: ignore
 
 # file: tests/test_wordle_tester.py
 
@@ -51,3 +55,90 @@ class TestWordleTester:
             "\033[om" not in wacky_failures_str
         ), "Expected no ANSI escape codes in wacky failures string"
         assert "," in wacky_failures_str, "Expected lists in wacky failures string"
+
+    def test_parallel(self):
+        """Test that a parallel test run gives the same results as a serial run."""
+        serial = WordleTester()
+        serial.word_list = serial.word_list[:300]
+        serial.test(ExampleBot(), print_results=False)
+        parallel = WordleTester()
+        parallel.word_list = parallel.word_list[:300]
+        parallel.test(ExampleBot(), print_results=False, workers=2)
+        assert parallel.successes == serial.successes
+        assert parallel.failures == serial.failures
+        assert parallel.test_results == serial.test_results
+        assert parallel.get_results_str() == serial.get_results_str()
+
+    def test_parallel_configured_bot(self):
+        """Test that the workers of a parallel run play a bot configured like the one under test."""
+        bot = BayesianBot()
+        bot.GREEDY_MAX_TURNS = 0
+        bot.exact_filtering = True
+        bot.filter = Filter(exact=True)
+        init_worker(BayesianBot, bot.get_config(), bot.filter.exact)
+        worker_bot = wordle_tester.worker_bot
+        assert worker_bot.get_config() == bot.get_config()
+        assert worker_bot.filter.exact
+        serial = WordleTester()
+        serial.word_list = serial.word_list[:100]
+        serial.test(bot, print_results=False)
+        parallel = WordleTester()
+        parallel.word_list = parallel.word_list[:100]
+        parallel.test(bot, print_results=False, workers=2)
+        assert parallel.test_results == serial.test_results
+
+    def test_benchmark(self):
+        """Test that the benchmark times every turn of the sampled games."""
+        tester = WordleTester()
+        stats = tester.benchmark(ExampleBot(), samples=10, print_results=False)
+        assert stats["turns"] == 60
+        assert 0 <= stats["p50"] <= stats["p95"] <= stats["max"]
+        assert stats["mean"] <= stats["max"]
+
+    def test_play_tree(self):
+        """Test that playing the games as a tree gives the same results as playing each game."""
+        for bot_class in (ExampleBot, BayesianBot):
+            serial = WordleTester()
+            serial.word_list = serial.word_list[::50]
+            serial.test(bot_class(), print_results=False)
+            tree = WordleTester()
+            tree.word_list = tree.word_list[::50]
+            tree.test(bot_class(), print_results=False, share_prefixes=True)
+            assert tree.successes == serial.successes
+            assert tree.failures == serial.failures
+            assert tree.test_results == serial.test_results
+
+    def test_invalid_guesses(self):
+        """Test that every way of playing the games rejects invalid guesses alike, and fails on a bot that only makes them."""
+
+        class SloppyBot(ExampleBot):
+            """A bot that makes an invalid guess before each of its second guesses."""
+
+            def generate_next_guess(self):
+                if len(self.guesses[GUESSES]) == 1:
+                    return "ZZZZZ"
+                return super().generate_next_guess()
+
+        serial = WordleTester()
+        serial.word_list = serial.word_list[::500]
+        serial.test(SloppyBot(), print_results=False)
+        for options in ({}, {"share_prefixes": True}, {"batch_size": 64}):
+            tester = WordleTester()
+            tester.word_list = tester.word_list[::500]
+            tester.test(SloppyBot(), print_results=False, **options)
+            assert tester.test_results == serial.test_results
+            broken = ExampleBot()
+            broken.generate_guess = lambda deadline=None: "ZZZZZ"
+            with pytest.raises(ValueError, match="invalid guesses"):
+                tester.test(broken, print_results=False, **options)
+
+    def test_play_batches(self):
+        """Test that playing the games in lockstep batches gives the same results as playing each game."""
+        for bot_class in (ExampleBot, BayesianBot):
+            serial = WordleTester()
+            serial.word_list = serial.word_list[::50]
+            serial.test(bot_class(), print_results=False)
+            batched = WordleTester()
+            batched.word_list = batched.word_list[::50]
+            batched.test(bot_class(), print_results=False, batch_size=64)
+            assert batched.test_results == serial.test_results